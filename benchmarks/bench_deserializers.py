@@ -0,0 +1,117 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare `from_dict` with the generated deserializers.
+
+Usage: python benchmarks/bench_deserializers.py [repeat]
+"""
+
+import sys
+import timeit
+
+from ibm_cloud_databases import cloud_databases_v5
+from ibm_cloud_databases.deserializers import get_deserializer
+
+
+def backups_json(count: int = 500) -> dict:
+    """A list_deployment_backups result."""
+    return {'backups': [{
+        'id': 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/1234:5678:backup:{0}'.format(i),
+        'deployment_id': 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/1234:5678::',
+        'type': 'scheduled',
+        'status': 'completed',
+        'is_downloadable': True,
+        'is_restorable': True,
+        'created_at': '2021-06-01T00:00:00Z',
+    } for i in range(count)]}
+
+
+def tasks_json(count: int = 500) -> dict:
+    """A list_deployment_tasks result."""
+    return {'tasks': [{
+        'id': 'crn:v1:bluemix:public:databases-for-redis:us-south:a/1234:5678:task:{0}'.format(i),
+        'description': 'Creating backup for deployment.',
+        'status': 'completed',
+        'deployment_id': 'crn:v1:bluemix:public:databases-for-redis:us-south:a/1234:5678::',
+        'progress_percent': 100,
+        'created_at': '2021-06-01T00:00:00Z',
+    } for i in range(count)]}
+
+
+def groups_json() -> dict:
+    """A list_deployment_scaling_groups result."""
+    def resource(units, suffix):
+        return {'units': units, 'allocation_' + suffix: 2, 'minimum_' + suffix: 2, 'maximum_' + suffix: 20,
+                'step_size_' + suffix: 1, 'is_adjustable': True, 'is_optional': False, 'can_scale_down': True}
+    return {'groups': [{
+        'id': group_id,
+        'count': 2,
+        'members': resource('count', 'count'),
+        'memory': resource('mb', 'mb'),
+        'cpu': resource('count', 'count'),
+        'disk': resource('mb', 'mb'),
+    } for group_id in ('member', 'analytics', 'bi_connector')]}
+
+
+def postgres_connection_json() -> dict:
+    """The `connection` of a get_connection result for PostgreSQL."""
+    def uri(scheme):
+        return {
+            'type': 'uri',
+            'composed': ['{0}://admin:$PASSWORD@host:31000/ibmclouddb?sslmode=verify-full'.format(scheme)],
+            'scheme': scheme,
+            'hosts': [{'hostname': 'host{0}'.format(i), 'port': 31000} for i in range(3)],
+            'path': '/ibmclouddb',
+            'query_options': {'sslmode': 'verify-full'},
+            'authentication': {'method': 'direct', 'username': 'admin', 'password': None},
+            'certificate': {'name': 'cert', 'certificate_base64': 'Y2VydA==' * 200},
+            'database': 'ibmclouddb',
+        }
+    return {
+        'postgres': uri('postgres'),
+        'cli': {'type': 'cli', 'composed': ['psql'], 'environment': {'PGPASSWORD': '$PASSWORD'}, 'bin': 'psql',
+                'arguments': [['host=host port=31000 dbname=ibmclouddb user=admin sslmode=verify-full']],
+                'certificate': {'name': 'cert', 'certificate_base64': 'Y2VydA==' * 200}},
+    }
+
+
+CASES = [
+    ('Backups (500)', cloud_databases_v5.Backups, backups_json()),
+    ('Tasks (500)', cloud_databases_v5.Tasks, tasks_json()),
+    ('Groups', cloud_databases_v5.Groups, groups_json()),
+    ('Connection', cloud_databases_v5.Connection, {'connection': postgres_connection_json()}),
+    ('PostgreSQLConnection', cloud_databases_v5.ConnectionConnectionPostgreSQLConnection,
+     postgres_connection_json()),
+]
+
+
+def main(repeat: int = 200) -> None:
+    """
+    Print the time per call of `from_dict` and of the generated deserializer.
+    """
+    print('{0:<22} {1:>15} {2:>15} {3:>8}'.format('payload', 'from_dict (us)', 'generated (us)', 'speedup'))
+    for name, model, payload in CASES:
+        deserializer = get_deserializer(model)
+        assert deserializer(payload) == model.from_dict(payload)
+        regular = min(timeit.repeat(lambda: model.from_dict(payload), number=repeat, repeat=5)) / repeat
+        generated = min(timeit.repeat(lambda: deserializer(payload), number=repeat, repeat=5)) / repeat
+        print('{0:<22} {1:>15.1f} {2:>15.1f} {3:>7.1f}x'.format(name, regular * 1e6, generated * 1e6,
+                                                                 regular / generated))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
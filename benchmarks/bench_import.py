@@ -0,0 +1,72 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measure the time a new Python process takes to import the SDK, as paid by every
+cold start of a CLI job or a serverless function.
+
+Each statement runs in a fresh interpreter, after a first run that writes the
+bytecode, and the median of the runs is reported.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+# Statements timed, by label, in the order a client gets to them.
+STATEMENTS = {
+    'package': 'import ibm_cloud_databases',
+    'client': 'from ibm_cloud_databases import CloudDatabasesV5',
+    'models': 'from ibm_cloud_databases.cloud_databases_v5 import Allowlist',
+    'async_client': 'from ibm_cloud_databases import AsyncCloudDatabasesV5',
+}
+
+_TIMER = 'import time; start = time.perf_counter(); {0}; print(time.perf_counter() - start)'
+
+
+def measure_import(statement: str, runs: int) -> float:
+    """
+    Return the median number of milliseconds a fresh interpreter takes to run an
+    import statement.
+    """
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+    command = [sys.executable, '-c', _TIMER.format(statement)]
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    samples = [float(subprocess.run(command, env=env, check=True, stdout=subprocess.PIPE).stdout)
+               for _ in range(runs)]
+    return statistics.median(samples) * 1e3
+
+
+def main(runs: int = 20) -> None:
+    """
+    Print the import time of each statement.
+    """
+    for label, statement in STATEMENTS.items():
+        try:
+            elapsed = measure_import(statement, runs)
+        except subprocess.CalledProcessError:
+            print('{0:<14} skipped, {1!r} failed'.format(label, statement))
+            continue
+        print('{0:<14} {1:>8.1f} ms  {2}'.format(label, elapsed, statement))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
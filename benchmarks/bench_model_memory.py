@@ -0,0 +1,91 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare the memory used by regular and compact (slotted) models.
+
+Usage: python benchmarks/bench_model_memory.py [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from ibm_cloud_databases import cloud_databases_v5, compact_models
+
+PAYLOADS = {
+    'Backup': {
+        'id': 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/274074dce64e9c423ffc238516c755e1:29caf0e7-120f-4da8-9551-3abf57ebcfc7:backup:06392e97-df90-46d8-98e8-cb67e9e0a8e6',
+        'deployment_id': 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/274074dce64e9c423ffc238516c755e1:29caf0e7-120f-4da8-9551-3abf57ebcfc7::',
+        'type': 'scheduled',
+        'status': 'completed',
+        'is_downloadable': True,
+        'is_restorable': True,
+        'created_at': '2021-06-01T00:00:00Z',
+    },
+    'Task': {
+        'id': 'crn:v1:bluemix:public:databases-for-redis:us-south:a/274074dce64e9c423ffc238516c755e1:b8d08c69-e71c-4d19-be18-f75a64a9d8d5:task:0ac21a41-8125-4a0b-b4c1-5bf8a0a60a8b',
+        'description': 'Creating backup for deployment.',
+        'status': 'completed',
+        'deployment_id': 'crn:v1:bluemix:public:databases-for-redis:us-south:a/274074dce64e9c423ffc238516c755e1:b8d08c69-e71c-4d19-be18-f75a64a9d8d5::',
+        'progress_percent': 100,
+        'created_at': '2021-06-01T00:00:00Z',
+    },
+    'AllowlistEntry': {
+        'address': '195.212.0.0/16',
+        'description': 'Dev IP space 1',
+    },
+    'Group': {
+        'id': 'member',
+        'count': 2,
+        'memory': {'units': 'mb', 'allocation_mb': 12288, 'minimum_mb': 2048, 'maximum_mb': 114688,
+                   'step_size_mb': 256, 'is_adjustable': True, 'can_scale_down': True},
+        'cpu': {'units': 'count', 'allocation_count': 2, 'minimum_count': 2, 'maximum_count': 32,
+                'step_size_count': 2, 'is_adjustable': False, 'can_scale_down': True},
+        'disk': {'units': 'mb', 'allocation_mb': 10240, 'minimum_mb': 2048, 'maximum_mb': 4194304,
+                 'step_size_mb': 2048, 'is_adjustable': True, 'can_scale_down': False},
+    },
+}
+
+
+def measure(model: type, payload: dict, count: int) -> float:
+    """
+    Return the number of bytes allocated per object when building `count` objects.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [model.from_dict(payload) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return allocated / count
+
+
+def main(count: int = 20000) -> None:
+    """
+    Print the memory used per object by the regular and compact models.
+    """
+    print('{0:<16} {1:>12} {2:>12} {3:>8}'.format('model', 'regular (B)', 'compact (B)', 'saved'))
+    for name, payload in PAYLOADS.items():
+        regular = measure(getattr(cloud_databases_v5, name), payload, count)
+        compact = measure(getattr(compact_models, name), payload, count)
+        print('{0:<16} {1:>12.0f} {2:>12.0f} {3:>7.0%}'.format(name, regular, compact, 1 - compact / regular))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,225 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An in-process HTTP stand-in for the Cloud Databases API, used by the benchmarks.
+
+Every route called by CloudDatabasesV5 is answered with a realistic payload. Unlike
+`ibm_cloud_databases.fakeserver`, the server is stateless so that repeated calls
+measure the same work: write operations answer with a task, and reads always return
+the same documents, whose sizes are configurable.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import json
+import re
+import threading
+import time
+
+from ibm_cloud_databases.fakeserver.state import (REGIONS, autoscaling_json, connection_json, deployables_json,
+                                                 groups_json)
+
+CRN = 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/274074dce64e9c423ffc238516c755e1:{0}::'
+
+
+def task_json(index: int = 0, deployment: str = 'deployment') -> dict:
+    """A task."""
+    return {
+        'id': CRN.format(deployment).rstrip(':') + ':task:{0:08x}-4b5c-4d6e-8f90-a1b2c3d4e5f6'.format(index),
+        'description': 'Creating backup for deployment.',
+        'status': 'running' if index == 0 else 'completed',
+        'deployment_id': CRN.format(deployment),
+        'progress_percent': 40 if index == 0 else 100,
+        'created_at': '2021-06-{0:02d}T{1:02d}:15:00.000Z'.format(1 + index % 28, index % 24),
+    }
+
+
+def backup_json(index: int = 0, deployment: str = 'deployment') -> dict:
+    """A backup."""
+    return {
+        'id': CRN.format(deployment).rstrip(':') + ':backup:{0:08x}-1f2e-4d3c-8b4a-596877665544'.format(index),
+        'deployment_id': CRN.format(deployment),
+        'type': 'scheduled' if index % 7 else 'on_demand',
+        'status': 'completed',
+        'is_downloadable': True,
+        'is_restorable': True,
+        'created_at': '2021-05-{0:02d}T03:00:00.000Z'.format(1 + index % 28),
+    }
+
+
+def allowlist_json(count: int) -> dict:
+    """An allowlist."""
+    return {'ip_addresses': [{'address': '10.{0}.{1}.0/24'.format(i // 256, i % 256),
+                              'description': 'Application subnet {0}'.format(i)} for i in range(count)]}
+
+
+class FakeCloudDatabasesAPI():
+    """
+    Serves the Cloud Databases API routes on a local port, from a background thread.
+
+    Example::
+
+        with FakeCloudDatabasesAPI() as api:
+            service.set_service_url(api.url)
+    """
+
+    def __init__(self,
+                 *,
+                 backups: int = 100,
+                 tasks: int = 20,
+                 allowlist_entries: int = 200,
+                 latency: float = 0.0) -> None:
+        """
+        :param int backups: Number of backups listed for a deployment.
+        :param int tasks: Number of tasks listed for a deployment.
+        :param int allowlist_entries: Number of entries in an allowlist.
+        :param float latency: Seconds added to every response.
+        """
+        self.latency = latency
+        self.requests = 0
+        task = {'task': task_json()}
+        self._allowlist = json.dumps(allowlist_json(allowlist_entries)).encode('utf-8')
+        self._allowlist_etag = '"{0}"'.format(hashlib.sha1(self._allowlist).hexdigest())
+        documents = [
+            ('GET', '/deployables', deployables_json()),
+            ('GET', '/regions', {'regions': REGIONS}),
+            ('GET', '/deployments/{id}', None),
+            ('POST', '/deployments/{id}/users/{user_type}', task),
+            ('PATCH', '/deployments/{id}/users/{user_type}/{username}', task),
+            ('DELETE', '/deployments/{id}/users/{user_type}/{username}', task),
+            ('PATCH', '/deployments/{id}/configuration', task),
+            ('GET', '/deployments/{id}/remotes', {'remotes': {'leader': '', 'replicas': []}}),
+            ('POST', '/deployments/{id}/remotes/resync', task),
+            ('POST', '/deployments/{id}/remotes/promotion', task),
+            ('GET', '/deployments/{id}/tasks', {'tasks': [task_json(i) for i in range(tasks)]}),
+            ('GET', '/tasks/{id}', {'task': task_json(1)}),
+            ('GET', '/backups/{backup_id}', {'backup': backup_json()}),
+            ('GET', '/deployments/{id}/backups', {'backups': [backup_json(i) for i in range(backups)]}),
+            ('POST', '/deployments/{id}/backups', task),
+            ('GET', '/deployments/{id}/point_in_time_recovery_data',
+             {'earliest_point_in_time_recovery_time': '2021-05-01T03:00:00Z'}),
+            ('GET', '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}',
+             connection_json('deployment.databases.appdomain.cloud', 'admin')),
+            ('POST', '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}',
+             connection_json('deployment.databases.appdomain.cloud', 'admin')),
+            ('GET', '/deployments/{id}/groups', groups_json()),
+            ('GET', '/deployables/{type}/groups', groups_json()),
+            ('PATCH', '/deployments/{id}/groups/{group_id}', task),
+            ('GET', '/deployments/{id}/groups/{group_id}/autoscaling', autoscaling_json()),
+            ('PATCH', '/deployments/{id}/groups/{group_id}/autoscaling', task),
+            ('DELETE', '/deployments/{id}/management/database_connections', task),
+            ('GET', '/deployments/{id}/whitelists/ip_addresses', None),
+            ('PUT', '/deployments/{id}/whitelists/ip_addresses', task),
+            ('POST', '/deployments/{id}/whitelists/ip_addresses', task),
+            ('DELETE', '/deployments/{id}/whitelists/ip_addresses/{ipaddress}', task),
+        ]
+        self.routes = [(method, re.compile('^' + re.sub(r'\{\w+\}', '([^/]+)', template) + '$'), template,
+                        None if document is None else json.dumps(document).encode('utf-8'))
+                       for method, template, document in documents]
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The URL to pass to `set_service_url`."""
+        host, port = self._server.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def __enter__(self) -> 'FakeCloudDatabasesAPI':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> str:
+        """
+        Start serving on a free local port.
+
+        :return: The URL of the server.
+        """
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Answers every request from the route table."""
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args): # pylint: disable=redefined-builtin
+                pass
+
+            def handle_one_request(self):
+                try:
+                    super().handle_one_request()
+                except ConnectionError:
+                    self.close_connection = True
+
+            def do_request(self):
+                api.requests += 1
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                if api.latency:
+                    time.sleep(api.latency)
+                status, headers, body = api.respond(self.command, self.path.split('?', 1)[0], self.headers)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_request
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-cloud-databases-api',
+                                        daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        """
+        Stop serving.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def respond(self, method: str, path: str, headers) -> tuple:
+        """
+        Return the status, headers and body answering a request.
+        """
+        for route_method, pattern, template, body in self.routes:
+            match = pattern.match(path)
+            if route_method != method or match is None:
+                continue
+            if template == '/deployments/{id}':
+                body = json.dumps({'deployment': {
+                    'id': match.group(1), 'name': match.group(1), 'type': 'postgresql', 'version': '12',
+                    'platform_options': {'disk_encryption_key_crn': None}, 'admin_usernames': {'database': 'admin'},
+                    'enable_public_endpoints': True, 'enable_private_endpoints': False}}).encode('utf-8')
+            elif template == '/deployments/{id}/whitelists/ip_addresses':
+                if headers.get('If-None-Match') == self._allowlist_etag:
+                    return 304, {'ETag': self._allowlist_etag}, b''
+                return 200, {'Content-Type': 'application/json', 'ETag': self._allowlist_etag}, self._allowlist
+            status = 202 if method != 'GET' and b'"task"' in body[:10] else 200
+            return status, {'Content-Type': 'application/json'}, body
+        body = json.dumps({'errors': [{'code': 'not_found', 'message': 'No route for {0} {1}'.format(method, path)}],
+                           'trace': 'fake'}).encode('utf-8')
+        return 404, {'Content-Type': 'application/json'}, body
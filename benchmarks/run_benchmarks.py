@@ -0,0 +1,332 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Run the SDK benchmarks against a local fake Cloud Databases API.
+
+Measures the latency of every operation, the throughput of concurrent calls, the
+time taken to parse responses into models, the memory those models use and the time
+taken to import the SDK. Results can be saved as a baseline, and later runs compared
+against it.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py --save-baseline baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json --tolerance 0.2
+
+The second command exits with status 1 when a metric is worse than the baseline by
+more than the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+from ibm_cloud_sdk_core.version import __version__ as core_version
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+from ibm_cloud_databases import cloud_databases_v5 as v5
+from ibm_cloud_databases.deserializers import get_deserializer
+from ibm_cloud_databases.fleet import FleetExecutor
+from ibm_cloud_databases.version import __version__
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# pylint: disable=wrong-import-position
+from bench_import import STATEMENTS, measure_import
+from bench_model_memory import PAYLOADS, measure
+from fake_api import FakeCloudDatabasesAPI
+
+DEPLOYMENT = 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/274074dce64e9c423ffc238516c755e1:29caf0e7-120f-4da8-9551-3abf57ebcfc7::'
+
+# Arguments of every operation, for the latency benchmark.
+OPERATIONS = {
+    'list_deployables': {},
+    'list_regions': {},
+    'get_deployment_info': {'id': DEPLOYMENT},
+    'create_database_user': {'id': DEPLOYMENT, 'user_type': 'database',
+                             'user': v5.CreateDatabaseUserRequestUser(username='reporting', password='s3cr3t-pa55')},
+    'change_user_password': {'id': DEPLOYMENT, 'user_type': 'database', 'username': 'reporting',
+                             'user': v5.APasswordSettingUser(password='n3w-s3cr3t-pa55')},
+    'delete_database_user': {'id': DEPLOYMENT, 'user_type': 'database', 'username': 'reporting'},
+    'update_database_configuration': {
+        'id': DEPLOYMENT,
+        'configuration': v5.SetConfigurationConfigurationPGConfiguration(max_connections=200)},
+    'list_remotes': {'id': DEPLOYMENT},
+    'resync_replica': {'id': DEPLOYMENT},
+    'set_promotion': {'id': DEPLOYMENT,
+                      'promotion': v5.SetPromotionPromotionPromote(promotion={'skip_initial_backup': True})},
+    'list_deployment_tasks': {'id': DEPLOYMENT},
+    'get_task': {'id': DEPLOYMENT + 'task:5a9b1c2d-4b5c-4d6e-8f90-a1b2c3d4e5f6'},
+    'get_backup_info': {'backup_id': DEPLOYMENT + 'backup:5a9b1c2d-1f2e-4d3c-8b4a-596877665544'},
+    'list_deployment_backups': {'id': DEPLOYMENT},
+    'start_ondemand_backup': {'id': DEPLOYMENT},
+    'get_pit_rdata': {'id': DEPLOYMENT},
+    'get_connection': {'id': DEPLOYMENT, 'user_type': 'database', 'user_id': 'admin', 'endpoint_type': 'public'},
+    'complete_connection': {'id': DEPLOYMENT, 'user_type': 'database', 'user_id': 'admin',
+                            'endpoint_type': 'public', 'password': 's3cr3t-pa55'},
+    'list_deployment_scaling_groups': {'id': DEPLOYMENT},
+    'get_default_scaling_groups': {'type': 'postgresql'},
+    'set_deployment_scaling_group': {
+        'id': DEPLOYMENT, 'group_id': 'member',
+        'set_deployment_scaling_group_request': v5.SetDeploymentScalingGroupRequestSetMembersGroup(
+            members=v5.SetMembersGroupMembers(allocation_count=4))},
+    'get_autoscaling_conditions': {'id': DEPLOYMENT, 'group_id': 'member'},
+    'set_autoscaling_conditions': {
+        'id': DEPLOYMENT, 'group_id': 'member',
+        'autoscaling': v5.AutoscalingSetGroupAutoscalingAutoscalingDiskGroup(disk=v5.AutoscalingDiskGroupDisk(
+            rate=v5.AutoscalingDiskGroupDiskRate(increase_percent=20, period_seconds=900,
+                                                 limit_mb_per_member=3670016, units='mb')))},
+    'kill_connections': {'id': DEPLOYMENT},
+    'get_allowlist': {'id': DEPLOYMENT},
+    'set_allowlist': {'id': DEPLOYMENT,
+                      'ip_addresses': [v5.AllowlistEntry(address='10.0.{0}.0/24'.format(i),
+                                                         description='Application subnet {0}'.format(i))
+                                       for i in range(50)],
+                      'if_match': '"1"'},
+    'add_allowlist_entry': {'id': DEPLOYMENT,
+                            'ip_address': v5.AllowlistEntry(address='192.0.2.0/24', description='Bastion')},
+    'delete_allowlist_entry': {'id': DEPLOYMENT, 'ipaddress': '192.0.2.0/24'},
+}
+
+# Models parsed by the parse time benchmark, with the operation returning them and
+# the property of the result holding their JSON, if any.
+PARSED = [
+    ('Backups', 'list_deployment_backups', None),
+    ('Tasks', 'list_deployment_tasks', None),
+    ('Groups', 'list_deployment_scaling_groups', None),
+    ('ConnectionConnectionPostgreSQLConnection', 'get_connection', 'connection'),
+    ('ListDeployablesResponse', 'list_deployables', None),
+    ('Allowlist', 'get_allowlist', None),
+]
+
+LOWER = 'lower'
+HIGHER = 'higher'
+
+
+class Results():
+    """
+    Collects named measurements.
+
+    :attr dict metrics: Measurements by name, each with its `value`, `unit` and which
+          direction is `better`.
+    """
+
+    def __init__(self) -> None:
+        self.metrics = {}
+
+    def add(self, name: str, value: float, unit: str, better: str = LOWER) -> None:
+        """Record a measurement and print it."""
+        self.metrics[name] = {'value': value, 'unit': unit, 'better': better}
+        print('  {0:<64} {1:>12.1f} {2}'.format(name, value, unit))
+
+    def to_dict(self) -> dict:
+        """Return the results and the environment they were measured in."""
+        return {
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'sdk': __version__,
+                'core': core_version,
+            },
+            'metrics': self.metrics,
+        }
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def bench_latency(service: v5.CloudDatabasesV5, results: Results, iterations: int) -> None:
+    """
+    Time sequential calls of every operation.
+    """
+    print('latency ({0} calls per operation)'.format(iterations))
+    for operation, kwargs in OPERATIONS.items():
+        method = getattr(service, operation)
+        for _ in range(max(1, iterations // 10)):
+            method(**kwargs)
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            method(**kwargs)
+            samples.append(time.perf_counter() - start)
+        results.add('latency.{0}.p50'.format(operation), statistics.median(samples) * 1e6, 'us')
+        results.add('latency.{0}.p95'.format(operation), percentile(samples, 0.95) * 1e6, 'us')
+
+
+def bench_throughput(service: v5.CloudDatabasesV5, results: Results, calls: int, concurrency: list) -> None:
+    """
+    Measure the calls per second reached by concurrent workers, with threads and, when
+    httpx is installed, with asyncio.
+    """
+    print('throughput ({0} calls of get_deployment_info)'.format(calls))
+    ids = [DEPLOYMENT] * calls
+    for workers in concurrency:
+        with FleetExecutor(service, max_workers=workers) as fleet:
+            list(fleet.run('get_deployment_info', ids[:workers]))
+            start = time.perf_counter()
+            failures = [response for _, response in fleet.run('get_deployment_info', ids)
+                        if isinstance(response, Exception)]
+            elapsed = time.perf_counter() - start
+        if failures:
+            raise failures[0]
+        results.add('throughput.threads.{0}'.format(workers), calls / elapsed, 'calls/s', HIGHER)
+
+    try:
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        import httpx # pylint: disable=unused-import
+    except ImportError:
+        print('  async: skipped, httpx is not installed')
+        return
+
+    async def run(workers: int) -> float:
+        async with AsyncCloudDatabasesV5(authenticator=NoAuthAuthenticator()) as client:
+            client.set_service_url(service.service_url)
+            semaphore = asyncio.Semaphore(workers)
+
+            async def call():
+                async with semaphore:
+                    await client.get_deployment_info(DEPLOYMENT)
+
+            await asyncio.gather(*[call() for _ in range(workers)])
+            start = time.perf_counter()
+            await asyncio.gather(*[call() for _ in range(calls)])
+            return time.perf_counter() - start
+
+    for workers in concurrency:
+        results.add('throughput.async.{0}'.format(workers), calls / asyncio.run(run(workers)), 'calls/s', HIGHER)
+
+
+def bench_parse(service: v5.CloudDatabasesV5, results: Results, repeat: int) -> None:
+    """
+    Time the conversion of responses of the fake API into models.
+    """
+    print('parse time ({0} repetitions)'.format(repeat))
+    for name, operation, key in PARSED:
+        model = getattr(v5, name)
+        payload = getattr(service, operation)(**OPERATIONS[operation]).get_result()
+        if key is not None:
+            payload = payload[key]
+        deserializer = get_deserializer(model)
+        for label, function in [('from_dict', model.from_dict), ('generated', deserializer)]:
+            # pylint: disable=cell-var-from-loop
+            elapsed = min(timeit.repeat(lambda: function(payload), number=repeat, repeat=3)) / repeat
+            results.add('parse.{0}.{1}'.format(name, label), elapsed * 1e6, 'us')
+
+
+def bench_memory(results: Results, count: int) -> None:
+    """
+    Measure the memory allocated per model object.
+    """
+    print('memory ({0} objects per model)'.format(count))
+    for name, payload in PAYLOADS.items():
+        results.add('memory.{0}'.format(name), measure(getattr(v5, name), payload, count), 'B')
+
+
+def bench_import(results: Results, runs: int) -> None:
+    """
+    Time the imports of the SDK in fresh interpreters.
+    """
+    print('import time ({0} processes per statement)'.format(runs))
+    for label, statement in STATEMENTS.items():
+        try:
+            elapsed = measure_import(statement, runs)
+        except subprocess.CalledProcessError:
+            print('  import.{0}: skipped, {1!r} failed'.format(label, statement))
+            continue
+        results.add('import.{0}'.format(label), elapsed, 'ms')
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Return a description of each metric worse than the baseline by more than the
+    tolerance, as a fraction of the baseline value.
+    """
+    regressions = []
+    for name, metric in sorted(current['metrics'].items()):
+        reference = baseline['metrics'].get(name)
+        if reference is None or not reference['value']:
+            continue
+        change = (metric['value'] - reference['value']) / reference['value']
+        if metric['better'] == HIGHER:
+            change = -change
+        if change > tolerance:
+            regressions.append('{0}: {1:.1f} {2} vs {3:.1f} {2} in the baseline ({4:+.0%})'.format(
+                name, metric['value'], metric['unit'], reference['value'], change))
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    """
+    Run the benchmarks and return the exit status.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='fewer iterations, for a smoke test')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--save-baseline', metavar='FILE', help='write the results as the baseline')
+    parser.add_argument('--compare', metavar='FILE', help='compare the results with this baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative regression before failing (default: 0.25)')
+    parser.add_argument('--only', action='append', choices=['latency', 'throughput', 'parse', 'memory', 'import'],
+                        help='run only these benchmarks')
+    args = parser.parse_args(argv)
+    scale = 10 if args.quick else 1
+    only = args.only or ['latency', 'throughput', 'parse', 'memory', 'import']
+
+    results = Results()
+    with FakeCloudDatabasesAPI() as api:
+        service = v5.CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url(api.url)
+        if 'latency' in only:
+            bench_latency(service, results, 200 // scale)
+        if 'throughput' in only:
+            bench_throughput(service, results, 2000 // scale, [1, 8, 32])
+        if 'parse' in only:
+            bench_parse(service, results, 200 // scale)
+    if 'memory' in only:
+        bench_memory(results, 20000 // scale)
+    if 'import' in only:
+        bench_import(results, 20 // scale + 1)
+
+    report = results.to_dict()
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as file:
+                json.dump(report, file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(report, json.load(file), args.tolerance)
+        if regressions:
+            print('{0} regression(s) beyond {1:.0%}:'.format(len(regressions), args.tolerance))
+            for regression in regressions:
+                print('  ' + regression)
+            return 1
+        print('no regressions beyond {0:.0%}'.format(args.tolerance))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,10 +18,10 @@ Examples for CloudDatabasesV5
 """
 
 import os
-import time
 
 import pytest
 from ibm_cloud_databases.cloud_databases_v5 import *
+from ibm_cloud_databases.tasks import TaskTimeoutError
 from ibm_cloud_sdk_core import ApiException, read_external_sources
 
 #
@@ -68,27 +68,13 @@ def wait_for_task(task_id):
         task_id (string): ID of the task we are waiting for
     """
 
-    for i in range(30):
-        get_task_response = cloud_databases_service.get_task(id=task_id)
-
-        assert get_task_response.get_status_code() == 200
-        get_task_response = get_task_response.get_result()
-        assert get_task_response is not None
-
-        task = get_task_response.get('task', None)
-        if task is None:
-            break
-        else:
-            status = task['status']
-            if status == 'completed' or status == 'failed':
-                assert status == 'completed'
-                break
-            elif status == 'queued' or status == 'running':
-                pass
-            else:
-                print('status is', status)
-
-        time.sleep(2)
+    try:
+        task = cloud_databases_service.wait_for_task(task_id, timeout=60)
+    except TaskTimeoutError:
+        return
+
+    if task is not None:
+        assert task.status == 'completed'
 
 ##############################################################################
 # Start of Examples for Service: CloudDatabasesV5
@@ -17,8 +17,67 @@
   This package provides a client library for accessing the IBM Cloud Databases service
 """
 
-from ibm_cloud_sdk_core import IAMTokenManager, DetailedResponse, BaseService, ApiException
+import importlib
+import sys
 
-from .common import get_sdk_headers
 from .version import __version__
-from .cloud_databases_v5 import CloudDatabasesV5
+
+# Where each name of the package is defined. The modules are only imported when one of
+# their names is first used, so that `import ibm_cloud_databases` stays cheap for
+# short-lived processes that need a few of them, or none.
+_EXPORTS = {
+    'IAMTokenManager': 'ibm_cloud_sdk_core',
+    'DetailedResponse': 'ibm_cloud_sdk_core',
+    'BaseService': 'ibm_cloud_sdk_core',
+    'ApiException': 'ibm_cloud_sdk_core',
+    'TTLCache': '.caching',
+    'get_sdk_headers': '.common',
+    'CloudDatabasesV5': '.cloud_databases_v5',
+    'AsyncCloudDatabasesV5': '.cloud_databases_v5_async',
+    'Deadline': '.deadlines',
+    'DeadlineExceededError': '.deadlines',
+    'TaskPollingPolicy': '.tasks',
+    'TaskTimeoutError': '.tasks',
+    'TaskEvent': '.task_watcher',
+    'TaskWatcher': '.task_watcher',
+    'FleetExecutor': '.fleet',
+    'Metrics': '.metrics',
+    'MetricsRecorder': '.metrics',
+    'render_prometheus': '.metrics',
+    'OpenTelemetryTracer': '.tracing',
+    'Span': '.tracing',
+    'Tracer': '.tracing',
+    'SingleFlight': '.coalescing',
+    'RateLimiter': '.ratelimit',
+    'TokenBucket': '.ratelimit',
+    'AdaptiveConcurrencyLimiter': '.concurrency',
+    'ConnectionPool': '.pooling',
+    'CircuitBreaker': '.retries',
+    'CircuitOpenError': '.retries',
+    'RetryPolicy': '.retries',
+    'HedgingPolicy': '.hedging',
+    'AllowlistIndex': '.allowlist',
+    'AllowlistPlan': '.allowlist',
+    'AllowlistReconciler': '.allowlist',
+}
+
+__all__ = ['__version__'] + list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if sys.version_info < (3, 7):
+    # Modules cannot define __getattr__ before Python 3.7.
+    for _name in _EXPORTS:
+        globals()[_name] = __getattr__(_name)
@@ -0,0 +1,391 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers to manage the allowlists of Cloud Databases deployments.
+"""
+
+from typing import Dict, Iterable, List, Union
+import bisect
+import ipaddress
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+
+from .cloud_databases_v5 import CloudDatabasesV5
+from .cloud_databases_v5_models import Allowlist, AllowlistEntry
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class AllowlistPlan():
+    """
+    The changes that bring the allowlist of a deployment to its desired state.
+
+    :attr str etag: ETag of the allowlist the plan was computed from.
+    :attr List[AllowlistEntry] desired: The desired allowlist, in which entries
+          without a desired description have their current one.
+    :attr List[AllowlistEntry] additions: Entries to add.
+    :attr List[AllowlistEntry] deletions: Current entries to delete.
+    :attr bool replace: True when the plan is applied with a single `set_allowlist`
+          call, False when it is applied with `add_allowlist_entry` and
+          `delete_allowlist_entry` calls.
+    """
+
+    def __init__(self,
+                 etag: str,
+                 desired: List[AllowlistEntry],
+                 additions: List[AllowlistEntry],
+                 deletions: List[AllowlistEntry],
+                 *,
+                 replace: bool = False) -> None:
+        self.etag = etag
+        self.desired = desired
+        self.additions = additions
+        self.deletions = deletions
+        self.replace = replace
+
+    @property
+    def changed(self) -> bool:
+        """True when the allowlist differs from the desired one."""
+        return bool(self.additions or self.deletions)
+
+    def __repr__(self) -> str:
+        return '<AllowlistPlan +{0} -{1}{2}>'.format(len(self.additions), len(self.deletions),
+                                                     ' replace' if self.replace else '')
+
+
+class AllowlistReconciler():
+    """
+    Brings the allowlist of a deployment to a desired state with as few changes as
+    possible.
+
+    The current allowlist and its ETag are fetched and compared with the desired
+    entries. Addresses are compared as networks, so that `10.0.0.1` and
+    `10.0.0.1/32` are the same entry, and an entry whose desired description is None
+    matches whatever description it currently has. Every call that changes an
+    allowlist starts a task on the deployment, hence:
+
+    * nothing is sent when the allowlist is already as desired;
+    * up to `max_incremental_changes` missing or extra addresses are added and
+      deleted one call at a time, additions first, so that no desired address is
+      ever missing;
+    * larger changes, changed descriptions, and addresses listed more than once
+      in the current allowlist are applied with one `set_allowlist` call guarded
+      by the ETag, since deleting an address deletes all its entries. If another client changed the allowlist in the
+      meantime the service answers 412, and the plan is computed again from a fresh
+      copy of the allowlist.
+
+    Example::
+
+        reconciler = AllowlistReconciler(service)
+        reconciler.reconcile(deployment_id, [AllowlistEntry(address='10.0.0.0/8', description='VPC')])
+    """
+
+    def __init__(self,
+                 service: CloudDatabasesV5,
+                 *,
+                 max_incremental_changes: int = 1,
+                 max_attempts: int = 3) -> None:
+        """
+        Construct a reconciler.
+
+        :param CloudDatabasesV5 service: The client used to read and change
+               allowlists.
+        :param int max_incremental_changes: (optional) Largest number of additions
+               and deletions applied one by one rather than with `set_allowlist`.
+        :param int max_attempts: (optional) Number of times a plan is computed and
+               applied before a 412 Precondition Failed error is raised.
+        """
+        if max_incremental_changes < 0:
+            raise ValueError('max_incremental_changes must not be negative')
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        self.service = service
+        self.max_incremental_changes = max_incremental_changes
+        self.max_attempts = max_attempts
+
+    def plan(self,
+             id: str,
+             desired: Iterable[Union[AllowlistEntry, Dict]]) -> AllowlistPlan:
+        """
+        Compute the changes that bring an allowlist to its desired state.
+
+        :param str id: Deployment ID.
+        :param Iterable[AllowlistEntry] desired: The desired allowlist entries, as
+               `AllowlistEntry` objects or dicts.
+        :rtype: AllowlistPlan
+        """
+        desired = [AllowlistEntry.from_dict(entry) if isinstance(entry, dict) else entry
+                   for entry in desired]
+        wanted = {}
+        for entry in desired:
+            if entry.address is None:
+                raise ValueError('allowlist entries must have an address')
+            key = _address_key(entry.address)
+            if key in wanted:
+                raise ValueError('{0} is listed more than once'.format(entry.address))
+            wanted[key] = entry
+
+        response = self.service.get_allowlist(id)
+        etag = response.get_headers().get('ETag')
+        current = [AllowlistEntry.from_dict(entry)
+                   for entry in (response.get_result() or {}).get('ip_addresses') or []]
+
+        additions = []
+        deletions = []
+        updated = False
+        existing = {}
+        seen = set()
+        for entry in current:
+            key = _address_key(entry.address)
+            target = wanted.get(key)
+            if key in seen:
+                # A duplicate can only be removed by replacing the whole list:
+                # delete_allowlist_entry would delete the other entries of the
+                # address too.
+                updated = True
+            seen.add(key)
+            if target is None or key in existing:
+                deletions.append(entry)
+                continue
+            existing[key] = entry
+            if target.description is not None and target.description != entry.description:
+                deletions.append(entry)
+                additions.append(target)
+                updated = True
+        additions.extend(entry for key, entry in wanted.items() if key not in existing)
+
+        replace = updated or len(additions) + len(deletions) > self.max_incremental_changes
+        # set_allowlist sets every description, so entries without a desired one
+        # keep their current description.
+        desired = [AllowlistEntry(address=entry.address, description=existing[key].description)
+                   if entry.description is None and key in existing else entry
+                   for key, entry in wanted.items()]
+        return AllowlistPlan(etag, desired, additions, deletions, replace=replace)
+
+    def apply(self, id: str, plan: AllowlistPlan) -> List[DetailedResponse]:
+        """
+        Apply a plan computed by `plan()`.
+
+        :param str id: Deployment ID.
+        :param AllowlistPlan plan: The changes to apply.
+        :raises ApiException: A call failed; with status code 412 when the allowlist
+                changed since the plan was computed.
+        :return: The responses of the calls that were made, each holding a task.
+        :rtype: List[DetailedResponse]
+        """
+        if not plan.changed:
+            return []
+        if plan.replace:
+            return [self.service.set_allowlist(id, ip_addresses=plan.desired, if_match=plan.etag)]
+        responses = []
+        for entry in plan.additions:
+            responses.append(self.service.add_allowlist_entry(id, ip_address=entry))
+        for entry in plan.deletions:
+            responses.append(self.service.delete_allowlist_entry(id, entry.address))
+        return responses
+
+    def reconcile(self,
+                  id: str,
+                  desired: Iterable[Union[AllowlistEntry, Dict]]) -> List[DetailedResponse]:
+        """
+        Bring an allowlist to its desired state.
+
+        :param str id: Deployment ID.
+        :param Iterable[AllowlistEntry] desired: The desired allowlist entries, as
+               `AllowlistEntry` objects or dicts.
+        :raises ApiException: A call failed, or the allowlist kept changing for
+                `max_attempts` attempts.
+        :return: The responses of the calls that were made, each holding a task;
+                 empty when the allowlist was already as desired.
+        :rtype: List[DetailedResponse]
+        """
+        desired = list(desired)
+        attempt = 1
+        while True:
+            plan = self.plan(id, desired)
+            try:
+                return self.apply(id, plan)
+            except ApiException as err:
+                if err.status_code != 412 or attempt >= self.max_attempts:
+                    raise
+            attempt += 1
+
+
+
+class AllowlistIndex():
+    """
+    An index of the addresses and ranges of an allowlist.
+
+    Entries are collapsed into sorted lists of disjoint ranges, one for IPv4 and
+    one for IPv6, in which overlapping and adjacent ranges are merged. Membership
+    and range queries are binary searches over those lists, and `to_entries()`
+    turns the ranges back into the smallest list of CIDR blocks covering exactly
+    the same addresses.
+
+    Example::
+
+        index = AllowlistIndex.from_allowlist(service.get_allowlist(id).get_result())
+        if '10.1.2.3' not in index:
+            ...
+        service.set_allowlist(id, ip_addresses=index.to_entries())
+    """
+
+    def __init__(self, entries: Iterable[Union[AllowlistEntry, Dict, str]] = ()) -> None:
+        """
+        Construct an index.
+
+        :param Iterable entries: (optional) Allowlist entries, as `AllowlistEntry`
+               objects, dicts, or address strings.
+        """
+        self._starts = {4: [], 6: []}
+        self._ends = {4: [], 6: []}
+        self._sources = {4: [], 6: []}
+        self.update(entries)
+
+    @classmethod
+    def from_allowlist(cls, allowlist: Union[Allowlist, Dict]) -> 'AllowlistIndex':
+        """
+        Construct an index from an `Allowlist`, or the result of `get_allowlist`.
+        """
+        if isinstance(allowlist, dict):
+            allowlist = Allowlist.from_dict(allowlist)
+        return cls(allowlist.ip_addresses or [])
+
+    def __contains__(self, address: Union[str, Network]) -> bool:
+        """
+        Return True when every address of an address or range is allowed.
+        """
+        network = _network(address)
+        first, last = int(network.network_address), int(network.broadcast_address)
+        starts = self._starts[network.version]
+        i = bisect.bisect_right(starts, first) - 1
+        return i >= 0 and self._ends[network.version][i] >= last
+
+    def add(self, entry: Union[AllowlistEntry, Dict, str]) -> None:
+        """
+        Add an allowlist entry, merging it with the ranges it overlaps or touches.
+
+        :param entry: The entry to add, as an `AllowlistEntry`, a dict, or an
+               address string.
+        """
+        if isinstance(entry, dict):
+            entry = AllowlistEntry.from_dict(entry)
+        elif isinstance(entry, str):
+            entry = AllowlistEntry(address=entry)
+        network = _network(entry.address)
+        first, last = int(network.network_address), int(network.broadcast_address)
+        starts, ends = self._starts[network.version], self._ends[network.version]
+
+        lo = bisect.bisect_left(ends, first - 1)
+        hi = bisect.bisect_right(starts, last + 1)
+        if lo < hi:
+            first = min(first, starts[lo])
+            last = max(last, ends[hi - 1])
+        starts[lo:hi] = [first]
+        ends[lo:hi] = [last]
+        bisect.insort(self._sources[network.version],
+                      (int(network.network_address), network.prefixlen, entry.description or ''))
+
+    def update(self, entries: Iterable[Union[AllowlistEntry, Dict, str]]) -> None:
+        """
+        Add several allowlist entries.
+        """
+        for entry in entries:
+            self.add(entry)
+
+    def overlapping(self, address: Union[str, Network]) -> List[Network]:
+        """
+        Return the allowed blocks that share at least one address with an address or
+        range.
+
+        :rtype: List[IPv4Network or IPv6Network]
+        """
+        network = _network(address)
+        first, last = int(network.network_address), int(network.broadcast_address)
+        starts, ends = self._starts[network.version], self._ends[network.version]
+        networks = []
+        for i in range(bisect.bisect_left(ends, first), bisect.bisect_right(starts, last)):
+            networks.extend(_summarize(network.version, starts[i], ends[i]))
+        return [block for block in networks if block.overlaps(network)]
+
+    def networks(self) -> List[Network]:
+        """
+        Return the smallest list of CIDR blocks covering the allowed addresses,
+        IPv4 blocks first, each in ascending order.
+
+        :rtype: List[IPv4Network or IPv6Network]
+        """
+        networks = []
+        for version in (4, 6):
+            for first, last in zip(self._starts[version], self._ends[version]):
+                networks.extend(_summarize(version, first, last))
+        return networks
+
+    def to_entries(self, *, description: str = None) -> List[AllowlistEntry]:
+        """
+        Return the compacted allowlist, ready for `set_allowlist`.
+
+        Blocks that match an original entry keep its description. Blocks that
+        merge several entries get `description` when given, and otherwise the
+        distinct descriptions of the merged entries joined with ', '.
+
+        :param str description: (optional) Description of merged blocks.
+        :rtype: List[AllowlistEntry]
+        """
+        entries = []
+        for network in self.networks():
+            sources = self._sources[network.version]
+            first, last = int(network.network_address), int(network.broadcast_address)
+            merged = sources[bisect.bisect_left(sources, (first,)):bisect.bisect_right(sources, (last + 1,))]
+            if len(merged) == 1 and merged[0][1] == network.prefixlen:
+                text = merged[0][2] or None
+            elif description is not None:
+                text = description
+            else:
+                text = ', '.join(dict.fromkeys(source[2] for source in merged if source[2])) or None
+            address = str(network.network_address) if network.num_addresses == 1 else str(network)
+            entries.append(AllowlistEntry(address=address, description=text))
+        return entries
+
+
+def _network(address: Union[str, Network]) -> Network:
+    """
+    Parse an address or CIDR range, raising ValueError when it is invalid.
+    """
+    if isinstance(address, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return address
+    if address is None:
+        raise ValueError('address must be provided')
+    return ipaddress.ip_network(address, strict=False)
+
+
+def _summarize(version: int, first: int, last: int) -> List[Network]:
+    """
+    The smallest list of CIDR blocks covering a range of integer addresses.
+    """
+    address = ipaddress.IPv4Address if version == 4 else ipaddress.IPv6Address
+    return list(ipaddress.summarize_address_range(address(first), address(last)))
+
+def _address_key(address: str):
+    """
+    The network an allowlist address stands for, or the address itself when it
+    cannot be parsed.
+    """
+    try:
+        return ipaddress.ip_network(address, strict=False)
+    except ValueError:
+        return address
@@ -0,0 +1,136 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client side caches for Cloud Databases responses.
+"""
+
+from typing import Any, Callable, Hashable, Mapping
+import collections
+import copy
+import threading
+import time
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+
+class TTLCache():
+    """
+    A thread-safe cache with least-recently-used eviction and optional expiry.
+
+    :attr int max_size: Maximum number of entries; the least recently used entry is
+          evicted to make room for a new one.
+    :attr float ttl: Number of seconds an entry stays valid, None to keep entries
+          until they are evicted.
+    :attr int hits: Number of lookups answered from the cache.
+    :attr int misses: Number of lookups that found no valid entry.
+    """
+
+    def __init__(self,
+                 *,
+                 max_size: int = 1024,
+                 ttl: float = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Construct a cache.
+
+        :param int max_size: (optional) Maximum number of entries.
+        :param float ttl: (optional) Number of seconds an entry stays valid.
+        :param callable clock: (optional) Returns the current time in seconds.
+        """
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1')
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value cached for a key, or `default` if there is no valid entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry if the cache is full.
+        """
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove the entry for a key and return its value, or `default`.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches a predicate.
+
+        :return: The number of entries removed.
+        :rtype: int
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+def not_modified_response(cached: DetailedResponse, headers: Mapping[str, str]) -> DetailedResponse:
+    """
+    Build the response to a conditional request that the service answered with
+    `304 Not Modified`: a copy of the cached result, with the headers and status
+    code of the new response.
+
+    :param DetailedResponse cached: The cached response that is still current.
+    :param Mapping headers: The headers of the 304 response.
+    :rtype: DetailedResponse
+    """
+    return DetailedResponse(response=copy.deepcopy(cached.get_result()),
+                            headers=headers,
+                            status_code=304)
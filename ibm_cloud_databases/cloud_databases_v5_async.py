@@ -0,0 +1,1203 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An asyncio variant of the Cloud Databases V5 client.
+
+Requests are built exactly as they are by CloudDatabasesV5 and are then sent on a
+non-blocking HTTP transport, so a single event loop can keep many operations in flight
+at once. The transport is provided by the optional `httpx` package, which can be
+installed with `pip install "ibm-cloud-databases[async]"`.
+"""
+
+from typing import Awaitable, Callable, Hashable, List, Optional, Tuple, Union
+import asyncio
+import copy
+import inspect
+import os
+import ssl
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+import certifi
+
+from .caching import TTLCache, not_modified_response
+from .coalescing import request_key
+from .cloud_databases_v5 import DEFAULT_TIMEOUT, CloudDatabasesV5, _models
+from .deadlines import Deadline, DeadlineExceededError
+from .json_codec import JSONCodec
+from .metrics import NO_RESPONSE
+from .tasks import TaskPollingPolicy, TaskWaiter
+
+##############################################################################
+# Service
+##############################################################################
+
+class AsyncCloudDatabasesV5(CloudDatabasesV5):
+    """
+    The Cloud Databases V5 service, with each operation exposed as a coroutine.
+
+    Operations take the same parameters and return the same `DetailedResponse` as
+    their CloudDatabasesV5 counterparts, but must be awaited. The client owns an
+    `httpx.AsyncClient` which should be released with `close()`, or by using the
+    client as an async context manager.
+
+    Note that the authenticator is still invoked synchronously while a request is
+    prepared; token based authenticators only block the event loop when their cached
+    token needs to be refreshed.
+    """
+
+    def __init__(self,
+                 authenticator: Authenticator = None,
+                 *,
+                 async_http_client: 'httpx.AsyncClient' = None,
+                 json_codec: Union[str, JSONCodec] = 'json',
+                ) -> None:
+        """
+        Construct a new asyncio client for the Cloud Databases service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/master/README.md
+               about initializing the authenticator of your choice.
+        :param httpx.AsyncClient async_http_client: (optional) The client used to send
+               requests. When omitted, one is created on first use from the service's
+               SSL verification and http config settings.
+        :param str json_codec: (optional) The JSON codec used for request and
+               response bodies, see CloudDatabasesV5.
+        """
+        CloudDatabasesV5.__init__(self, authenticator, json_codec=json_codec)
+        self.async_http_client = async_http_client
+
+    async def __aenter__(self) -> 'AsyncCloudDatabasesV5':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def get_async_http_client(self) -> 'httpx.AsyncClient':
+        """
+        Get the asynchronous http client used by the service, creating it if needed.
+        """
+        if self.async_http_client is None:
+            try:
+                import httpx # pylint: disable=import-outside-toplevel
+            except ImportError as err:
+                raise ImportError('AsyncCloudDatabasesV5 requires the httpx package; '
+                                  'install it with: pip install "ibm-cloud-databases[async]"') from err
+            verify = _ssl_settings(False if self.disable_ssl_verification else self.http_config.get('verify', True),
+                                   self.http_config.get('cert'))
+            client_args = {
+                'verify': verify,
+                'cookies': self.jar,
+            }
+            proxies = self.http_config.get('proxies')
+            if proxies:
+                # Requests keys its proxies by scheme, e.g. `https`, and httpx by URL
+                # pattern, e.g. `https://`.
+                proxies = {key if '://' in key else key + '://': url for key, url in proxies.items()}
+                if 'proxies' in inspect.signature(httpx.AsyncClient).parameters:
+                    client_args['proxies'] = proxies
+                else:
+                    # httpx 0.28 replaced `proxies` with a transport per pattern.
+                    client_args['mounts'] = {pattern: httpx.AsyncHTTPTransport(proxy=url, verify=verify)
+                                             for pattern, url in proxies.items()}
+            self.async_http_client = httpx.AsyncClient(**client_args)
+        return self.async_http_client
+
+    def set_async_http_client(self, async_http_client: 'httpx.AsyncClient') -> None:
+        """
+        Set the asynchronous http client used by the service.
+
+        :param httpx.AsyncClient async_http_client: The client used to send requests.
+        """
+        self.async_http_client = async_http_client
+
+    async def close(self) -> None:
+        """
+        Close the asynchronous http client and release its connections.
+        """
+        if self.async_http_client is not None:
+            await self.async_http_client.aclose()
+            self.async_http_client = None
+
+    def _get_cached(self, cache: Optional[TTLCache], key: Hashable) -> Optional[Awaitable[DetailedResponse]]:
+        """
+        Return a coroutine resolving to the response cached for a key, if any.
+        """
+        response = super()._get_cached(cache, key)
+        return _resolved(response) if response is not None else None
+
+    async def _send_cached(self,
+                           request: dict,
+                           cache: Optional[TTLCache],
+                           key: Hashable,
+                           **kwargs) -> DetailedResponse:
+        """
+        Send a request and cache a copy of its response under a key.
+        """
+        response = await self.send(request, **kwargs)
+        if cache is not None:
+            cache.put(key, copy.deepcopy(response))
+        return response
+
+    async def _send_conditional(self,
+                                request: dict,
+                                cache: Optional[TTLCache],
+                                key: Hashable,
+                                cached: Optional[DetailedResponse],
+                                **kwargs) -> DetailedResponse:
+        """
+        Send a request that may carry the ETag of a cached response in its
+        If-None-Match header, answering `304 Not Modified` from the cache and caching
+        the responses that have an ETag.
+        """
+        if cached is not None and request['headers'].get('If-None-Match') != cached.get_headers().get('ETag'):
+            cached = None
+        try:
+            response = await self.send(request, **kwargs)
+        except ApiException as err:
+            if cached is None or err.status_code != 304:
+                raise
+            return not_modified_response(cached, err.http_response.headers)
+        if cache is not None and response.get_headers().get('ETag'):
+            cache.put(key, copy.deepcopy(response))
+        return response
+
+    async def send(self, request: dict, **kwargs) -> DetailedResponse:
+        """
+        Send a request and wrap the response in a DetailedResponse or ApiException.
+
+        This mirrors BaseService.send, but awaits the response instead of blocking.
+
+        :param dict request: The request built by `prepare_request`.
+        :param str operation_id: (optional) Name of the operation sending the request.
+        :param Deadline deadline: (optional) The deadline of the operation, after
+               which it is cancelled.
+        :raises ApiException: The exception from the API.
+        :raises DeadlineExceededError: The deadline passed.
+        :return: The response from the request.
+        :rtype: DetailedResponse
+        """
+        operation_id = kwargs.pop('operation_id', None)
+        deadline = kwargs.get('deadline')
+
+        def attempts():
+            call = self._send_attempts(request, operation_id, **kwargs)
+            return call if deadline is None else _within(call, deadline)
+
+        if self.single_flight is not None and request['method'] == 'GET':
+            return await self.single_flight.do_async(request_key(request), attempts, deadline=deadline)
+        return await attempts()
+
+    async def _send_attempts(self, request: dict, operation_id: Optional[str], **kwargs) -> DetailedResponse:
+        """
+        Send a request until it succeeds or the retry policy gives up, unless the
+        circuit of its deployment is open.
+        """
+        retry_policy = self.retry_policy
+        circuit_breaker = self.circuit_breaker
+        if retry_policy is None and circuit_breaker is None:
+            return await self._send_hedged(request, operation_id, **kwargs)
+        deployment_id = self._deployment_id(operation_id, request) if circuit_breaker is not None else None
+        attempt = 1
+        delay = 0.0
+        while True:
+            if deployment_id is not None:
+                circuit_breaker.before_request(deployment_id)
+            try:
+                response = await self._send_hedged(request, operation_id, retries=attempt - 1, **kwargs)
+            except Exception as err:
+                if deployment_id is not None:
+                    circuit_breaker.record_error(deployment_id, err)
+                if retry_policy is None:
+                    raise
+                delay = retry_policy.retry_delay(operation_id, request, err, attempt, delay)
+                if delay is None:
+                    raise
+                deadline = kwargs.get('deadline')
+                if deadline is not None and delay >= deadline.remaining():
+                    raise deadline.exceeded() from err
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if deployment_id is not None:
+                circuit_breaker.record_success(deployment_id)
+            return response
+
+    async def _send_hedged(self, request: dict, operation_id: Optional[str], **kwargs) -> DetailedResponse:
+        """
+        Send a request, and an identical one if it is slow to answer and the
+        hedging policy applies to it, cancelling the slower one.
+        """
+        hedging_policy = self.hedging_policy
+        if hedging_policy is None or not hedging_policy.applies(operation_id, request['method']):
+            return await self._send_observed(request, operation_id, **kwargs)
+        return await hedging_policy.call_async(
+            operation_id,
+            lambda: self._send_observed(dict(request, headers=dict(request['headers'])), operation_id, **kwargs))
+
+    async def _send_observed(self, request: dict, operation_id: Optional[str], **kwargs) -> DetailedResponse:
+        """
+        Send a request once the rate and concurrency limiters allow it, recording and
+        tracing it when metrics or tracing are enabled.
+
+        :param int retries: (optional) Number of times the retry policy sent the
+               request before.
+        """
+        retries = kwargs.pop('retries', 0)
+        if (self.metrics is None and self.tracer is None and self.rate_limiter is None
+                and self.concurrency_limiter is None):
+            return (await self._send(request, **kwargs))[0]
+        deadline = kwargs.get('deadline')
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(operation_id, request['method'], deadline=deadline)
+        concurrency_limiter = self.concurrency_limiter
+        if concurrency_limiter is not None:
+            await concurrency_limiter.acquire_async(deadline=deadline)
+        start = time.perf_counter()
+        status_code = NO_RESPONSE
+        span = http_response = error = None
+        try:
+            span = self._start_span(operation_id, request)
+            response, http_response = await self._send(request, **kwargs)
+            status_code = response.get_status_code()
+            return response
+        except ApiException as err:
+            status_code, http_response, error = err.status_code, err.http_response, err
+            raise
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            if concurrency_limiter is not None:
+                concurrency_limiter.release(duration, status_code or NO_RESPONSE, operation_id)
+            self._record(operation_id, request, status_code, http_response, duration, retries)
+            self._end_span(span, status_code, http_response, error, retries)
+            if status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.throttled(operation_id, request['method'], http_response.headers)
+
+    async def _send(self, request: dict, **kwargs) -> Tuple[DetailedResponse, 'httpx.Response']:
+        """
+        Send a request with the asynchronous http client.
+
+        :return: The response, and the HTTP response it was read from.
+        :raises DeadlineExceededError: The deadline passed before the response.
+        """
+        deadline = kwargs.pop('deadline', None)
+        kwargs = dict({'timeout': DEFAULT_TIMEOUT}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        timeout = kwargs.get('timeout')
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+
+        try:
+            response = await self.get_async_http_client().request(
+                request['method'],
+                request['url'],
+                headers=dict(request['headers']),
+                params=request.get('params'),
+                content=request.get('data'),
+                timeout=_to_httpx_timeout(timeout))
+        except Exception as err:
+            if deadline is not None and deadline.expired():
+                raise deadline.exceeded() from err
+            raise
+
+        if 200 <= response.status_code <= 299:
+            if response.status_code == 204 or request['method'] == 'HEAD':
+                result = None
+            elif not response.content:
+                result = None
+            elif is_json_mimetype(response.headers.get('Content-Type')):
+                try:
+                    result = self.json_codec.loads(response.content)
+                except ValueError as err:
+                    raise ApiException(code=response.status_code,
+                                       http_response=response,
+                                       message='Error processing the HTTP response') from err
+            else:
+                result = response
+            return DetailedResponse(response=result,
+                                    headers=response.headers,
+                                    status_code=response.status_code), response
+
+        raise ApiException(response.status_code, http_response=response)
+
+
+    #########################
+    # Deployments
+    #########################
+
+
+    async def list_deployables(self,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        List all deployable databases.
+
+        Returns a list of all the types and associated major versions of database
+        deployments that can be provisioned.
+
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ListDeployablesResponse` object
+        """
+
+        return await super().list_deployables(**kwargs)
+
+
+    async def list_regions(self,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        List all deployable regions.
+
+        Returns a list of all the regions that deployments can be provisioned into from
+        the current region. Used to determine region availability for read-only replicas.
+
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ListRegionsResponse` object
+        """
+
+        return await super().list_regions(**kwargs)
+
+
+    async def get_deployment_info(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Get deployment information.
+
+        Gets the full data that is associated with a deployment. This data includes the
+        ID, name, database type, and version.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `GetDeploymentInfoResponse` object
+        """
+
+        return await super().get_deployment_info(id, **kwargs)
+
+    #########################
+    # Database Users
+    #########################
+
+
+    async def create_database_user(self,
+        id: str,
+        user_type: str,
+        *,
+        user: 'CreateDatabaseUserRequestUser' = None,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Creates a user based on user type.
+
+        Creates a user in the database that can access the database through a connection.
+
+        :param str id: Deployment ID.
+        :param str user_type: User type.
+        :param CreateDatabaseUserRequestUser user: (optional)
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `CreateDatabaseUserResponse` object
+        """
+
+        return await super().create_database_user(id, user_type, user=user, **kwargs)
+
+
+    async def change_user_password(self,
+        id: str,
+        user_type: str,
+        username: str,
+        *,
+        user: 'APasswordSettingUser' = None,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Set specified user's password.
+
+        Sets the password of a specified user.
+
+        :param str id: Deployment ID.
+        :param str user_type: User type.
+        :param str username: User ID.
+        :param APasswordSettingUser user: (optional)
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ChangeUserPasswordResponse` object
+        """
+
+        return await super().change_user_password(id, user_type, username, user=user, **kwargs)
+
+
+    async def delete_database_user(self,
+        id: str,
+        user_type: str,
+        username: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Deletes a user based on user type.
+
+        Removes a user from the deployment.
+
+        :param str id: Deployment ID.
+        :param str user_type: User type.
+        :param str username: Username.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `DeleteDatabaseUserResponse` object
+        """
+
+        return await super().delete_database_user(id, user_type, username, **kwargs)
+
+    #########################
+    # Database Configuration
+    #########################
+
+
+    async def update_database_configuration(self,
+        id: str,
+        configuration: 'SetConfigurationConfiguration',
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Change your database configuration.
+
+        Change your database configuration. Available for PostgreSQL, EnterpriseDB, and
+        Redis ONLY.
+
+        :param str id: Deployment ID.
+        :param SetConfigurationConfiguration configuration:
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `UpdateDatabaseConfigurationResponse` object
+        """
+
+        return await super().update_database_configuration(id, configuration, **kwargs)
+
+    #########################
+    # Remotes
+    #########################
+
+
+    async def list_remotes(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        List read-only replica information.
+
+        Get the read-only replicas associated with a deployment. Available for PostgreSQL
+        and EnterpriseDB ONLY.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ListRemotesResponse` object
+        """
+
+        return await super().list_remotes(id, **kwargs)
+
+
+    async def resync_replica(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Resync read-only replica.
+
+        Reinitialize a read-only replica. Available for PostgreSQL and EnterpriseDB ONLY.
+
+        :param str id: Deployment ID of the read-only replica.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `ResyncReplicaResponse` object
+        """
+
+        return await super().resync_replica(id, **kwargs)
+
+
+    async def set_promotion(self,
+        id: str,
+        promotion: 'SetPromotionPromotion',
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Promote read-only replica to a full deployment.
+
+        Promote a read-only replica or upgrade and promote a read-only replica. Available
+        for PostgreSQL and EnterpriseDB ONLY.
+
+        :param str id: Deployment ID of the read-only replica to promote.
+        :param SetPromotionPromotion promotion:
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `SetPromotionResponse` object
+        """
+
+        return await super().set_promotion(id, promotion, **kwargs)
+
+    #########################
+    # Tasks
+    #########################
+
+
+    async def list_deployment_tasks(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        List currently running tasks on a deployment.
+
+        Obtain a list of tasks currently running or recently run on a deployment. Tasks
+        are ephemeral. Records of successful tasks are shown for 24-48 hours, and
+        unsuccessful tasks are shown for 7-8 days.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Tasks` object
+        """
+
+        return await super().list_deployment_tasks(id, **kwargs)
+
+
+    async def get_task(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Get information about a task.
+
+        Get information about a task and its status. Tasks themselves are persistent so
+        old tasks can be consulted as well as running tasks.
+
+        :param str id: Task ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `GetTaskResponse` object
+        """
+
+        return await super().get_task(id, **kwargs)
+
+
+    async def wait_for_task(self,
+        task_id: str,
+        *,
+        timeout: float = None,
+        deadline: float = None,
+        on_progress: Callable[['Task'], None] = None,
+        polling_policy: TaskPollingPolicy = None,
+        **kwargs
+    ) -> Optional['Task']:
+        """
+        Wait for a task to finish.
+
+        Polls the task until its status is `completed` or `failed`. The interval between
+        polls adapts to the progress reported by the task: see `TaskPollingPolicy`. The
+        polls share the timeout and deadline of the wait.
+
+        :param str task_id: Task ID.
+        :param float timeout: (optional) Maximum number of seconds to wait.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which waiting stops.
+        :param callable on_progress: (optional) Called with the `Task` whenever its
+               status or progress changes.
+        :param TaskPollingPolicy polling_policy: (optional) Chooses the intervals
+               between polls.
+        :param dict headers: A `dict` containing the request headers
+        :return: The finished task, or None if the task record is no longer available.
+        :rtype: Task
+        :raises TaskTimeoutError: The task was still running at the timeout or deadline.
+        """
+
+        if task_id is None:
+            raise ValueError('task_id must be provided')
+        waiter = TaskWaiter(task_id,
+                            timeout=timeout,
+                            deadline=deadline,
+                            on_progress=on_progress,
+                            polling_policy=polling_policy)
+        while True:
+            try:
+                result = (await self.get_task(task_id, deadline=waiter.deadline, **kwargs)).get_result() or {}
+            except DeadlineExceededError as err:
+                raise waiter.timed_out() from err
+            task = _models().Task.from_dict(result['task']) if result.get('task') is not None else None
+            delay = waiter.next_delay(task)
+            if delay is None:
+                self._task_finished(task)
+                return task
+            await asyncio.sleep(delay)
+
+    #########################
+    # Backups
+    #########################
+
+
+    async def get_backup_info(self,
+        backup_id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Get information about a backup.
+
+        Get information about a backup, such as creation date.
+
+        :param str backup_id: Backup ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `GetBackupInfoResponse` object
+        """
+
+        return await super().get_backup_info(backup_id, **kwargs)
+
+
+    async def list_deployment_backups(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        List currently available backups from a deployment.
+
+        Get details of all currently available backups from a deployment.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Backups` object
+        """
+
+        return await super().list_deployment_backups(id, **kwargs)
+
+
+    async def start_ondemand_backup(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Initiate an on-demand backup.
+
+        Signal the platform to create an on-demand backup for the specified deployment.
+        The returned task can be polled to track progress of the backup as it takes place.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `StartOndemandBackupResponse` object
+        """
+
+        return await super().start_ondemand_backup(id, **kwargs)
+
+
+    async def get_pit_rdata(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Get earliest point-in-time-recovery timestamp.
+
+        Returns the earliest available time for point-in-time-recovery in ISO8601 UTC
+        format. PostgreSQL and EnterpriseDB only.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `PointInTimeRecoveryData` object
+        """
+
+        return await super().get_pit_rdata(id, **kwargs)
+
+    #########################
+    # Connections
+    #########################
+
+
+    async def get_connection(self,
+        id: str,
+        user_type: str,
+        user_id: str,
+        endpoint_type: str,
+        *,
+        certificate_root: str = None,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Discover connection information for a deployment for a user with an endpoint type.
+
+        Discover connection information for a deployment for a user with an endpoint type.
+
+        :param str id: Deployment ID.
+        :param str user_type: User type.
+        :param str user_id: User ID.
+        :param str endpoint_type: Endpoint Type. The endpoint must be enabled on
+               the deployment before its connection information can be fetched.
+        :param str certificate_root: (optional) Optional certificate root path to
+               prepend certificate names. Certificates would be stored in this directory
+               for use by other commands.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Connection` object
+        """
+
+        return await super().get_connection(id, user_type, user_id, endpoint_type, certificate_root=certificate_root, **kwargs)
+
+
+    async def complete_connection(self,
+        id: str,
+        user_type: str,
+        user_id: str,
+        endpoint_type: str,
+        *,
+        password: str = None,
+        certificate_root: str = None,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Discover connection information for a deployment for a user with substitutions and an endpoint type.
+
+        Discover connection information for a deployment for a user. Behaves the same as
+        the GET method but substitutes the provided password parameter into the returned
+        connection information.
+
+        :param str id: Deployment ID.
+        :param str user_type: User type of `database` is the only currently
+               supported value.
+        :param str user_id: User ID.
+        :param str endpoint_type: Endpoint Type. The select endpoint must be
+               enabled on the deployment before its connection information can be fetched.
+        :param str password: (optional) Password to be substituted into the
+               response.
+        :param str certificate_root: (optional) Optional certificate root path to
+               prepend certificate names. Certificates would be stored in this directory
+               for use by other commands.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Connection` object
+        """
+
+        return await super().complete_connection(id, user_type, user_id, endpoint_type, password=password, certificate_root=certificate_root, **kwargs)
+
+    #########################
+    # Scaling
+    #########################
+
+
+    async def list_deployment_scaling_groups(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        List currently available scaling groups from a deployment.
+
+        Scaling groups represent the various resources that are allocated to a deployment.
+        This command allows for the retrieval of all of the groups for a particular
+        deployment.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Groups` object
+        """
+
+        return await super().list_deployment_scaling_groups(id, **kwargs)
+
+
+    async def get_default_scaling_groups(self,
+        type: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Get default scaling groups for a new deployment.
+
+        Scaling groups represent the various resources allocated to a deployment. When a
+        new deployment is created, there are a set of defaults for each database type.
+        This endpoint returns them for a particular database.
+
+        :param str type: Database type name.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Groups` object
+        """
+
+        return await super().get_default_scaling_groups(type, **kwargs)
+
+
+    async def set_deployment_scaling_group(self,
+        id: str,
+        group_id: str,
+        set_deployment_scaling_group_request: 'SetDeploymentScalingGroupRequest',
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Set scaling values on a specified group.
+
+        Set scaling value on a specified group. Can only be performed on
+        is_adjustable=true groups. Values set are for the group as a whole and resources
+        are distributed amongst the group. Values must be greater than or equal to the
+        minimum size and must be a multiple of the step size.
+
+        :param str id: Deployment ID.
+        :param str group_id: Group Id.
+        :param SetDeploymentScalingGroupRequest
+               set_deployment_scaling_group_request: Scaling group settings.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `SetDeploymentScalingGroupResponse` object
+        """
+
+        return await super().set_deployment_scaling_group(id, group_id, set_deployment_scaling_group_request, **kwargs)
+
+    #########################
+    # Autoscaling
+    #########################
+
+
+    async def get_autoscaling_conditions(self,
+        id: str,
+        group_id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Get the autoscaling configuration from a deployment.
+
+        The Autoscaling configuration represents the various conditions that control
+        autoscaling for a deployment. This command allows for the retrieval of all
+        autoscaling conditions for a particular deployment.
+
+        :param str id: Deployment ID.
+        :param str group_id: Group ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AutoscalingGroup` object
+        """
+
+        return await super().get_autoscaling_conditions(id, group_id, **kwargs)
+
+
+    async def set_autoscaling_conditions(self,
+        id: str,
+        group_id: str,
+        autoscaling: 'AutoscalingSetGroupAutoscaling',
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Set the autoscaling configuration from a deployment.
+
+        Enable, disable, or set the conditions for autoscaling on your deployment. Memory,
+        disk, and CPU (if available) can be set separately and are not all required.
+
+        :param str id: Deployment ID.
+        :param str group_id: Group ID.
+        :param AutoscalingSetGroupAutoscaling autoscaling:
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `SetAutoscalingConditionsResponse` object
+        """
+
+        return await super().set_autoscaling_conditions(id, group_id, autoscaling, **kwargs)
+
+    #########################
+    # Management
+    #########################
+
+
+    async def kill_connections(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Kill connections to a PostgreSQL or EnterpriseDB deployment.
+
+        Closes all the connections on a deployment. Available for PostgreSQL and
+        EnterpriseDB ONLY.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `KillConnectionsResponse` object
+        """
+
+        return await super().kill_connections(id, **kwargs)
+
+    #########################
+    # Security
+    #########################
+
+
+    async def get_allowlist(self,
+        id: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Retrieve the allowlisted addresses and ranges for a deployment.
+
+        Retrieve the allowlisted addresses and ranges for a deployment.
+
+        :param str id: Deployment ID.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `Allowlist` object
+        """
+
+        return await super().get_allowlist(id, **kwargs)
+
+
+    async def set_allowlist(self,
+        id: str,
+        *,
+        ip_addresses: List['AllowlistEntry'] = None,
+        if_match: str = None,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Set the allowlist for a deployment.
+
+        Set the allowlist for a deployment. This action overwrites all existing entries,
+        so when you modify the allowlist via a GET/update/PUT, provide the GET response's
+        ETag header value in this endpoint's If-Match header to ensure that changes that
+        are made by other clients are not accidentally overwritten.
+
+        :param str id: Deployment ID.
+        :param List[AllowlistEntry] ip_addresses: (optional) An array of allowlist
+               entries.
+        :param str if_match: (optional) Verify that the current allowlist matches a
+               provided ETag value. Use in conjunction with the GET operation's ETag
+               header to ensure synchronicity between clients.
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `SetAllowlistResponse` object
+        """
+
+        return await super().set_allowlist(id, ip_addresses=ip_addresses, if_match=if_match, **kwargs)
+
+
+    async def add_allowlist_entry(self,
+        id: str,
+        *,
+        ip_address: 'AllowlistEntry' = None,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Add an address or range to the allowlist for a deployment.
+
+        Add an address or range to the allowlist for a deployment.
+
+        :param str id: Deployment ID.
+        :param AllowlistEntry ip_address: (optional)
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `AddAllowlistEntryResponse` object
+        """
+
+        return await super().add_allowlist_entry(id, ip_address=ip_address, **kwargs)
+
+
+    async def delete_allowlist_entry(self,
+        id: str,
+        ipaddress: str,
+        **kwargs
+    ) -> DetailedResponse:
+        """
+        Delete an address or range from the allowlist of a deployment.
+
+        Delete an address or range from the allowlist of a deployment.
+
+        :param str id: Deployment ID.
+        :param str ipaddress: An IPv4 address or a CIDR range (netmasked IPv4
+               address).
+        :param dict headers: A `dict` containing the request headers
+        :param float timeout: (optional) Maximum number of seconds the call may
+               take, including its retries.
+        :param float deadline: (optional) Time, in seconds since the epoch, or
+               `Deadline`, after which the call fails with `DeadlineExceededError`.
+        :return: A `DetailedResponse` containing the result, headers and HTTP status code.
+        :rtype: DetailedResponse with `dict` result representing a `DeleteAllowlistEntryResponse` object
+        """
+
+        return await super().delete_allowlist_entry(id, ipaddress, **kwargs)
+
+
+async def _resolved(value):
+    """
+    A coroutine that returns a value which is already available.
+    """
+    return value
+
+
+async def _within(call: Awaitable, deadline: Deadline):
+    """
+    Await a coroutine, cancelling it when the deadline passes.
+    """
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        call.close()
+        raise deadline.exceeded()
+    try:
+        return await asyncio.wait_for(call, remaining)
+    except asyncio.TimeoutError as err:
+        raise deadline.exceeded() from err
+
+
+def _ssl_settings(verify: Union[bool, str], cert: Union[None, str, Tuple[str, str]]) -> Union[bool, ssl.SSLContext]:
+    """
+    Return the `verify` argument of httpx for the `verify` and `cert` settings of
+    requests: whether to verify the server's certificate or the path of the CA
+    bundle to verify it with, and the client certificate, either a path or a
+    (certificate, key) pair.
+    """
+    if isinstance(verify, bool) and cert is None:
+        return verify
+    if not verify:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str) and os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    else:
+        context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else certifi.where())
+    if cert is not None:
+        certfile, keyfile = (cert, None) if isinstance(cert, str) else cert
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+def _to_httpx_timeout(timeout):
+    """
+    Convert a `requests` style timeout, which is either a number of seconds or a
+    (connect, read) tuple, into a value understood by httpx.
+    """
+    if isinstance(timeout, (tuple, list)):
+        import httpx # pylint: disable=import-outside-toplevel
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
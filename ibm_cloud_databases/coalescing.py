@@ -0,0 +1,202 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Coalescing of identical concurrent requests.
+
+While a request is in flight, identical requests made by other threads or tasks
+wait for it instead of being sent, and receive a copy of its response, or its
+exception. Nothing is kept once the request completes, so unlike a cache this never
+returns a response older than the request that asked for it.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import copy
+import threading
+
+from .deadlines import Deadline, DeadlineExceededError
+
+
+class SingleFlight():
+    """
+    Shares the result of a call between the callers that ask for it while it runs,
+    from threads with `do` or from asyncio tasks with `do_async`.
+
+    :attr int calls: Number of calls made.
+    :attr int coalesced: Number of callers that shared the result of another call.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], *, deadline: Deadline = None) -> Any:
+        """
+        Call a function, unless a call with the same key is in progress in another
+        thread, in which case wait for it and return a deep copy of its result.
+
+        A caller that waits for another call waits until its own deadline, and makes
+        the call itself if the other one failed because its deadline passed.
+
+        :param Hashable key: Identifies the calls that have the same result.
+        :param callable fn: The call.
+        :param Deadline deadline: (optional) The deadline of the caller.
+        :raises Exception: The exception raised by the call.
+        :raises DeadlineExceededError: The deadline passed while waiting for the
+                call of another thread.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    self.calls += 1
+                    leader = True
+                else:
+                    call.followers += 1
+                    self.coalesced += 1
+                    leader = False
+            if leader:
+                break
+            if not call.done.wait(max(deadline.remaining(), 0) if deadline is not None else None):
+                raise deadline.exceeded()
+            if call.error is not None:
+                if _retry_after(call.error, deadline):
+                    continue
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            result = fn()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                followers = call.followers
+            # The caller is free to modify the result as soon as it is returned, so
+            # followers copy a snapshot of it.
+            if followers and call.error is None:
+                call.result = copy.deepcopy(result)
+            call.done.set()
+        return result
+
+    async def do_async(self,
+                       key: Hashable,
+                       fn: Callable[[], Awaitable[Any]],
+                       *,
+                       deadline: Deadline = None) -> Any:
+        """
+        Await a coroutine function, unless a call with the same key is in progress
+        in another task, in which case wait for it and return a deep copy of its
+        result.
+
+        A caller that waits for another call waits until its own deadline, and makes
+        the call itself if the other one failed because its deadline passed or its
+        task was cancelled.
+
+        :param Hashable key: Identifies the calls that have the same result.
+        :param callable fn: Returns the awaitable call.
+        :param Deadline deadline: (optional) The deadline of the caller.
+        :raises Exception: The exception raised by the call.
+        :raises DeadlineExceededError: The deadline passed while waiting for the
+                call of another task.
+        """
+        # asyncio is only imported by asyncio clients, since it is slow to import.
+        import asyncio # pylint: disable=import-outside-toplevel
+        entry = self._futures.get(key)
+        while entry is not None:
+            entry[1] += 1
+            self.coalesced += 1
+            try:
+                if deadline is None:
+                    result = await asyncio.shield(entry[0])
+                else:
+                    result = await asyncio.wait_for(asyncio.shield(entry[0]), max(deadline.remaining(), 0))
+            except asyncio.TimeoutError as err:
+                raise deadline.exceeded() from err
+            except _Cancelled:
+                entry = self._futures.get(key)
+                continue
+            except DeadlineExceededError as err:
+                if not _retry_after(err, deadline):
+                    raise
+                entry = self._futures.get(key)
+                continue
+            return copy.deepcopy(result)
+        future = asyncio.get_event_loop().create_future()
+        entry = self._futures[key] = [future, 0]
+        self.calls += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # The followers were not cancelled: they retry, and one of them makes
+            # the call.
+            future.set_exception(_Cancelled())
+            if not entry[1]:
+                future.exception()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            if not entry[1]:
+                future.exception()
+            raise
+        finally:
+            del self._futures[key]
+        future.set_result(copy.deepcopy(result) if entry[1] else None)
+        return result
+
+
+def _retry_after(error: BaseException, deadline: Optional[Deadline]) -> bool:
+    """
+    Return whether a caller makes the call itself after the call it waited for
+    failed: the deadline of that call passed, but not the caller's.
+    """
+    return isinstance(error, DeadlineExceededError) and (deadline is None or not deadline.expired())
+
+
+class _Cancelled(Exception):
+    """
+    Raised to the tasks that wait for a call whose task was cancelled.
+    """
+
+
+class _Call():
+    """
+    A call in progress.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+
+def request_key(request: Dict[str, Any]) -> Tuple:
+    """
+    Return the key of a request prepared by `BaseService.prepare_request`, which
+    identifies the requests that would get the same response: its method, URL,
+    query parameters and headers, including the credentials.
+    """
+    params = request.get('params') or {}
+    return (request['method'],
+            request['url'],
+            tuple(sorted((str(name), str(value)) for name, value in params.items())),
+            tuple(sorted((name.lower(), str(value)) for name, value in request['headers'].items())))
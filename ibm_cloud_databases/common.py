@@ -36,12 +36,23 @@ def get_system_info():
 
 def get_user_agent():
     """
-    Get the value to be sent in the User-Agent header.
+    Get the value to be sent in the User-Agent header. It is computed by the first
+    call rather than on import.
     """
-    return USER_AGENT
+    global _user_agent #pylint: disable=global-statement
+    if _user_agent is None:
+        _user_agent = '{0}/{1} ({2})'.format(SDK_NAME, __version__, get_system_info())
+    return _user_agent
 
 
-USER_AGENT = '{0}/{1} ({2})'.format(SDK_NAME, __version__, get_system_info())
+_user_agent = None
+
+
+def __getattr__(name):
+    # USER_AGENT used to be computed on import.
+    if name == 'USER_AGENT':
+        return get_user_agent()
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
 
 
 def get_sdk_headers(service_name, service_version, operation_id):
@@ -0,0 +1,113 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory-compact variants of the Cloud Databases V5 models.
+
+Every model class of `cloud_databases_v5` has a twin of the same name in this module,
+with the same constructor, `from_dict`, `to_dict`, equality and nested enums, whose
+instances keep their attributes in `__slots__` rather than in a per-instance
+`__dict__`. Nested models created by `from_dict` are compact as well, and compact
+models can be passed to any operation of the service in place of regular ones.
+
+Example::
+
+    from ibm_cloud_databases import compact_models
+
+    backups = compact_models.Backups.from_dict(response.get_result())
+
+Compact models are not instances of their regular counterparts, and new attributes
+cannot be added to them.
+"""
+
+import inspect
+import types
+
+from . import cloud_databases_v5_models
+
+__all__ = []
+
+
+def _state(model) -> dict:
+    """
+    The attributes of a compact model, as `__dict__` holds them for a regular one.
+    """
+    return {name: getattr(model, name)
+            for cls in type(model).__mro__
+            for name in getattr(cls, '__slots__', ())
+            if hasattr(model, name)}
+
+
+def _eq(self, other) -> bool:
+    """Return `true` when self and other are equal, false otherwise."""
+    if not isinstance(other, self.__class__):
+        return False
+    return _state(self) == _state(other)
+
+
+def _rebind(function: types.FunctionType, module_globals: dict) -> types.FunctionType:
+    """
+    Copy a function so that the global names it uses are looked up in another
+    namespace.
+    """
+    copy = types.FunctionType(function.__code__, module_globals, function.__name__,
+                              function.__defaults__, function.__closure__)
+    copy.__kwdefaults__ = function.__kwdefaults__
+    copy.__annotations__ = function.__annotations__
+    copy.__doc__ = function.__doc__
+    copy.__qualname__ = function.__qualname__
+    return copy
+
+
+def _compact(model: type, bases: tuple, module_globals: dict) -> type:
+    """
+    Build the compact twin of a model class.
+    """
+    namespace = {'__module__': __name__, '__qualname__': model.__qualname__, '__doc__': model.__doc__}
+    for name, member in vars(model).items():
+        if isinstance(member, types.FunctionType):
+            namespace[name] = _rebind(member, module_globals)
+        elif isinstance(member, classmethod):
+            namespace[name] = classmethod(_rebind(member.__func__, module_globals))
+        elif isinstance(member, staticmethod):
+            namespace[name] = staticmethod(_rebind(member.__func__, module_globals))
+        elif isinstance(member, type):
+            namespace[name] = member
+    parameters = list(inspect.signature(model.__init__).parameters)[1:]
+    inherited = {name for base in bases for cls in base.__mro__ for name in getattr(cls, '__slots__', ())}
+    namespace['__slots__'] = tuple(name for name in parameters if name not in inherited)
+    namespace['__eq__'] = _eq
+    return type(model.__name__, bases, namespace)
+
+
+def _build(module, target: dict) -> None:
+    """
+    Add the compact twin of every model class of a module to a namespace.
+    """
+    models = [value for value in vars(module).values()
+              if isinstance(value, type) and value.__module__ == module.__name__]
+    models.sort(key=lambda model: len(model.__mro__))
+    module_globals = dict(vars(module))
+    for model in models:
+        bases = tuple(target[base.__name__] if base in models else base
+                      for base in model.__bases__)
+        compact = _compact(model, bases, module_globals)
+        target[model.__name__] = compact
+        module_globals[model.__name__] = compact
+        __all__.append(model.__name__)
+
+
+_build(cloud_databases_v5_models, globals())
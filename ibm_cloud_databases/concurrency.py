@@ -0,0 +1,208 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Adaptive limiting of the number of requests in flight.
+
+The limit follows the health of the service with additive increase and
+multiplicative decrease (AIMD), as TCP congestion control does: it grows by about
+one request per round trip while responses are fast and successful, and is cut by
+a factor when the service answers 429 or 5xx, when a request gets no response, or
+when latency rises well above the baseline of its operation. Requests over the
+limit wait for one in flight to complete.
+
+A thread pool, or a set of asyncio tasks, can then be sized generously and the
+limiter finds the concurrency the service sustains::
+
+    service.enable_concurrency_limiting(AdaptiveConcurrencyLimiter(max_limit=64))
+    with FleetExecutor(service, max_workers=64) as fleet:
+        ...
+"""
+
+from typing import Callable, Optional
+import collections
+import math
+import threading
+import time
+
+from .deadlines import Deadline
+
+
+class AdaptiveConcurrencyLimiter():
+    """
+    Limits the number of requests in flight from threads and asyncio tasks, and
+    adapts the limit to the latency and errors of the responses.
+
+    :attr float limit: The current limit; `int(limit)` requests may be in flight.
+    :attr int in_flight: Number of requests in flight.
+    :attr int increases: Number of times the limit was raised.
+    :attr int decreases: Number of times the limit was cut.
+    """
+
+    def __init__(self,
+                 *,
+                 initial_limit: int = 8,
+                 min_limit: int = 1,
+                 max_limit: int = 128,
+                 backoff: float = 0.5,
+                 latency_tolerance: float = 2.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param int initial_limit: (optional) The limit to start from.
+        :param int min_limit: (optional) The lowest limit.
+        :param int max_limit: (optional) The highest limit.
+        :param float backoff: (optional) Factor the limit is multiplied by when the
+               service is overloaded.
+        :param float latency_tolerance: (optional) A response slower than this
+               multiple of the baseline latency of its operation counts as a sign
+               of overload.
+        :param callable clock: (optional) Returns the current time in seconds.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('limits must satisfy 1 <= min_limit <= initial_limit <= max_limit')
+        if not 0 < backoff < 1:
+            raise ValueError('backoff must be between 0 and 1')
+        if latency_tolerance <= 1:
+            raise ValueError('latency_tolerance must be greater than 1')
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._baselines = {}
+        self._last_decrease = -math.inf
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiters = collections.deque()
+
+    def acquire(self, deadline: Deadline = None) -> None:
+        """
+        Block until a request may be sent.
+
+        :param Deadline deadline: (optional) The deadline of the request.
+        :raises DeadlineExceededError: The deadline passed while waiting.
+        """
+        with self._lock:
+            if self._grant():
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        if deadline is None:
+            event.wait()
+        elif not event.wait(max(deadline.remaining(), 0.0)):
+            self._abandon(event)
+            raise deadline.exceeded()
+
+    async def acquire_async(self, deadline: Deadline = None) -> None:
+        """
+        Wait, without blocking the event loop, until a request may be sent.
+
+        :param Deadline deadline: (optional) The deadline of the request.
+        :raises DeadlineExceededError: The deadline passed while waiting.
+        """
+        import asyncio # pylint: disable=import-outside-toplevel
+        with self._lock:
+            if self._grant():
+                return
+            loop = asyncio.get_event_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            if deadline is None:
+                await waiter[1]
+            else:
+                await asyncio.wait_for(waiter[1], max(deadline.remaining(), 0.0))
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            raise deadline.exceeded() from None
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def release(self, latency: float, status_code: int, operation_id: Optional[str] = None) -> None:
+        """
+        Report the completion of a request and adapt the limit.
+
+        :param float latency: Seconds the request took.
+        :param int status_code: HTTP status of the response, or 0 if the request got
+               no response.
+        :param str operation_id: (optional) The operation of the request. Latency is
+               compared to the baseline of the same operation, as operations take
+               very different times.
+        """
+        with self._lock:
+            baseline = self._baselines.get(operation_id)
+            overloaded = status_code == 0 or status_code == 429 or status_code >= 500
+            if not overloaded and status_code < 400:
+                if baseline is None or latency < baseline:
+                    baseline = latency
+                else:
+                    # Let the baseline follow lasting changes of the latency slowly.
+                    baseline += (latency - baseline) * 0.01
+                self._baselines[operation_id] = baseline
+                overloaded = latency > baseline * self.latency_tolerance
+            now = self._clock()
+            if overloaded:
+                # Cut once per round trip, not once per request of the same episode.
+                if now - self._last_decrease > (baseline or 0.0) * self.latency_tolerance:
+                    self.limit = max(self.limit * self.backoff, float(self.min_limit))
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif self.in_flight * 2 >= self.limit and self.limit < self.max_limit:
+                # The limit only grows while at least half of it is in use.
+                self.limit = min(self.limit + 1.0 / self.limit, float(self.max_limit))
+                self.increases += 1
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            while self._waiters and self.in_flight < int(self.limit):
+                self.in_flight += 1
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                else:
+                    loop, future = waiter
+                    loop.call_soon_threadsafe(_set_result, future)
+
+    def _abandon(self, waiter) -> None:
+        """
+        Stop waiting for a slot, giving it back if it was granted meanwhile.
+        """
+        with self._lock:
+            granted = waiter not in self._waiters
+            if not granted:
+                self._waiters.remove(waiter)
+        if granted:
+            self._release_slot()
+
+    def _grant(self) -> bool:
+        """
+        Take a slot if one is free and nobody is waiting; the lock must be held.
+        """
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return True
+        return False
+
+
+def _set_result(future: 'asyncio.Future') -> None:
+    if not future.done():
+        future.set_result(None)
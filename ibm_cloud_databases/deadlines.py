@@ -0,0 +1,140 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deadlines of the Cloud Databases operations.
+
+Every operation accepts a `timeout`, in seconds, and a `deadline`, either a time in
+seconds since the epoch or a `Deadline`. The connect and read timeouts of each
+request are cut to the time left, retries, hedges and the waits for the rate and
+concurrency limiters share the deadline of their call, and the operation raises
+`DeadlineExceededError` once the time is up::
+
+    step = Deadline(30)
+    service.set_deployment_scaling_group(id, group_id, group, deadline=step)
+    service.wait_for_task(task_id, deadline=step)
+"""
+
+from typing import Dict, Optional, Tuple, Union
+import math
+import time
+
+
+class DeadlineExceededError(Exception):
+    """
+    Raised when an operation did not finish within its timeout or deadline.
+
+    :attr float elapsed: Number of seconds since the deadline was set.
+    """
+
+    def __init__(self, elapsed: float, message: str = None) -> None:
+        super().__init__(message or 'Deadline exceeded after {0:.1f} seconds'.format(elapsed))
+        self.elapsed = elapsed
+
+
+class Deadline():
+    """
+    A time after which an operation is abandoned, kept on the monotonic clock so
+    that changes of the system time do not move it.
+
+    :attr float started: Monotonic time at which the deadline was set.
+    :attr float expires: Monotonic time at which the deadline passes.
+    """
+
+    def __init__(self,
+                 timeout: float = None,
+                 *,
+                 deadline: Union[float, 'Deadline'] = None) -> None:
+        """
+        :param float timeout: (optional) Number of seconds from now.
+        :param float deadline: (optional) Time, in seconds since the epoch as
+               returned by `time.time()`, or another `Deadline`. When both are given
+               the earliest applies.
+        """
+        self.started = time.monotonic()
+        self.expires = math.inf
+        if timeout is not None:
+            self.expires = self.started + timeout
+        if isinstance(deadline, Deadline):
+            self.expires = min(self.expires, deadline.expires)
+        elif deadline is not None:
+            self.expires = min(self.expires, self.started + deadline - time.time())
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Dict) -> Optional['Deadline']:
+        """
+        Return the deadline set by the `timeout` and `deadline` arguments of an
+        operation, or None if neither is set.
+        """
+        timeout = kwargs.get('timeout')
+        deadline = kwargs.get('deadline')
+        if timeout is None:
+            if deadline is None or isinstance(deadline, Deadline):
+                return deadline
+        return cls(timeout, deadline=deadline)
+
+    @property
+    def elapsed(self) -> float:
+        """Number of seconds since the deadline was set."""
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        """
+        Return the number of seconds left, which is negative once the deadline
+        passed.
+        """
+        return self.expires - time.monotonic()
+
+    def expired(self) -> bool:
+        """
+        Return whether the deadline passed.
+        """
+        return self.remaining() <= 0
+
+    def check(self) -> float:
+        """
+        Return the number of seconds left.
+
+        :raises DeadlineExceededError: The deadline passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise self.exceeded()
+        return remaining
+
+    def timeout(self,
+                timeout: Union[None, float, Tuple[float, float]]) -> Union[float, Tuple[float, float]]:
+        """
+        Cut an HTTP timeout, either a number of seconds or a (connect, read) tuple,
+        to the time left.
+
+        :raises DeadlineExceededError: The deadline passed.
+        """
+        remaining = self.check()
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            return (_bound(connect, remaining), _bound(read, remaining))
+        return _bound(timeout, remaining)
+
+    def exceeded(self) -> DeadlineExceededError:
+        """
+        Return the exception raised when the deadline passed.
+        """
+        return DeadlineExceededError(self.elapsed)
+
+
+def _bound(timeout: Optional[float], remaining: float) -> float:
+    return remaining if timeout is None else min(timeout, remaining)
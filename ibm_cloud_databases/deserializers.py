@@ -0,0 +1,163 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Specialized deserializers for the Cloud Databases V5 models.
+
+`get_deserializer(Model)` returns a function that builds the same object as
+`Model.from_dict`, but is generated for that model: the instance dictionary is filled
+in one step instead of collecting keyword arguments and calling the constructor,
+nested models and lists of them call the deserializers of their own models directly,
+and RFC 3339 timestamps are parsed with `datetime.fromisoformat` rather than the
+general purpose parser of `dateutil`. Models whose source is not installed are
+deserialized by their own `from_dict`.
+
+Example::
+
+    from ibm_cloud_databases.deserializers import get_deserializer
+
+    backups = get_deserializer(Backups)(response.get_result())
+"""
+
+from typing import Callable, Dict, List, TypeVar
+import datetime
+import threading
+
+from ibm_cloud_sdk_core.utils import string_to_datetime
+
+from .model_fields import DATETIME, MODEL, MODEL_LIST, ModelField, SourceUnavailableError, get_model_fields
+
+T = TypeVar('T')
+
+_namespace = {}
+_deserializers = {}
+_lock = threading.RLock()
+
+
+def get_deserializer(model: type) -> Callable[[Dict], T]:
+    """
+    Return the deserializer of a model, generating it on first use.
+
+    :param type model: A model class of `cloud_databases_v5`, or a subclass of one
+           whose instances have a `__dict__`.
+    :raises ValueError: The model's `from_dict` does not follow the generated
+            pattern.
+    :return: A function that takes a json dictionary and returns a model object.
+    """
+    deserializer = _deserializers.get(model)
+    if deserializer is None:
+        with _lock:
+            deserializer = _compile(model)
+    return deserializer
+
+
+def from_dict(model: type, _dict: Dict) -> T:
+    """
+    Initialize a model object from a json dictionary with its deserializer.
+    """
+    return get_deserializer(model)(_dict)
+
+
+def parse_datetime(string: str) -> datetime.datetime:
+    """
+    De-serializes a string to a datetime, like `string_to_datetime`, with a fast path
+    for RFC 3339 timestamps such as `2021-06-01T12:00:00Z`.
+    """
+    try:
+        value = datetime.datetime.fromisoformat(string.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return string_to_datetime(string)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
+def generate_source(model: type) -> str:
+    """
+    Return the source of the deserializer of a model.
+
+    :param type model: A model class of `cloud_databases_v5`.
+    :rtype: str
+    """
+    return _generate(model, get_model_fields(model))
+
+
+def _generate(model: type, fields: List[ModelField]) -> str:
+    """
+    Return the source of the deserializer of a model with the given fields.
+    """
+    lines = ['def {0}(_dict):'.format(_function_name(model))]
+    for field in fields:
+        if field.required:
+            lines.append('    if {0!r} not in _dict:'.format(field.key))
+            lines.append('        raise ValueError({0!r})'.format(
+                'Required property \'{0}\' not present in {1} JSON'.format(field.key, model.__name__)))
+    lines.append('    _model = _new({0})'.format(_class_name(model)))
+    lines.append('    _model.__dict__ = {')
+    for field in fields:
+        value = '_dict[{0!r}]'.format(field.key)
+        if field.kind == MODEL:
+            value = '{0}({1})'.format(_function_name(field.model), value)
+        elif field.kind == MODEL_LIST:
+            value = '[{0}(x) for x in {1}]'.format(_function_name(field.model), value)
+        elif field.kind == DATETIME:
+            value = 'parse_datetime({0})'.format(value)
+        if field.required:
+            lines.append('        {0!r}: {1},'.format(field.name, value))
+        elif value == '_dict[{0!r}]'.format(field.key):
+            lines.append('        {0!r}: _dict.get({1!r}),'.format(field.name, field.key))
+        else:
+            lines.append('        {0!r}: {1} if {2!r} in _dict else None,'.format(field.name, value, field.key))
+    lines.append('    }')
+    lines.append('    return _model')
+    return '\n'.join(lines) + '\n'
+
+
+def _compile(model: type) -> Callable[[Dict], T]:
+    """
+    Generate the deserializers of a model and of the models nested in it.
+    """
+    pending = [model]
+    compiled = {}
+    while pending:
+        current = pending.pop()
+        if current in _deserializers or current in compiled:
+            continue
+        if hasattr(current, '__slots__'):
+            raise ValueError('{0} objects have no __dict__'.format(current.__name__))
+        try:
+            fields = get_model_fields(current)
+        except SourceUnavailableError:
+            compiled[current] = _namespace[_function_name(current)] = current.from_dict
+            continue
+        source = _generate(current, fields)
+        _namespace[_class_name(current)] = current
+        exec(compile(source, '<deserializer {0}>'.format(current.__qualname__), 'exec'), _namespace) # pylint: disable=exec-used
+        compiled[current] = _namespace[_function_name(current)]
+        pending.extend(field.model for field in fields if field.model is not None)
+    _deserializers.update(compiled)
+    return _deserializers[model]
+
+
+def _class_name(model: type) -> str:
+    return '_class_{0}_{1}'.format(model.__name__, id(model))
+
+
+def _function_name(model: type) -> str:
+    return '_from_dict_{0}_{1}'.format(model.__name__, id(model))
+
+
+_namespace.update(_new=object.__new__, parse_datetime=parse_datetime)
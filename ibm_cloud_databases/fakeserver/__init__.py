@@ -0,0 +1,37 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A local stand-in for the Cloud Databases API, for load tests and chaos drills.
+
+It implements the v5 routes called by `CloudDatabasesV5` over in-memory
+deployments, users, allowlists, scaling groups, backups and tasks, and can add
+latency and inject 429 and 5xx responses. Run it with::
+
+    python -m ibm_cloud_databases.fakeserver --port 8080 --deployments 3
+
+and point the client at it with `service.set_service_url('http://127.0.0.1:8080')`
+and a `NoAuthAuthenticator`. It can also be started in-process::
+
+    from ibm_cloud_databases.fakeserver import FakeServer, FakeState, Faults
+
+    with FakeServer(FakeState(deployments=3), faults=Faults(throttle_rate=0.1)) as server:
+        service.set_service_url(server.url)
+"""
+
+from .faults import Faults, Latency
+from .server import FakeServer
+from .state import FakeError, FakeState
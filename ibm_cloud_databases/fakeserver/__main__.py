@@ -0,0 +1,92 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Run the fake Cloud Databases API: python -m ibm_cloud_databases.fakeserver --help
+"""
+
+from typing import List
+import argparse
+import sys
+
+from .faults import Faults, Latency
+from .server import FakeServer
+from .state import VERSIONS, FakeState
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Serve the fake API until interrupted.
+    """
+    parser = argparse.ArgumentParser(prog='python -m ibm_cloud_databases.fakeserver',
+                                     description='Serve a fake Cloud Databases v5 API from memory.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8080, help='port to listen on (default: %(default)s)')
+    state = parser.add_argument_group('state')
+    state.add_argument('--deployments', type=int, default=1, help='deployments to create (default: %(default)s)')
+    state.add_argument('--type', default='postgresql', choices=sorted(VERSIONS), help='type of the deployments')
+    state.add_argument('--backups', type=int, default=3, help='backups of each deployment (default: %(default)s)')
+    state.add_argument('--allowlist-entries', type=int, default=2,
+                       help='allowlist entries of each deployment (default: %(default)s)')
+    state.add_argument('--auto-create', action='store_true',
+                       help='create deployments on first use of an unknown ID instead of answering 404')
+    state.add_argument('--task-duration', type=float, default=2.0,
+                       help='seconds each task runs for (default: %(default)s)')
+    state.add_argument('--task-failure-rate', type=float, default=0.0,
+                       help='fraction of tasks that fail (default: %(default)s)')
+    faults = parser.add_argument_group('latency and faults')
+    faults.add_argument('--latency', type=float, default=0.0, help='mean added latency, in milliseconds')
+    faults.add_argument('--latency-spread', type=float, default=0.0,
+                        help='spread of the latency: milliseconds, or the log standard deviation for lognormal')
+    faults.add_argument('--latency-distribution', default='fixed', choices=Latency.DISTRIBUTIONS,
+                        help='distribution of the latency (default: %(default)s)')
+    faults.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='fraction of requests answered with 429 (default: %(default)s)')
+    faults.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests answered with 500, 502 or 503 (default: %(default)s)')
+    faults.add_argument('--retry-after', type=int, default=1,
+                        help='Retry-After seconds of 429 and 503 responses (default: %(default)s)')
+    parser.add_argument('--seed', type=int, help='seed of the generated IDs, latency and faults')
+    args = parser.parse_args(argv)
+
+    try:
+        spread = args.latency_spread if args.latency_distribution == 'lognormal' else args.latency_spread / 1000
+        server = FakeServer(
+            FakeState(deployments=args.deployments, deployment_type=args.type, backups=args.backups,
+                      allowlist_entries=args.allowlist_entries, task_duration=args.task_duration,
+                      task_failure_rate=args.task_failure_rate, auto_create=args.auto_create, seed=args.seed),
+            host=args.host,
+            port=args.port,
+            latency=Latency(args.latency_distribution, args.latency / 1000, spread, seed=args.seed),
+            faults=Faults(throttle_rate=args.throttle_rate, error_rate=args.error_rate,
+                          retry_after=args.retry_after, seed=args.seed))
+    except ValueError as error:
+        parser.error(str(error))
+    server.bind()
+    print('Serving the fake Cloud Databases API on {0}'.format(server.url))
+    print('Deployments:')
+    for deployment_id in server.state.deployment_ids:
+        print('  ' + deployment_id)
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Latency and fault injection for the fake Cloud Databases API.
+"""
+
+from typing import Optional, Sequence
+import math
+import random
+import threading
+
+from .state import FakeError
+
+
+class Latency():
+    """
+    A distribution of the delay added to responses.
+
+    :attr str distribution: `fixed` (always `mean`), `uniform` (between `mean -
+          spread` and `mean + spread`), `exponential` (of mean `mean`, shifted by
+          `spread`) or `lognormal` (of median `mean`, with `spread` the standard
+          deviation of the logarithm).
+    :attr float mean: Seconds.
+    :attr float spread: Seconds for `uniform` and `exponential`, unitless for
+          `lognormal`.
+    """
+
+    DISTRIBUTIONS = ('fixed', 'uniform', 'exponential', 'lognormal')
+
+    def __init__(self,
+                 distribution: str = 'fixed',
+                 mean: float = 0.0,
+                 spread: float = 0.0,
+                 *,
+                 seed: int = None) -> None:
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError('distribution must be one of {0}'.format(', '.join(self.DISTRIBUTIONS)))
+        if mean < 0 or spread < 0:
+            raise ValueError('mean and spread must not be negative')
+        self.distribution = distribution
+        self.mean = mean
+        self.spread = spread
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """
+        Return a number of seconds to wait.
+        """
+        if self.distribution == 'fixed' or not self.mean:
+            return self.mean
+        with self._lock:
+            if self.distribution == 'uniform':
+                value = self._random.uniform(self.mean - self.spread, self.mean + self.spread)
+            elif self.distribution == 'exponential':
+                value = self.spread + self._random.expovariate(1 / self.mean)
+            else:
+                value = self._random.lognormvariate(math.log(self.mean), self.spread)
+        return max(0.0, value)
+
+    def __repr__(self) -> str:
+        return '<Latency {0} mean={1} spread={2}>'.format(self.distribution, self.mean, self.spread)
+
+
+class Faults():
+    """
+    Makes a fraction of the requests fail.
+
+    :attr float throttle_rate: Fraction of the requests answered with 429 Too Many
+          Requests.
+    :attr float error_rate: Fraction of the requests answered with one of
+          `error_statuses`.
+    :attr Sequence[int] error_statuses: Server error statuses to choose from.
+    :attr int retry_after: Value of the Retry-After header of 429 and 503 responses,
+          or None to leave it out.
+    """
+
+    def __init__(self,
+                 *,
+                 throttle_rate: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_statuses: Sequence[int] = (500, 502, 503),
+                 retry_after: Optional[int] = 1,
+                 seed: int = None) -> None:
+        if not 0 <= throttle_rate <= 1 or not 0 <= error_rate <= 1 or throttle_rate + error_rate > 1:
+            raise ValueError('throttle_rate and error_rate must be fractions adding up to at most 1')
+        if not error_statuses or any(not 500 <= status <= 599 for status in error_statuses):
+            raise ValueError('error_statuses must be server error statuses')
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def pick(self) -> Optional[FakeError]:
+        """
+        Return the error to answer a request with, or None to serve it.
+        """
+        with self._lock:
+            draw = self._random.random()
+            status = self._random.choice(self.error_statuses)
+        if draw < self.throttle_rate:
+            return FakeError(429, 'too_many_requests', 'Rate limit exceeded', headers=self._retry_after())
+        if draw < self.throttle_rate + self.error_rate:
+            return FakeError(status, 'internal_error', 'Injected server error',
+                             headers=self._retry_after() if status == 503 else None)
+        return None
+
+    def _retry_after(self) -> dict:
+        return {} if self.retry_after is None else {'Retry-After': str(self.retry_after)}
+
+    def __repr__(self) -> str:
+        return '<Faults 429={0} 5xx={1}>'.format(self.throttle_rate, self.error_rate)
@@ -0,0 +1,292 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The HTTP server of the fake Cloud Databases API.
+"""
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Dict, Tuple
+from urllib.parse import unquote
+import collections
+import json
+import re
+import threading
+import time
+
+from .faults import Faults, Latency
+from .state import REGIONS, FakeError, FakeState, deployables_json
+
+STATS_PATH = '/_fakeserver/stats'
+
+
+def _body(body: Dict, name: str):
+    return body.get(name) if isinstance(body, dict) else None
+
+
+# (method, path template, handler). A handler takes the state, the unquoted path
+# parameters, the decoded JSON body and the request headers, and returns the JSON
+# result, or the result and its ETag.
+ROUTES = [
+    ('GET', '/deployables', lambda state, p, body, headers: deployables_json()),
+    ('GET', '/regions', lambda state, p, body, headers: {'regions': list(REGIONS)}),
+    ('GET', '/deployments/{id}', lambda state, p, body, headers: state.get_deployment(p['id'])),
+    ('POST', '/deployments/{id}/users/{user_type}',
+     lambda state, p, body, headers: state.create_user(p['id'], p['user_type'], _body(body, 'user'))),
+    ('PATCH', '/deployments/{id}/users/{user_type}/{username}',
+     lambda state, p, body, headers: state.change_user_password(p['id'], p['user_type'], p['username'],
+                                                                _body(body, 'user'))),
+    ('DELETE', '/deployments/{id}/users/{user_type}/{username}',
+     lambda state, p, body, headers: state.delete_user(p['id'], p['user_type'], p['username'])),
+    ('PATCH', '/deployments/{id}/configuration',
+     lambda state, p, body, headers: state.update_configuration(p['id'], _body(body, 'configuration'))),
+    ('GET', '/deployments/{id}/remotes', lambda state, p, body, headers: state.list_remotes(p['id'])),
+    ('POST', '/deployments/{id}/remotes/resync',
+     lambda state, p, body, headers: state.start_deployment_task(p['id'], 'Resyncing read replica.')),
+    ('POST', '/deployments/{id}/remotes/promotion',
+     lambda state, p, body, headers: state.start_deployment_task(p['id'], 'Promoting read replica.')),
+    ('GET', '/deployments/{id}/tasks', lambda state, p, body, headers: state.list_tasks(p['id'])),
+    ('GET', '/tasks/{id}', lambda state, p, body, headers: state.get_task(p['id'])),
+    ('GET', '/backups/{backup_id}', lambda state, p, body, headers: state.get_backup(p['backup_id'])),
+    ('GET', '/deployments/{id}/backups', lambda state, p, body, headers: state.list_backups(p['id'])),
+    ('POST', '/deployments/{id}/backups', lambda state, p, body, headers: state.start_backup(p['id'])),
+    ('GET', '/deployments/{id}/point_in_time_recovery_data',
+     lambda state, p, body, headers: state.get_pitr(p['id'])),
+    ('GET', '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}',
+     lambda state, p, body, headers: state.get_connection(p['id'], p['user_type'], p['user_id'],
+                                                          p['endpoint_type'])),
+    ('POST', '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}',
+     lambda state, p, body, headers: state.get_connection(p['id'], p['user_type'], p['user_id'],
+                                                          p['endpoint_type'], password=_body(body, 'password'))),
+    ('GET', '/deployments/{id}/groups', lambda state, p, body, headers: state.list_groups(p['id'])),
+    ('GET', '/deployables/{type}/groups', lambda state, p, body, headers: state.default_groups(p['type'])),
+    ('PATCH', '/deployments/{id}/groups/{group_id}',
+     lambda state, p, body, headers: state.set_group(p['id'], p['group_id'], body)),
+    ('GET', '/deployments/{id}/groups/{group_id}/autoscaling',
+     lambda state, p, body, headers: state.get_autoscaling(p['id'], p['group_id'])),
+    ('PATCH', '/deployments/{id}/groups/{group_id}/autoscaling',
+     lambda state, p, body, headers: state.set_autoscaling(p['id'], p['group_id'], _body(body, 'autoscaling'))),
+    ('DELETE', '/deployments/{id}/management/database_connections',
+     lambda state, p, body, headers: state.start_deployment_task(p['id'], 'Killing database connections.')),
+    ('GET', '/deployments/{id}/whitelists/ip_addresses', lambda state, p, body, headers: state.get_allowlist(p['id'])),
+    ('PUT', '/deployments/{id}/whitelists/ip_addresses',
+     lambda state, p, body, headers: state.set_allowlist(p['id'], _body(body, 'ip_addresses'),
+                                                         if_match=headers.get('If-Match'))),
+    ('POST', '/deployments/{id}/whitelists/ip_addresses',
+     lambda state, p, body, headers: state.add_allowlist_entry(p['id'], _body(body, 'ip_address'))),
+    ('DELETE', '/deployments/{id}/whitelists/ip_addresses/{ipaddress}',
+     lambda state, p, body, headers: state.delete_allowlist_entry(p['id'], p['ipaddress'])),
+]
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeServer():
+    """
+    Serves the Cloud Databases API routes called by `CloudDatabasesV5` from a
+    `FakeState`, with optional latency and fault injection.
+
+    Example::
+
+        with FakeServer(FakeState(deployments=3)) as server:
+            service.set_service_url(server.url)
+            service.get_deployment_info(server.state.deployment_ids[0])
+
+    Every response is delayed by a sample of `latency`, and `faults` decides which
+    requests fail instead of being served. Request counts by route and status are
+    kept in `stats`, and are also served as JSON at `/_fakeserver/stats`.
+
+    :attr FakeState state: The deployments served.
+    :attr Latency latency: The delay added to responses.
+    :attr Faults faults: The errors injected, or None.
+    """
+
+    def __init__(self,
+                 state: FakeState = None,
+                 *,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency: Latency = None,
+                 faults: Faults = None) -> None:
+        """
+        :param FakeState state: (optional) The deployments served; one deployment by
+               default.
+        :param str host: (optional) Address to listen on.
+        :param int port: (optional) Port to listen on; a free port by default.
+        :param Latency latency: (optional) The delay added to responses.
+        :param Faults faults: (optional) The errors injected.
+        """
+        self.state = state if state is not None else FakeState()
+        self.host = host
+        self.port = port
+        self.latency = latency or Latency()
+        self.faults = faults
+        self.stats = collections.Counter()
+        self.routes = [(method, re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', template) + '$'),
+                        template, handler) for method, template, handler in ROUTES]
+        self._stats_lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The URL to pass to `set_service_url`."""
+        host, port = self._server.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def __enter__(self) -> 'FakeServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def start(self) -> str:
+        """
+        Start serving from a background thread.
+
+        :return: The URL of the server.
+        """
+        self.bind()
+        self._thread = threading.Thread(target=self._server.serve_forever, name='cloud-databases-fakeserver',
+                                        daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self) -> None:
+        """
+        Serve from the calling thread until interrupted.
+        """
+        self.bind()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+
+    def stop(self) -> None:
+        """
+        Stop serving.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Answer a request.
+
+        :return: The status, headers and body of the response.
+        """
+        delay = self.latency.sample()
+        if delay:
+            time.sleep(delay)
+        path = path.split('?', 1)[0]
+        if method == 'GET' and path == STATS_PATH:
+            with self._stats_lock:
+                stats = dict(self.stats)
+            return self._json(200, {'requests': stats})
+        route = '{0} (unknown)'.format(method)
+        etag = None
+        try:
+            route, handler, params = self._route(method, path)
+            error = self.faults.pick() if self.faults is not None else None
+            if error is not None:
+                raise error
+            try:
+                document = json.loads(body.decode('utf-8')) if body else None
+            except ValueError:
+                raise FakeError(400, 'bad_request', 'The request body is not valid JSON')
+            result = handler(self.state, params, document, headers)
+            if isinstance(result, tuple):
+                result, etag = result
+                if headers.get('If-None-Match') == etag:
+                    return self._count(route, 304, {'ETag': etag}, b'')
+            status, response_headers, response_body = self._json(
+                202 if method != 'GET' and 'task' in result else 200, result)
+        except FakeError as error:
+            status, response_headers, response_body = self._json(error.status, error.to_dict())
+            response_headers.update(error.headers)
+        if etag is not None:
+            response_headers['ETag'] = etag
+        return self._count(route, status, response_headers, response_body)
+
+    def bind(self) -> None:
+        """
+        Open the listening socket, if it is not open yet, so that `url` is known
+        before serving.
+        """
+        if self._server is not None:
+            return
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Passes each request to the fake server."""
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args): # pylint: disable=redefined-builtin
+                pass
+
+            def handle_one_request(self):
+                try:
+                    super().handle_one_request()
+                except ConnectionError:
+                    self.close_connection = True
+
+            def do_request(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, headers, body = server.handle(self.command, self.path, self.headers, body)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_request
+
+        self._server = _ThreadingHTTPServer((self.host, self.port), Handler)
+
+    def _route(self, method: str, path: str) -> tuple:
+        allowed = False
+        for route_method, pattern, template, handler in self.routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method == method:
+                params = {name: unquote(value) for name, value in match.groupdict().items()}
+                return '{0} {1}'.format(method, template), handler, params
+            allowed = True
+        if allowed:
+            raise FakeError(405, 'method_not_allowed', 'Method {0} not allowed for {1}'.format(method, path))
+        raise FakeError(404, 'not_found', 'No route for {0} {1}'.format(method, path))
+
+    def _json(self, status: int, document: Dict) -> Tuple[int, Dict[str, str], bytes]:
+        return status, {'Content-Type': 'application/json'}, json.dumps(document).encode('utf-8')
+
+    def _count(self, route: str, status: int, headers: Dict[str, str], body: bytes) -> tuple:
+        with self._stats_lock:
+            self.stats['{0} {1}'.format(route, status)] += 1
+        return status, headers, body
@@ -0,0 +1,555 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory state of the fake Cloud Databases API.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+import copy
+import datetime
+import ipaddress
+import random
+import threading
+import time
+import uuid
+
+ACCOUNT = '274074dce64e9c423ffc238516c755e1'
+USER_TYPES = ('database', 'ops_manager')
+ENDPOINT_TYPES = ('public', 'private')
+REGIONS = ['au-syd', 'eu-de', 'eu-gb', 'jp-tok', 'us-east', 'us-south']
+VERSIONS = {
+    'postgresql': ['10', '11', '12'],
+    'redis': ['5', '6'],
+    'mongodb': ['4.0', '4.2'],
+    'elasticsearch': ['6.8', '7.9'],
+    'etcd': ['3.3'],
+    'rabbitmq': ['3.8'],
+}
+CERTIFICATE = 'LS0tLS1CRUdJTiBDRVJUSUZJQ0FURS0tLS0tCk1JSURIVENDQWdXZ0F3SUJBZ0lVWEN' * 24
+GROUP_IDS = ('member', 'analytics', 'bi_connector')
+# The attribute of each resource of a scaling group that a resize sets.
+ALLOCATIONS = {'members': 'allocation_count', 'memory': 'allocation_mb', 'cpu': 'allocation_count',
+               'disk': 'allocation_mb'}
+
+
+class FakeError(Exception):
+    """
+    An error response of the fake API.
+
+    :attr int status: HTTP status code.
+    :attr str code: Error code reported in the body.
+    :attr dict headers: Additional response headers.
+    """
+
+    def __init__(self, status: int, code: str, message: str, *, headers: Dict[str, str] = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+        self.headers = headers or {}
+
+    def to_dict(self) -> Dict:
+        """Return the body of the error response."""
+        return {'errors': [{'code': self.code, 'message': self.message}], 'trace': str(uuid.uuid4())}
+
+
+def deployables_json() -> Dict:
+    """The result of list_deployables."""
+    return {'deployables': [{'type': kind, 'versions': [
+        {'version': version, 'status': 'stable', 'is_preferred': version == versions[-1],
+         'transitions': [{'application': kind, 'method': 'restore', 'from_version': version,
+                          'to_version': versions[-1]}] if version != versions[-1] else []}
+        for version in versions]} for kind, versions in VERSIONS.items()]}
+
+
+def groups_json() -> Dict:
+    """The scaling groups of a new deployment."""
+    def resource(units, suffix, allocation, minimum, maximum, step):
+        return {'units': units, 'allocation_' + suffix: allocation, 'minimum_' + suffix: minimum,
+                'maximum_' + suffix: maximum, 'step_size_' + suffix: step, 'is_adjustable': True,
+                'is_optional': False, 'can_scale_down': suffix == 'count'}
+    return {'groups': [{
+        'id': group_id,
+        'count': 3,
+        'members': resource('count', 'count', 3, 3, 20, 1),
+        'memory': resource('mb', 'mb', 12288, 3072, 344064, 384),
+        'cpu': resource('count', 'count', 6, 6, 96, 3),
+        'disk': resource('mb', 'mb', 30720, 15360, 12582912, 3072),
+    } for group_id in GROUP_IDS]}
+
+
+def autoscaling_json() -> Dict:
+    """The autoscaling settings of a new scaling group."""
+    rate = {'increase_percent': 20, 'period_seconds': 900, 'limit_mb_per_member': 3670016, 'units': 'mb'}
+    return {'autoscaling': {
+        'disk': {'scalers': {'capacity': {'enabled': True, 'free_space_less_than_percent': 10},
+                             'io_utilization': {'enabled': True, 'over_period': '30m', 'above_percent': 45}},
+                 'rate': rate},
+        'memory': {'scalers': {'io_utilization': {'enabled': True, 'over_period': '30m', 'above_percent': 45}},
+                   'rate': dict(rate)},
+        'cpu': {'scalers': {}, 'rate': {'increase_percent': 10, 'period_seconds': 900,
+                                        'limit_count_per_member': 10, 'units': 'count'}},
+    }}
+
+
+def connection_json(hostname: str, username: str, password: Optional[str] = None) -> Dict:
+    """The PostgreSQL connection information of a deployment."""
+    hosts = [{'hostname': '{0}-{1}.{2}'.format(hostname.split('.')[0], i, hostname.split('.', 1)[-1]),
+              'port': 31863} for i in range(3)]
+    certificate = {'name': '5bd1d2a2-3b1c-11e9-9a5b-1e5d9fe9ab4c', 'certificate_base64': CERTIFICATE}
+    return {'connection': {
+        'postgres': {
+            'type': 'uri',
+            'composed': ['postgres://{0}:{1}@{2}:31863/ibmclouddb?sslmode=verify-full'.format(
+                username, password or '$PASSWORD', host['hostname']) for host in hosts],
+            'scheme': 'postgres',
+            'hosts': hosts,
+            'path': '/ibmclouddb',
+            'query_options': {'sslmode': 'verify-full'},
+            'authentication': {'method': 'direct', 'username': username, 'password': password},
+            'certificate': certificate,
+            'database': 'ibmclouddb',
+        },
+        'cli': {
+            'type': 'cli',
+            'composed': ['PGPASSWORD=$PASSWORD PGSSLROOTCERT=5bd1d2a2 psql "host={0} port=31863 dbname=ibmclouddb '
+                         'user={1} sslmode=verify-full"'.format(hosts[0]['hostname'], username)],
+            'environment': {'PGPASSWORD': password or '$PASSWORD', 'PGSSLROOTCERT': '5bd1d2a2'},
+            'bin': 'psql',
+            'arguments': [['host={0} port=31863 dbname=ibmclouddb user={1} sslmode=verify-full'.format(
+                host['hostname'], username)] for host in hosts],
+            'certificate': certificate,
+        },
+    }}
+
+
+def timestamp(seconds: float) -> str:
+    """Format a POSIX time as the API does."""
+    value = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc)
+    return value.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+class FakeState():
+    """
+    The deployments, users, allowlists, scaling groups, backups and tasks of the fake
+    API, safe to use from several threads.
+
+    Changes are visible as soon as the request that makes them returns. The task
+    returned by the request runs for `task_duration` seconds, reporting its progress,
+    and on-demand backups are only completed when their task completes.
+
+    :attr List[str] deployment_ids: IDs of the deployments, in creation order.
+    """
+
+    def __init__(self,
+                 *,
+                 deployments: int = 1,
+                 deployment_type: str = 'postgresql',
+                 backups: int = 3,
+                 allowlist_entries: int = 2,
+                 task_duration: float = 2.0,
+                 task_failure_rate: float = 0.0,
+                 auto_create: bool = False,
+                 seed: int = None,
+                 clock: Callable[[], float] = time.time) -> None:
+        """
+        :param int deployments: (optional) Number of deployments to create.
+        :param str deployment_type: (optional) Type of the deployments.
+        :param int backups: (optional) Number of scheduled backups of each deployment.
+        :param int allowlist_entries: (optional) Number of allowlist entries of each
+               deployment.
+        :param float task_duration: (optional) Number of seconds a task runs for.
+        :param float task_failure_rate: (optional) Fraction of tasks that fail.
+        :param bool auto_create: (optional) Create a deployment the first time an
+               unknown ID is used, instead of answering 404.
+        :param int seed: (optional) Seed of the generated IDs and task failures.
+        :param clock: (optional) Returns the current POSIX time.
+        """
+        if deployment_type not in VERSIONS:
+            raise ValueError('Unknown deployment type: {0}'.format(deployment_type))
+        self.deployment_type = deployment_type
+        self.backups_per_deployment = backups
+        self.allowlist_entries = allowlist_entries
+        self.task_duration = task_duration
+        self.task_failure_rate = task_failure_rate
+        self.auto_create = auto_create
+        self.clock = clock
+        self.deployment_ids = []
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._deployments = {}
+        self._tasks = {}
+        self._running = set()
+        self._backups = {}
+        for _ in range(deployments):
+            self.create_deployment()
+
+    def create_deployment(self, id: str = None) -> str:
+        """
+        Create a deployment.
+
+        :param str id: (optional) ID of the deployment; a CRN is generated by default.
+        :return: The ID of the deployment.
+        """
+        with self._lock:
+            if id is None:
+                id = 'crn:v1:bluemix:public:databases-for-{0}:us-south:a/{1}:{2}::'.format(
+                    self.deployment_type, ACCOUNT, self._uuid())
+            now = self.clock()
+            groups = groups_json()['groups']
+            self._deployments[id] = {
+                'id': id,
+                'name': 'fake-{0}-{1}'.format(self.deployment_type, len(self._deployments) + 1),
+                'hostname': '{0}.databases.appdomain.cloud'.format(self._uuid()),
+                'version': VERSIONS[self.deployment_type][-1],
+                'users': {'database': {'admin': None}, 'ops_manager': {}},
+                'configuration': {},
+                'groups': {group['id']: group for group in groups},
+                'autoscaling': {group['id']: autoscaling_json()['autoscaling'] for group in groups},
+                'allowlist': [{'address': '10.{0}.{1}.0/24'.format(i // 256 % 256, i % 256),
+                               'description': 'Application subnet {0}'.format(i)}
+                              for i in range(self.allowlist_entries)],
+                'allowlist_version': 1,
+                'backups': [],
+                'tasks': [],
+                'created_at': now,
+            }
+            for i in range(self.backups_per_deployment):
+                self._add_backup(id, 'scheduled', now - 86400 * (self.backups_per_deployment - i))
+            self.deployment_ids.append(id)
+            return id
+
+    def get_deployment(self, id: str) -> Dict:
+        """Return the result of get_deployment_info."""
+        with self._lock:
+            deployment = self._deployment(id)
+            return {'deployment': {
+                'id': deployment['id'],
+                'name': deployment['name'],
+                'type': self.deployment_type,
+                'version': deployment['version'],
+                'platform_options': {'disk_encryption_key_crn': None, 'backup_encryption_key_crn': None},
+                'admin_usernames': {'database': 'admin'},
+                'enable_public_endpoints': True,
+                'enable_private_endpoints': False,
+            }}
+
+    def create_user(self, id: str, user_type: str, user: Dict) -> Dict:
+        """Create a user and return a task."""
+        with self._lock:
+            users = self._users(id, user_type)
+            username = (user or {}).get('username')
+            if not username or not user.get('password'):
+                raise FakeError(400, 'bad_request', 'user.username and user.password are required')
+            if username in users:
+                raise FakeError(422, 'unprocessable_entity', 'User {0} already exists'.format(username))
+            users[username] = user['password']
+            return self._start_task(id, 'Creating user.')
+
+    def change_user_password(self, id: str, user_type: str, username: str, user: Dict) -> Dict:
+        """Change the password of a user and return a task."""
+        with self._lock:
+            users = self._users(id, user_type)
+            if username not in users:
+                raise FakeError(404, 'not_found', 'User {0} not found'.format(username))
+            if not (user or {}).get('password'):
+                raise FakeError(400, 'bad_request', 'user.password is required')
+            users[username] = user['password']
+            return self._start_task(id, 'Changing user password.')
+
+    def delete_user(self, id: str, user_type: str, username: str) -> Dict:
+        """Delete a user and return a task."""
+        with self._lock:
+            users = self._users(id, user_type)
+            if users.pop(username, False) is False:
+                raise FakeError(404, 'not_found', 'User {0} not found'.format(username))
+            return self._start_task(id, 'Deleting user.')
+
+    def update_configuration(self, id: str, configuration: Dict) -> Dict:
+        """Update the database configuration and return a task."""
+        with self._lock:
+            deployment = self._deployment(id)
+            if not isinstance(configuration, dict):
+                raise FakeError(400, 'bad_request', 'configuration is required')
+            deployment['configuration'].update(configuration)
+            return self._start_task(id, 'Applying configuration changes.')
+
+    def list_remotes(self, id: str) -> Dict:
+        """Return the result of list_remotes."""
+        with self._lock:
+            self._deployment(id)
+            return {'remotes': {'leader': '', 'replicas': []}}
+
+    def start_deployment_task(self, id: str, description: str) -> Dict:
+        """Start a task without other effect, such as a replica resync."""
+        with self._lock:
+            self._deployment(id)
+            return self._start_task(id, description)
+
+    def list_tasks(self, id: str) -> Dict:
+        """Return the result of list_deployment_tasks."""
+        with self._lock:
+            deployment = self._deployment(id)
+            self._advance()
+            return {'tasks': [copy.deepcopy(self._tasks[task_id]['json']) for task_id in deployment['tasks']]}
+
+    def get_task(self, task_id: str) -> Dict:
+        """Return the result of get_task."""
+        with self._lock:
+            self._advance()
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise FakeError(404, 'not_found', 'Task {0} not found'.format(task_id))
+            return {'task': copy.deepcopy(task['json'])}
+
+    def get_backup(self, backup_id: str) -> Dict:
+        """Return the result of get_backup_info."""
+        with self._lock:
+            self._advance()
+            backup = self._backups.get(backup_id)
+            if backup is None:
+                raise FakeError(404, 'not_found', 'Backup {0} not found'.format(backup_id))
+            return {'backup': dict(backup)}
+
+    def list_backups(self, id: str) -> Dict:
+        """Return the result of list_deployment_backups."""
+        with self._lock:
+            deployment = self._deployment(id)
+            self._advance()
+            return {'backups': [dict(self._backups[backup_id]) for backup_id in deployment['backups']]}
+
+    def start_backup(self, id: str) -> Dict:
+        """Start an on-demand backup and return its task."""
+        with self._lock:
+            self._deployment(id)
+            backup = self._add_backup(id, 'on_demand', self.clock(), status='running')
+
+            def complete(succeeded: bool) -> None:
+                backup['status'] = 'completed' if succeeded else 'failed'
+                backup['is_downloadable'] = backup['is_restorable'] = succeeded
+            return self._start_task(id, 'Creating backup for deployment.', on_complete=complete)
+
+    def get_pitr(self, id: str) -> Dict:
+        """Return the result of get_pit_rdata."""
+        with self._lock:
+            deployment = self._deployment(id)
+            return {'earliest_point_in_time_recovery_time': timestamp(deployment['created_at'])}
+
+    def get_connection(self,
+                       id: str,
+                       user_type: str,
+                       user_id: str,
+                       endpoint_type: str,
+                       *,
+                       password: str = None) -> Dict:
+        """Return the result of get_connection, or of complete_connection."""
+        with self._lock:
+            deployment = self._deployment(id)
+            if user_id not in self._users(id, user_type):
+                raise FakeError(404, 'not_found', 'User {0} not found'.format(user_id))
+            if endpoint_type not in ENDPOINT_TYPES:
+                raise FakeError(400, 'bad_request', 'Unknown endpoint type {0}'.format(endpoint_type))
+            hostname = deployment['hostname']
+            if endpoint_type == 'private':
+                hostname = hostname.replace('.databases.', '.private.databases.')
+            return connection_json(hostname, user_id, password)
+
+    def list_groups(self, id: str) -> Dict:
+        """Return the result of list_deployment_scaling_groups."""
+        with self._lock:
+            deployment = self._deployment(id)
+            return {'groups': copy.deepcopy(list(deployment['groups'].values()))}
+
+    def default_groups(self, type: str) -> Dict:
+        """Return the result of get_default_scaling_groups."""
+        if type not in VERSIONS:
+            raise FakeError(404, 'not_found', 'Unknown deployment type {0}'.format(type))
+        return groups_json()
+
+    def set_group(self, id: str, group_id: str, group: Dict) -> Dict:
+        """Resize a scaling group and return a task."""
+        with self._lock:
+            current = self._group(id, group_id)
+            if not isinstance(group, dict) or not group:
+                raise FakeError(400, 'bad_request', 'One of members, memory, cpu or disk is required')
+            changes = {}
+            for name, settings in group.items():
+                attribute = ALLOCATIONS.get(name)
+                if attribute is None or not isinstance(settings, dict) or attribute not in settings:
+                    raise FakeError(400, 'bad_request', 'Invalid scaling of {0}'.format(name))
+                resource = current[name]
+                suffix = attribute[len('allocation_'):]
+                value = settings[attribute]
+                if not resource['minimum_' + suffix] <= value <= resource['maximum_' + suffix] or \
+                        (value - resource['minimum_' + suffix]) % resource['step_size_' + suffix]:
+                    raise FakeError(422, 'unprocessable_entity', '{0}.{1} must be a step of {2} between {3} and {4}'
+                                    .format(name, attribute, resource['step_size_' + suffix],
+                                            resource['minimum_' + suffix], resource['maximum_' + suffix]))
+                changes[name] = (attribute, value)
+            for name, (attribute, value) in changes.items():
+                current[name][attribute] = value
+            if 'members' in changes:
+                current['count'] = changes['members'][1]
+            return self._start_task(id, 'Scaling deployment.')
+
+    def get_autoscaling(self, id: str, group_id: str) -> Dict:
+        """Return the result of get_autoscaling_conditions."""
+        with self._lock:
+            self._group(id, group_id)
+            return {'autoscaling': copy.deepcopy(self._deployments[id]['autoscaling'][group_id])}
+
+    def set_autoscaling(self, id: str, group_id: str, autoscaling: Dict) -> Dict:
+        """Update the autoscaling settings of a scaling group and return a task."""
+        with self._lock:
+            self._group(id, group_id)
+            if not isinstance(autoscaling, dict):
+                raise FakeError(400, 'bad_request', 'autoscaling is required')
+            current = self._deployments[id]['autoscaling'][group_id]
+            for resource, settings in autoscaling.items():
+                current.setdefault(resource, {}).update(copy.deepcopy(settings))
+            return self._start_task(id, 'Setting autoscaling conditions.')
+
+    def get_allowlist(self, id: str) -> Tuple[Dict, str]:
+        """Return the result of get_allowlist and its ETag."""
+        with self._lock:
+            deployment = self._deployment(id)
+            return {'ip_addresses': copy.deepcopy(deployment['allowlist'])}, self.allowlist_etag(id)
+
+    def allowlist_etag(self, id: str) -> str:
+        """Return the ETag of the current allowlist of a deployment."""
+        with self._lock:
+            return '"{0}"'.format(self._deployment(id)['allowlist_version'])
+
+    def set_allowlist(self, id: str, ip_addresses: List[Dict], *, if_match: str = None) -> Dict:
+        """Replace the allowlist and return a task."""
+        with self._lock:
+            deployment = self._deployment(id)
+            if if_match is not None and if_match != self.allowlist_etag(id):
+                raise FakeError(412, 'precondition_failed', 'The allowlist was modified')
+            entries = [self._allowlist_entry(entry) for entry in ip_addresses or []]
+            addresses = [entry['address'] for entry in entries]
+            if len(set(addresses)) != len(addresses):
+                raise FakeError(422, 'unprocessable_entity', 'Duplicate addresses in the allowlist')
+            deployment['allowlist'] = entries
+            deployment['allowlist_version'] += 1
+            return self._start_task(id, 'Updating allowlist.')
+
+    def add_allowlist_entry(self, id: str, ip_address: Dict) -> Dict:
+        """Add an allowlist entry and return a task."""
+        with self._lock:
+            deployment = self._deployment(id)
+            entry = self._allowlist_entry(ip_address)
+            if any(existing['address'] == entry['address'] for existing in deployment['allowlist']):
+                raise FakeError(422, 'unprocessable_entity', '{0} is already allowed'.format(entry['address']))
+            deployment['allowlist'].append(entry)
+            deployment['allowlist_version'] += 1
+            return self._start_task(id, 'Adding allowlist entry.')
+
+    def delete_allowlist_entry(self, id: str, address: str) -> Dict:
+        """Delete an allowlist entry and return a task."""
+        with self._lock:
+            deployment = self._deployment(id)
+            entries = [entry for entry in deployment['allowlist'] if entry['address'] != address]
+            if len(entries) == len(deployment['allowlist']):
+                raise FakeError(404, 'not_found', '{0} is not in the allowlist'.format(address))
+            deployment['allowlist'] = entries
+            deployment['allowlist_version'] += 1
+            return self._start_task(id, 'Deleting allowlist entry.')
+
+    def _deployment(self, id: str) -> Dict:
+        deployment = self._deployments.get(id)
+        if deployment is None:
+            if not self.auto_create:
+                raise FakeError(404, 'not_found', 'Deployment {0} not found'.format(id))
+            self.create_deployment(id)
+            deployment = self._deployments[id]
+        return deployment
+
+    def _users(self, id: str, user_type: str) -> Dict:
+        deployment = self._deployment(id)
+        if user_type not in USER_TYPES:
+            raise FakeError(400, 'bad_request', 'Unknown user type {0}'.format(user_type))
+        return deployment['users'][user_type]
+
+    def _group(self, id: str, group_id: str) -> Dict:
+        group = self._deployment(id)['groups'].get(group_id)
+        if group is None:
+            raise FakeError(404, 'not_found', 'Group {0} not found'.format(group_id))
+        return group
+
+    def _allowlist_entry(self, entry: Dict) -> Dict:
+        address = (entry or {}).get('address')
+        try:
+            ipaddress.ip_network(address or '')
+        except ValueError:
+            raise FakeError(422, 'unprocessable_entity', 'Invalid address: {0}'.format(address))
+        return {'address': address, 'description': entry.get('description') or ''}
+
+    def _add_backup(self, id: str, backup_type: str, created: float, status: str = 'completed') -> Dict:
+        backup = {
+            'id': '{0}backup:{1}'.format(id, self._uuid()),
+            'deployment_id': id,
+            'type': backup_type,
+            'status': status,
+            'is_downloadable': status == 'completed',
+            'is_restorable': status == 'completed',
+            'created_at': timestamp(created),
+        }
+        self._backups[backup['id']] = backup
+        self._deployments[id]['backups'].append(backup['id'])
+        return backup
+
+    def _start_task(self, id: str, description: str, *, on_complete: Callable[[bool], None] = None) -> Dict:
+        now = self.clock()
+        task = {
+            'json': {
+                'id': '{0}task:{1}'.format(id, self._uuid()),
+                'description': description,
+                'status': 'running',
+                'deployment_id': id,
+                'progress_percent': 0,
+                'created_at': timestamp(now),
+            },
+            'started': now,
+            'fails': self._random.random() < self.task_failure_rate,
+            'on_complete': on_complete,
+        }
+        self._tasks[task['json']['id']] = task
+        self._running.add(task['json']['id'])
+        self._deployments[id]['tasks'].append(task['json']['id'])
+        self._advance()
+        return {'task': copy.deepcopy(task['json'])}
+
+    def _advance(self) -> None:
+        """
+        Update the status and progress of the running tasks.
+        """
+        now = self.clock()
+        for task_id in list(self._running):
+            task = self._tasks[task_id]
+            elapsed = now - task['started']
+            if elapsed < self.task_duration:
+                task['json']['progress_percent'] = int(100 * elapsed / self.task_duration)
+                continue
+            self._running.discard(task_id)
+            task['json']['status'] = 'failed' if task['fails'] else 'completed'
+            task['json']['progress_percent'] = 100
+            if task['on_complete'] is not None:
+                task['on_complete'](not task['fails'])
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
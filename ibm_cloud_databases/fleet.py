@@ -0,0 +1,205 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Run one Cloud Databases operation across many deployments concurrently.
+"""
+
+from concurrent import futures
+from typing import Iterable, Iterator, Tuple, Union
+import inspect
+
+from ibm_cloud_sdk_core import BaseService, DetailedResponse
+
+from .cloud_databases_v5 import CloudDatabasesV5
+from .deadlines import Deadline
+from .pooling import ConnectionPool
+
+FleetResult = Tuple[str, Union[DetailedResponse, Exception]]
+
+
+class FleetExecutor():
+    """
+    Calls one operation of a CloudDatabasesV5 client for each deployment in a list,
+    on a bounded pool of threads.
+
+    All calls go through the same client, and therefore share its HTTP session and
+    connection pool; the pool is grown so that every worker can keep a connection
+    alive. Results are streamed back as `(deployment_id, outcome)` pairs, where the
+    outcome is the `DetailedResponse` of the call, or the exception it raised
+    (usually an `ApiException`). Failures never stop the other calls.
+
+    Example::
+
+        with FleetExecutor(service, max_workers=32) as fleet:
+            for deployment_id, outcome in fleet.run('get_deployment_info', deployment_ids):
+                ...
+    """
+
+    def __init__(self,
+                 service: CloudDatabasesV5,
+                 *,
+                 max_workers: int = 16,
+                 timeout: float = None) -> None:
+        """
+        Construct a fleet executor.
+
+        :param CloudDatabasesV5 service: The client used for every call.
+        :param int max_workers: (optional) Maximum number of calls in flight.
+        :param float timeout: (optional) Default number of seconds to wait for each
+               call, see `run()`.
+        """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.service = service
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                    thread_name_prefix='cloud-databases-fleet')
+
+    def __enter__(self) -> 'FleetExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the worker threads once the calls in flight have finished.
+        """
+        self._executor.shutdown(wait=True)
+
+    def run(self,
+            operation: str,
+            deployment_ids: Iterable[str],
+            *,
+            ordered: bool = False,
+            timeout: float = None,
+            **kwargs) -> Iterator[FleetResult]:
+        """
+        Call an operation once for each deployment.
+
+        The deployment ID is passed as the first argument of the operation, followed
+        by the other keyword arguments, e.g. `run('get_connection', ids,
+        user_type='database', user_id='admin', endpoint_type='public')`. At most
+        `max_workers` calls are in flight, and deployments are only read from
+        `deployment_ids` as workers become free.
+
+        :param str operation: Name of the CloudDatabasesV5 operation to call.
+        :param Iterable[str] deployment_ids: IDs of the deployments.
+        :param bool ordered: (optional) Yield results in the order of
+               `deployment_ids` instead of as soon as each call finishes.
+        :param float timeout: (optional) Number of seconds each call may take from
+               the time it starts. It is passed to the operation as a `deadline`,
+               together with the one in the keyword arguments, if any. A call that
+               takes longer is reported with a `DeadlineExceededError`, and is no
+               longer waited for if it does not return at its deadline.
+        :return: An iterator of `(deployment_id, DetailedResponse or exception)`.
+        """
+        method = getattr(self.service, operation, None)
+        if operation.startswith('_') or hasattr(BaseService, operation) or not callable(method) or \
+                inspect.signature(method).return_annotation is not DetailedResponse:
+            raise ValueError('{0} is not an operation of {1}'.format(operation, type(self.service).__name__))
+        if timeout is None:
+            timeout = self.timeout
+        _grow_connection_pool(self.service, self.max_workers)
+
+        pending = iter(enumerate(deployment_ids))
+        in_flight = {}
+        finished = {}
+        next_index = 0
+
+        def call(deployment_id: str, deadlines: list) -> DetailedResponse:
+            # The deadline is set when the call starts rather than when it is
+            # submitted, since it may wait for a worker still busy with a call that
+            # was no longer waited for.
+            deadline = Deadline(timeout, deadline=kwargs.get('deadline'))
+            deadlines.append(deadline)
+            return method(deployment_id, **dict(kwargs, deadline=deadline))
+
+        def submit() -> bool:
+            try:
+                index, deployment_id = next(pending)
+            except StopIteration:
+                return False
+            deadlines = []
+            if timeout is None:
+                future = self._executor.submit(method, deployment_id, **kwargs)
+            else:
+                future = self._executor.submit(call, deployment_id, deadlines)
+            in_flight[future] = (index, deployment_id, deadlines)
+            return True
+
+        while len(in_flight) < self.max_workers and submit():
+            pass
+
+        while in_flight:
+            wait_for = None
+            if timeout is not None:
+                started = [deadlines[0] for (_, _, deadlines) in in_flight.values() if deadlines]
+                # A call that has not started yet cannot expire before the timeout.
+                wait_for = min([deadline.remaining() for deadline in started] +
+                               ([timeout] if len(started) < len(in_flight) else []))
+                wait_for = max(wait_for, 0)
+            done, _ = futures.wait(in_flight, timeout=wait_for, return_when=futures.FIRST_COMPLETED)
+
+            results = []
+            for future in done:
+                index, deployment_id, _ = in_flight.pop(future)
+                try:
+                    outcome = future.result()
+                except Exception as err: # pylint: disable=broad-except
+                    outcome = err
+                results.append((index, deployment_id, outcome))
+            if timeout is not None:
+                for future, (index, deployment_id, deadlines) in list(in_flight.items()):
+                    if deadlines and deadlines[0].expired():
+                        del in_flight[future]
+                        results.append((index, deployment_id, deadlines[0].exceeded()))
+
+            for _ in results:
+                submit()
+            results.sort(key=lambda result: result[0])
+            if not ordered:
+                for _, deployment_id, outcome in results:
+                    yield deployment_id, outcome
+                continue
+            for index, deployment_id, outcome in results:
+                finished[index] = (deployment_id, outcome)
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+
+
+def _grow_connection_pool(service: CloudDatabasesV5, size: int) -> None:
+    """
+    Make sure the connection pools of the service's HTTP session can hold `size`
+    connections per host, so that concurrent workers reuse their connections.
+    """
+    if service.service_url is None:
+        return
+    adapter = service.get_http_client().get_adapter(service.service_url)
+    connection_pool = getattr(adapter, 'connection_pool', None)
+    if isinstance(connection_pool, ConnectionPool):
+        # The adapter of a pool shared with other clients is resized by its pool.
+        if connection_pool.maxsize < size:
+            connection_pool.resize(size)
+        return
+    # pylint: disable=protected-access
+    if getattr(adapter, '_pool_maxsize', size) < size:
+        poolmanager = adapter.poolmanager
+        adapter.init_poolmanager(adapter._pool_connections, size, block=adapter._pool_block)
+        poolmanager.clear()
@@ -0,0 +1,316 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hedging of slow GET requests.
+
+When a GET request has not been answered after a percentile of the recent
+latencies of its operation, e.g. the 95th, an identical request is sent and the
+first successful response of the two is used. A few percent more requests then
+cut the tail of the latency, since the second request rarely meets the delay that
+held up the first.
+
+The number of hedges is bounded by a budget: every request earns a fraction of a
+hedge, so that hedges never exceed that fraction of the requests, even when the
+service slows down as a whole.
+
+Requests that may be hedged, and their hedges, are sent from a pool of at most
+`max_workers` threads of the policy. When all of them are busy, requests are sent
+from the caller's thread without a hedge.
+
+Example::
+
+    service.enable_hedging(HedgingPolicy(operations=['get_connection', 'get_deployment_info']))
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Iterable, Optional
+import threading
+import time
+
+try:
+    import contextvars
+except ImportError: # Python 3.6
+    contextvars = None
+
+from .deadlines import Deadline
+from .metrics import LatencyHistogram
+
+
+class HedgingPolicy():
+    """
+    Decides when a GET request is hedged, and races the request and its hedge.
+
+    :attr float quantile: Quantile of the recent latencies after which a request
+          is hedged.
+    :attr float budget: Greatest ratio of hedges to requests.
+    :attr int requests: Number of requests that could be hedged.
+    :attr int hedged: Number of hedges sent.
+    :attr int wins: Number of hedges answered before their request.
+    :attr int max_workers: Greatest number of threads sending requests and hedges.
+    """
+
+    def __init__(self,
+                 *,
+                 quantile: float = 0.95,
+                 budget: float = 0.05,
+                 max_tokens: float = 10.0,
+                 min_delay: float = 0.001,
+                 min_samples: int = 20,
+                 window: int = 1000,
+                 operations: Iterable[str] = None,
+                 max_workers: int = 16) -> None:
+        """
+        :param float quantile: (optional) Quantile of the recent latencies of an
+               operation after which its requests are hedged.
+        :param float budget: (optional) Greatest ratio of hedges to requests: each
+               request earns this fraction of a hedge.
+        :param float max_tokens: (optional) Greatest number of hedges that can be
+               saved up during a quiet period and sent in a row.
+        :param float min_delay: (optional) Shortest delay before a hedge, in seconds.
+        :param int min_samples: (optional) Number of latencies an operation must
+               have recorded before its requests are hedged.
+        :param int window: (optional) Number of latencies after which the oldest are
+               forgotten; between one and two windows are kept.
+        :param Iterable[str] operations: (optional) The operations whose requests
+               are hedged; every GET operation by default.
+        :param int max_workers: (optional) Greatest number of threads sending
+               requests and their hedges; a request and its hedge take two.
+        """
+        if not 0 < quantile < 1:
+            raise ValueError('quantile must be between 0 and 1')
+        if not 0 < budget < 1:
+            raise ValueError('budget must be between 0 and 1')
+        if max_tokens < 1:
+            raise ValueError('max_tokens must be at least 1')
+        if window < min_samples:
+            raise ValueError('window must be at least min_samples')
+        if max_workers < 2:
+            raise ValueError('max_workers must be at least 2')
+        self.quantile = quantile
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.operations = frozenset(operations) if operations is not None else None
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+        self.max_workers = max_workers
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._workers = threading.BoundedSemaphore(max_workers)
+        self._executor = None
+
+    def applies(self, operation_id: Optional[str], method: str) -> bool:
+        """
+        Return whether the requests of an operation are hedged.
+        """
+        return method == 'GET' and (self.operations is None or operation_id in self.operations)
+
+    def hedge_delay(self, operation_id: Optional[str]) -> Optional[float]:
+        """
+        Return the number of seconds after which a request of an operation is
+        hedged, or None while too few of its latencies were recorded.
+        """
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+        if latencies is None:
+            return None
+        current, previous = latencies
+        histogram = current if previous is None or current.count >= self.min_samples else previous
+        if histogram.count < self.min_samples:
+            return None
+        return max(histogram.value_at_quantile(self.quantile), self.min_delay)
+
+    def record(self, operation_id: Optional[str], seconds: float) -> None:
+        """
+        Record the latency of a successful request of an operation.
+        """
+        with self._lock:
+            latencies = self._latencies.get(operation_id)
+            if latencies is None or latencies[0].count >= self.window:
+                # Start a new window, keeping the last one until it fills up.
+                latencies = self._latencies[operation_id] = (
+                    LatencyHistogram(), latencies[0] if latencies is not None else None)
+        latencies[0].record(seconds)
+
+    def call(self,
+             operation_id: Optional[str],
+             attempt: Callable[[], Any],
+             *,
+             deadline: Deadline = None) -> Any:
+        """
+        Call a request in a thread of the policy, and call it again in another one
+        if it has not returned after the hedge delay, returning the first
+        successful result.
+
+        :param str operation_id: Name of the operation sending the request.
+        :param callable attempt: Sends the request; it is called at most twice,
+               concurrently.
+        :param Deadline deadline: (optional) The deadline of the request, after
+               which neither call is waited for.
+        :raises Exception: The exception of the request, if both calls fail.
+        :raises DeadlineExceededError: Neither call returned before the deadline.
+        """
+        delay = self._start(operation_id)
+        if delay is None:
+            return self._timed(operation_id, attempt)
+        if deadline is not None and delay >= deadline.remaining():
+            # There is no time left for the hedge to win.
+            return self._timed(operation_id, attempt)
+        if not self._workers.acquire(blocking=False):
+            # Every thread is busy.
+            return self._timed(operation_id, attempt)
+        primary = self._submit(self._timed, operation_id, attempt)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._workers.acquire(blocking=False):
+            return _result(primary, deadline)
+        if not self._take_token():
+            self._workers.release()
+            return _result(primary, deadline)
+        hedge = self._submit(self._timed, operation_id, attempt)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending,
+                                 timeout=max(deadline.remaining(), 0) if deadline is not None else None,
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                raise deadline.exceeded()
+            for future in done:
+                if future.exception() is None:
+                    # A thread cannot be cancelled: the other request runs on and
+                    # its result is dropped.
+                    return self._won(future is hedge, future.result())
+        return primary.result()
+
+    def close(self) -> None:
+        """
+        Stop the threads of the policy once their requests return. It starts new
+        ones when it is used again.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def call_async(self, operation_id: Optional[str], attempt: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await a request, and send it again in another task if it has not been
+        answered after the hedge delay, returning the first successful result and
+        cancelling the other request.
+
+        :param str operation_id: Name of the operation sending the request.
+        :param callable attempt: Returns the awaitable request; it is called at most
+               twice.
+        :raises Exception: The exception of the request, if both fail.
+        """
+        import asyncio # pylint: disable=import-outside-toplevel
+        delay = self._start(operation_id)
+        if delay is None:
+            return await self._timed_async(operation_id, attempt)
+        primary = asyncio.ensure_future(self._timed_async(operation_id, attempt))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._take_token():
+                return await primary
+            hedge = asyncio.ensure_future(self._timed_async(operation_id, attempt))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return self._won(succeeded[0] is hedge, succeeded[0].result())
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _start(self, operation_id: Optional[str]) -> Optional[float]:
+        """
+        Count a request, earning its part of a hedge, and return its hedge delay.
+        """
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self._tokens + self.budget, self.max_tokens)
+        return self.hedge_delay(operation_id)
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        """
+        Call a function in a thread of the policy, once a thread was acquired for
+        it, in the context of the caller so that its spans have the same parent.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='HedgingPolicy')
+            executor = self._executor
+        if contextvars is not None:
+            fn, args = contextvars.copy_context().run, (fn,) + args
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._workers.release()
+            raise
+        future.add_done_callback(lambda _: self._workers.release())
+        return future
+
+    def _take_token(self) -> bool:
+        """
+        Spend a hedge of the budget, if there is one left.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def _won(self, hedge: bool, result: Any) -> Any:
+        if hedge:
+            with self._lock:
+                self.wins += 1
+        return result
+
+    def _timed(self, operation_id: Optional[str], attempt: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = attempt()
+        self.record(operation_id, time.perf_counter() - start)
+        return result
+
+    async def _timed_async(self, operation_id: Optional[str], attempt: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.perf_counter()
+        result = await attempt()
+        self.record(operation_id, time.perf_counter() - start)
+        return result
+
+
+def _result(future: Future, deadline: Optional[Deadline]) -> Any:
+    """
+    Wait for the result of a call until the deadline, if any.
+    """
+    if deadline is None:
+        return future.result()
+    done, _ = wait([future], timeout=max(deadline.remaining(), 0))
+    if not done:
+        raise deadline.exceeded()
+    return future.result()
+
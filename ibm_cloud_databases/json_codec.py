@@ -0,0 +1,142 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON encoders and decoders for request and response bodies.
+
+Bodies are encoded straight to, and decoded straight from, `bytes`. The `orjson`
+and `ujson` packages are used when they are installed and selected; the standard
+library's `json` module is always available.
+"""
+
+from typing import Any, Union
+import importlib
+import json
+
+AUTO = 'auto'
+
+
+class JSONCodec():
+    """
+    Encodes and decodes JSON bodies.
+
+    :attr str name: Name of the JSON package used.
+    """
+
+    name = None
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as UTF-8 JSON.
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        :raises ValueError: The document is not valid JSON.
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return '<{0} {1}>'.format(type(self).__name__, self.name)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    A codec based on the standard library's `json` module, which accepts control
+    characters in strings as the core does.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data, strict=False)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A codec based on the `orjson` package.
+
+    Documents that orjson rejects but the standard library accepts, such as strings
+    with raw control characters, are decoded by the standard library.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        self._orjson = importlib.import_module('orjson')
+        self._fallback = StdlibJSONCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except ValueError:
+            return self._fallback.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    A codec based on the `ujson` package.
+    """
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        self._ujson = importlib.import_module('ujson')
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+
+_CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': StdlibJSONCodec,
+}
+
+
+def get_json_codec(codec: Union[str, JSONCodec] = AUTO) -> JSONCodec:
+    """
+    Return a JSON codec.
+
+    :param codec: (optional) A JSONCodec, the name of a JSON package (`orjson`,
+           `ujson` or `json`), or `auto` for the fastest one installed.
+    :raises ValueError: The name is unknown.
+    :raises ImportError: The named package is not installed.
+    :rtype: JSONCodec
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == AUTO:
+        for factory in _CODECS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+    if codec not in _CODECS:
+        raise ValueError('Unknown JSON codec: {0}; use one of {1}'.format(codec, ', '.join([AUTO] + list(_CODECS))))
+    return _CODECS[codec]()
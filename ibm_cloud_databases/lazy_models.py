@@ -0,0 +1,126 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazily deserialized variants of the Cloud Databases V5 models.
+
+Every model class of `cloud_databases_v5` that has a `from_dict` method has a
+subclass of the same name in this module, whose `from_dict` only checks the required
+properties and keeps a reference to the JSON dictionary. Each attribute is converted
+the first time it is read, into a lazy nested model, a list of them, or a datetime,
+and the result is cached on the instance. Reading one field of a large response
+therefore only pays for that field.
+
+Example::
+
+    from ibm_cloud_databases import lazy_models
+
+    rabbitmq = lazy_models.ConnectionConnectionRabbitMQConnection.from_dict(
+        response.get_result()['connection'])
+    host = rabbitmq.amqps.hosts[0]
+    print(host.hostname, host.port)
+
+Lazy models are instances of their regular counterparts, and `to_dict`, `__str__` and
+equality behave as they do for them. The JSON dictionary must not be modified while a
+lazy model built from it is in use. When the source of the models is not installed,
+lazy models are converted in full by `from_dict`, like the regular ones.
+"""
+
+from typing import Dict, Optional
+
+from ibm_cloud_sdk_core.utils import string_to_datetime
+
+from . import cloud_databases_v5_models
+from .model_fields import DATETIME, MODEL, MODEL_LIST, SourceUnavailableError, get_model_field_map
+
+__all__ = []
+
+
+class LazyModel():
+    """
+    Defers the conversion of the properties of a model until they are read.
+    """
+
+    @classmethod
+    def _get_fields(cls) -> Optional[Dict]:
+        """
+        The fields of the model, by attribute name, or None when the source of the
+        model is not available.
+        """
+        if '_fields' not in cls.__dict__:
+            try:
+                cls._fields = get_model_field_map(cls.__bases__[1], globals())
+            except SourceUnavailableError:
+                cls._fields = None
+        return cls._fields
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'LazyModel':
+        """Initialize a lazy model object from a json dictionary."""
+        fields = cls._get_fields()
+        if fields is None:
+            return cls.__bases__[1].from_dict.__func__(cls, _dict)
+        for field in fields.values():
+            if field.required and field.key not in _dict:
+                raise ValueError('Required property \'{0}\' not present in {1} JSON'.format(
+                    field.key, cls.__name__))
+        model = cls.__new__(cls)
+        model.__dict__['_json'] = _dict
+        return model
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a lazy model object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def __getattr__(self, name: str):
+        fields = type(self)._get_fields()
+        field = fields.get(name) if fields is not None else None
+        _dict = self.__dict__.get('_json')
+        if field is None or _dict is None:
+            raise AttributeError('{0!r} object has no attribute {1!r}'.format(type(self).__name__, name))
+        value = _dict.get(field.key)
+        if field.key in _dict:
+            if field.kind == MODEL:
+                value = field.model.from_dict(value)
+            elif field.kind == MODEL_LIST:
+                value = [field.model.from_dict(x) for x in value]
+            elif field.kind == DATETIME:
+                value = string_to_datetime(value)
+        self.__dict__[name] = value
+        return value
+
+    def __eq__(self, other) -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__.__bases__[1]):
+            return False
+        names = type(self)._get_fields()
+        if names is None:
+            return vars(self) == vars(other)
+        return {name: getattr(self, name) for name in names} == {name: getattr(other, name) for name in names}
+
+
+def _build(module, target: dict) -> None:
+    """
+    Add a lazy subclass of every model class of a module to a namespace.
+    """
+    for name, model in vars(module).items():
+        if isinstance(model, type) and model.__module__ == module.__name__ and hasattr(model, 'from_dict'):
+            target[name] = type(name, (LazyModel, model), {'__module__': __name__, '__doc__': model.__doc__})
+            __all__.append(name)
+
+
+_build(cloud_databases_v5_models, globals())
@@ -0,0 +1,376 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-operation metrics of the Cloud Databases clients.
+
+Every request sent by a client with metrics enabled is recorded under the
+`operation_id` of the call, e.g. `get_deployment_info`, with its latency, HTTP
+status, number of retries and the sizes of its request and response bodies.
+
+Example::
+
+    metrics = service.enable_metrics()
+    service.get_deployment_info(id)
+    print(metrics.get('get_deployment_info').latency.value_at_quantile(0.99))
+    print(render_prometheus(metrics))
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import collections
+import math
+import threading
+
+# Status recorded for requests that got no HTTP response, e.g. on connection errors.
+NO_RESPONSE = 0
+UNKNOWN_OPERATION = 'unknown'
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class LatencyHistogram():
+    """
+    A histogram of durations with a bounded relative error, in the manner of
+    HdrHistogram.
+
+    Durations are counted in microseconds, in buckets whose width doubles every
+    `2 ** (significant_bits - 1)` buckets: values below `2 ** significant_bits`
+    microseconds are exact, and larger ones are within `2 ** (1 - significant_bits)`
+    of their true value. Recording is a few integer operations, and the memory used
+    does not depend on the number of values recorded.
+
+    :attr int count: Number of recorded values.
+    :attr float sum: Sum of the recorded values, in seconds.
+    :attr float min: Smallest recorded value, in seconds.
+    :attr float max: Largest recorded value, in seconds.
+    """
+
+    def __init__(self, *, significant_bits: int = 7, max_seconds: float = 3600.0) -> None:
+        """
+        :param int significant_bits: (optional) Bits of precision of each bucket: 7
+               gives a relative error below 1.6%.
+        :param float max_seconds: (optional) Largest value told apart; larger ones
+               are counted in the last bucket.
+        """
+        if significant_bits < 1:
+            raise ValueError('significant_bits must be at least 1')
+        self._bits = significant_bits
+        self._half = 1 << (significant_bits - 1)
+        self._max_micros = max(1, int(max_seconds * 1e6))
+        self._counts = [0] * (self._index(self._max_micros) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a duration.
+        """
+        micros = min(max(int(seconds * 1e6), 0), self._max_micros)
+        index = self._index(micros)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if self.min is None or seconds < self.min:
+                self.min = seconds
+            if self.max is None or seconds > self.max:
+                self.max = seconds
+
+    def value_at_quantile(self, quantile: float) -> Optional[float]:
+        """
+        Return the duration, in seconds, that the given fraction of the recorded
+        values does not exceed, or None if nothing was recorded.
+
+        :param float quantile: Between 0 and 1, e.g. 0.99 for the 99th percentile.
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError('quantile must be between 0 and 1')
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(1, math.ceil(quantile * self.count))
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    if index == len(self._counts) - 1:
+                        return self.max
+                    return min(self._upper_bound(index) / 1e6, self.max)
+        return self.max
+
+    def count_at_or_below(self, seconds: float) -> int:
+        """
+        Return the number of recorded values not larger than a duration, up to the
+        precision of the buckets.
+        """
+        limit = seconds * 1e6
+        total = 0
+        with self._lock:
+            for index, count in enumerate(self._counts):
+                if count and self._upper_bound(index) > limit:
+                    break
+                total += count
+        return total
+
+    def _index(self, micros: int) -> int:
+        shift = max(micros.bit_length() - self._bits, 0)
+        return shift * self._half + (micros >> shift)
+
+    def _upper_bound(self, index: int) -> int:
+        if index < 2 * self._half:
+            return index
+        shift = index // self._half - 1
+        return ((index - shift * self._half + 1) << shift) - 1
+
+
+class OperationMetrics():
+    """
+    The metrics of one operation.
+
+    :attr str operation_id: Name of the operation.
+    :attr LatencyHistogram latency: Durations of the requests.
+    :attr Counter statuses: Number of requests by HTTP status code; `NO_RESPONSE`
+          counts the requests that got no response.
+    :attr int retries: Number of retries.
+    :attr int request_bytes: Bytes sent in request bodies.
+    :attr int response_bytes: Bytes received in response bodies.
+    """
+
+    def __init__(self, operation_id: str, **histogram_args) -> None:
+        self.operation_id = operation_id
+        self.latency = LatencyHistogram(**histogram_args)
+        self.statuses = collections.Counter()
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration: float, status_code: int, request_bytes: int, response_bytes: int,
+               retries: int) -> None:
+        """Record one request."""
+        self.latency.record(duration)
+        with self._lock:
+            self.statuses[status_code] += 1
+            self.retries += retries
+            self.request_bytes += request_bytes
+            self.response_bytes += response_bytes
+
+
+class MetricsRecorder():
+    """
+    Receives a record of every request sent by a client.
+
+    Subclasses forward the records to a metrics system; `Metrics` keeps them in
+    memory.
+    """
+
+    def record(self,
+               operation_id: str,
+               duration: float,
+               status_code: int,
+               *,
+               request_bytes: int = 0,
+               response_bytes: int = 0,
+               retries: int = 0) -> None:
+        """
+        Record a request.
+
+        :param str operation_id: Name of the operation, e.g. `get_task`.
+        :param float duration: Seconds from sending the request to decoding the
+               response.
+        :param int status_code: HTTP status of the response, or `NO_RESPONSE`.
+        :param int request_bytes: (optional) Size of the request body.
+        :param int response_bytes: (optional) Size of the response body.
+        :param int retries: (optional) Number of times the request was retried.
+        """
+        raise NotImplementedError
+
+
+class Metrics(MetricsRecorder):
+    """
+    Keeps per-operation latency histograms, status counts, retries and payload
+    sizes in memory, safe to share between threads and clients.
+    """
+
+    def __init__(self, **histogram_args) -> None:
+        """
+        :param histogram_args: (optional) Arguments of each `LatencyHistogram`.
+        """
+        self._histogram_args = histogram_args
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    def record(self,
+               operation_id: str,
+               duration: float,
+               status_code: int,
+               *,
+               request_bytes: int = 0,
+               response_bytes: int = 0,
+               retries: int = 0) -> None:
+        operation = self._operations.get(operation_id)
+        if operation is None:
+            with self._lock:
+                operation = self._operations.setdefault(
+                    operation_id, OperationMetrics(operation_id, **self._histogram_args))
+        operation.record(duration, status_code, request_bytes, response_bytes, retries)
+
+    def get(self, operation_id: str) -> Optional[OperationMetrics]:
+        """
+        Return the metrics of an operation, or None if it was not called.
+        """
+        return self._operations.get(operation_id)
+
+    def operations(self) -> List[OperationMetrics]:
+        """
+        Return the metrics of every operation called, by name.
+        """
+        with self._lock:
+            return [self._operations[name] for name in sorted(self._operations)]
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded.
+        """
+        with self._lock:
+            self._operations = {}
+
+
+def response_size(http_response) -> int:
+    """
+    Return the size of the body of a `requests` or `httpx` response as received,
+    without reading a streamed body.
+    """
+    length = http_response.headers.get('Content-Length')
+    if length is not None and length.isdigit():
+        return int(length)
+    content = getattr(http_response, '_content', None)
+    return len(content) if isinstance(content, bytes) else 0
+
+
+def retry_count(http_response) -> int:
+    """
+    Return the number of times a `requests` response was retried by urllib3, or 0
+    for other responses and None.
+    """
+    retries = getattr(getattr(http_response, 'raw', None), 'retries', None)
+    return len(getattr(retries, 'history', ()))
+
+
+def render_prometheus(metrics: Metrics,
+                      *,
+                      prefix: str = 'cloud_databases',
+                      buckets: Iterable[float] = DEFAULT_BUCKETS,
+                      quantiles: Iterable[float] = DEFAULT_QUANTILES,
+                      labels: Dict[str, str] = None,
+                      rate_limiter: 'RateLimiter' = None,
+                      concurrency_limiter: 'AdaptiveConcurrencyLimiter' = None) -> str:
+    """
+    Render metrics in the Prometheus text exposition format.
+
+    Latencies are exported both as a histogram, `<prefix>_request_duration_seconds`,
+    which can be aggregated across clients, and as a summary of precomputed
+    quantiles, `<prefix>_request_duration_quantiles_seconds`.
+
+    :param Metrics metrics: The metrics to render.
+    :param str prefix: (optional) Prefix of the metric names.
+    :param Iterable[float] buckets: (optional) Upper bounds, in seconds, of the
+           histogram buckets.
+    :param Iterable[float] quantiles: (optional) Quantiles of the summary.
+    :param dict labels: (optional) Labels added to every sample, e.g. the region.
+    :param RateLimiter rate_limiter: (optional) A rate limiter whose current wait
+           time and number of 429 responses are rendered by bucket.
+    :param AdaptiveConcurrencyLimiter concurrency_limiter: (optional) A
+           concurrency limiter whose limit and requests in flight are rendered.
+    :rtype: str
+    """
+    lines = []
+    operations = metrics.operations()
+    extra = sorted((labels or {}).items())
+
+    def sample(name: str, value, *pairs: Tuple[str, str]) -> None:
+        rendered = ','.join('{0}="{1}"'.format(key, _escape(str(val))) for key, val in list(pairs) + extra)
+        lines.append('{0}{1}{2} {3}'.format(prefix, name, '{' + rendered + '}' if rendered else '', _number(value)))
+
+    def header(name: str, kind: str, description: str) -> None:
+        lines.append('# HELP {0}{1} {2}'.format(prefix, name, description))
+        lines.append('# TYPE {0}{1} {2}'.format(prefix, name, kind))
+
+    header('_requests_total', 'counter', 'Requests sent, by operation and HTTP status (0: no response).')
+    for operation in operations:
+        for status_code, count in sorted(operation.statuses.items()):
+            sample('_requests_total', count, ('operation', operation.operation_id), ('code', status_code))
+
+    header('_request_duration_seconds', 'histogram', 'Duration of the requests, by operation.')
+    for operation in operations:
+        for bound in sorted(buckets):
+            sample('_request_duration_seconds_bucket', operation.latency.count_at_or_below(bound),
+                   ('operation', operation.operation_id), ('le', _number(bound)))
+        sample('_request_duration_seconds_bucket', operation.latency.count,
+               ('operation', operation.operation_id), ('le', '+Inf'))
+        sample('_request_duration_seconds_sum', operation.latency.sum, ('operation', operation.operation_id))
+        sample('_request_duration_seconds_count', operation.latency.count, ('operation', operation.operation_id))
+
+    header('_request_duration_quantiles_seconds', 'summary', 'Quantiles of the duration of the requests.')
+    for operation in operations:
+        for quantile in quantiles:
+            value = operation.latency.value_at_quantile(quantile)
+            sample('_request_duration_quantiles_seconds', float('nan') if value is None else value,
+                   ('operation', operation.operation_id), ('quantile', _number(quantile)))
+        sample('_request_duration_quantiles_seconds_sum', operation.latency.sum,
+               ('operation', operation.operation_id))
+        sample('_request_duration_quantiles_seconds_count', operation.latency.count,
+               ('operation', operation.operation_id))
+
+    for name, attribute, description in [
+            ('_request_retries_total', 'retries', 'Retries of the requests, by operation.'),
+            ('_request_bytes_total', 'request_bytes', 'Bytes sent in request bodies, by operation.'),
+            ('_response_bytes_total', 'response_bytes', 'Bytes received in response bodies, by operation.')]:
+        header(name, 'counter', description)
+        for operation in operations:
+            sample(name, getattr(operation, attribute), ('operation', operation.operation_id))
+
+    if rate_limiter is not None:
+        header('_rate_limit_wait_seconds', 'gauge', 'Seconds a request made now would wait, by bucket.')
+        for bucket, wait in sorted(rate_limiter.wait_times().items()):
+            sample('_rate_limit_wait_seconds', float(wait), ('bucket', bucket))
+        header('_rate_limit_throttled_total', 'counter', 'Responses with status 429, by bucket.')
+        for bucket, limiter_bucket in sorted(rate_limiter.buckets.items()):
+            sample('_rate_limit_throttled_total', limiter_bucket.throttled, ('bucket', bucket))
+
+    if concurrency_limiter is not None:
+        header('_concurrency_limit', 'gauge', 'Number of requests allowed in flight.')
+        sample('_concurrency_limit', int(concurrency_limiter.limit))
+        header('_requests_in_flight', 'gauge', 'Number of requests in flight.')
+        sample('_requests_in_flight', concurrency_limiter.in_flight)
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return 'NaN'
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(value)
+    return str(value)
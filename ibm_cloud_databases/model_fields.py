@@ -0,0 +1,176 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Describe how the generated models read their properties from JSON.
+
+The generated `from_dict` methods all follow the same pattern::
+
+    if 'key' in _dict:
+        args['name'] = <conversion of _dict.get('key')>
+    else:
+        raise ValueError(...)   # required properties only
+
+This module reads that pattern back from the source of `from_dict`, so that
+alternative deserializers can be derived from the models instead of being kept in
+sync with them by hand. When the source is not installed, e.g. in a bundle of
+bytecode only, `SourceUnavailableError` is raised and the deserializers fall back
+to `from_dict` itself.
+"""
+
+from typing import Dict, List, Mapping
+import ast
+import inspect
+import textwrap
+
+VALUE = 'value'
+MODEL = 'model'
+MODEL_LIST = 'model_list'
+DATETIME = 'datetime'
+
+
+class SourceUnavailableError(ValueError):
+    """
+    The source of the `from_dict` method of a model is not available.
+    """
+
+
+class ModelField():
+    """
+    A property read by the `from_dict` method of a model.
+
+    :attr str name: Name of the attribute, and of the constructor argument.
+    :attr str key: Key of the property in the JSON dictionary.
+    :attr str kind: How the JSON value is converted: `VALUE` (used as is), `MODEL`
+          (a nested model), `MODEL_LIST` (a list of nested models) or `DATETIME`.
+    :attr type model: The nested model class for `MODEL` and `MODEL_LIST`.
+    :attr bool required: True when `from_dict` rejects JSON without the property.
+    """
+
+    def __init__(self, name: str, key: str, kind: str, *, model: type = None, required: bool = False) -> None:
+        self.name = name
+        self.key = key
+        self.kind = kind
+        self.model = model
+        self.required = required
+
+    def __repr__(self) -> str:
+        return '<ModelField {0} ({1}{2})>'.format(
+            self.name, self.kind, ' ' + self.model.__name__ if self.model is not None else '')
+
+
+def get_model_fields(model: type, namespace: Mapping[str, type] = None) -> List[ModelField]:
+    """
+    Return the properties read by the `from_dict` method of a model, in order.
+
+    :param type model: A model class of `cloud_databases_v5`, or a twin of one.
+    :param Mapping namespace: (optional) Where the names of nested models are looked
+           up. Defaults to the globals of `from_dict`.
+    :raises ValueError: `from_dict` does not follow the generated pattern.
+    :raises SourceUnavailableError: The source of `from_dict` is not available.
+    :rtype: List[ModelField]
+    """
+    function = model.from_dict.__func__
+    if namespace is None:
+        namespace = function.__globals__
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError) as err:
+        raise SourceUnavailableError('the source of {0}.from_dict is not available'.format(model.__name__)) from err
+    tree = ast.parse(textwrap.dedent(source))
+    fields = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.If) or not _is_key_test(node.test):
+            continue
+        key = ast.literal_eval(node.test.left)
+        assignment = node.body[0]
+        if len(node.body) != 1 or not isinstance(assignment, ast.Assign):
+            raise ValueError('unexpected statement for {0!r} in {1}.from_dict'.format(key, model.__name__))
+        name = ast.literal_eval(_subscript_index(assignment.targets[0]))
+        kind, model_name = _conversion(assignment.value)
+        if kind is None:
+            raise ValueError('unexpected conversion of {0!r} in {1}.from_dict'.format(key, model.__name__))
+        required = any(isinstance(statement, ast.Raise) for statement in node.orelse)
+        fields.append(ModelField(name, key, kind,
+                                 model=namespace[model_name] if model_name else None,
+                                 required=required))
+    return fields
+
+
+def get_model_field_map(model: type, namespace: Mapping[str, type] = None) -> Dict[str, ModelField]:
+    """
+    Return the properties read by the `from_dict` method of a model, by attribute
+    name.
+
+    :rtype: Dict[str, ModelField]
+    """
+    return {field.name: field for field in get_model_fields(model, namespace)}
+
+
+def _is_key_test(test: ast.expr) -> bool:
+    """
+    Whether an expression is `'key' in _dict`.
+    """
+    return isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.In) \
+        and isinstance(test.comparators[0], ast.Name) and test.comparators[0].id == '_dict'
+
+
+def _subscript_index(target: ast.expr) -> ast.expr:
+    """
+    The index of `args[...]`, across the AST changes of Python 3.9.
+    """
+    index = target.slice
+    return getattr(index, 'value', index) if type(index).__name__ == 'Index' else index
+
+
+def _is_dict_get(node: ast.expr) -> bool:
+    """
+    Whether an expression is `_dict.get(...)`.
+    """
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+        and node.func.attr == 'get' and isinstance(node.func.value, ast.Name) and node.func.value.id == '_dict'
+
+
+def _from_dict_call(node: ast.expr, argument) -> str:
+    """
+    The model name of an expression `Model.from_dict(argument)`, or None.
+    """
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == 'from_dict' \
+            and isinstance(node.func.value, ast.Name) and len(node.args) == 1 and argument(node.args[0]):
+        return node.func.value.id
+    return None
+
+
+def _conversion(value: ast.expr) -> tuple:
+    """
+    The kind of conversion of the value assigned to an argument, and the name of the
+    nested model it builds, if any.
+    """
+    if _is_dict_get(value):
+        return VALUE, None
+    model_name = _from_dict_call(value, _is_dict_get)
+    if model_name:
+        return MODEL, model_name
+    if isinstance(value, ast.ListComp) and len(value.generators) == 1 \
+            and _is_dict_get(value.generators[0].iter):
+        variable = value.generators[0].target
+        model_name = _from_dict_call(value.elt, lambda node: isinstance(node, ast.Name) and node.id == variable.id)
+        if model_name:
+            return MODEL_LIST, model_name
+    if isinstance(value, ast.Call) and isinstance(value.func, ast.Name) \
+            and value.func.id == 'string_to_datetime' and _is_dict_get(value.args[0]):
+        return DATETIME, None
+    return None, None
@@ -0,0 +1,229 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Keep-alive HTTP connections shared by many clients.
+
+Every client owns a `requests` session with its own connection pool, so that the
+clients of one process, e.g. one per account, each open connections to the same
+regional API host and repeat their TLS handshakes. A `ConnectionPool` is mounted on
+the sessions of the clients that enable connection pooling, which then reuse each
+other's idle connections while keeping their own authenticator, cookies and http
+config::
+
+    for apikey in apikeys:
+        service = CloudDatabasesV5(IAMAuthenticator(apikey))
+        service.enable_connection_pooling()  # the pool shared by the whole process
+        ...
+    pool = get_shared_connection_pool()
+    print(pool.hits, pool.new_connections, pool.waits)
+
+The pool keeps up to `maxsize` idle connections per host. When it blocks, no more
+than `maxsize` connections are open to a host at once, and requests beyond them wait
+for a connection to be released.
+"""
+
+from typing import Dict, Optional
+import threading
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+except ImportError: # ibm-cloud-sdk-core before 3.16 mounts the requests adapter
+    SSLHTTPAdapter = None
+
+
+class ConnectionPool():
+    """
+    Connections kept alive for the clients it is mounted on, by host.
+
+    :attr int maxsize: Greatest number of idle connections kept per host.
+    :attr int max_hosts: Greatest number of hosts whose connections are kept.
+    :attr bool block: Whether requests wait for a connection to be released rather
+          than open more than `maxsize` connections to a host.
+    :attr float pool_timeout: Greatest number of seconds a request waits for a
+          connection when the pool blocks, or None to wait until one is released.
+    :attr int hits: Number of requests sent on a connection kept alive.
+    :attr int new_connections: Number of connections opened.
+    :attr int waits: Number of requests that waited for a connection because all
+          those of their host were in use.
+    """
+
+    def __init__(self,
+                 *,
+                 maxsize: int = 10,
+                 max_hosts: int = 10,
+                 block: bool = False,
+                 pool_timeout: float = None) -> None:
+        """
+        :param int maxsize: (optional) Greatest number of idle connections kept per
+               host, and of connections open to a host when the pool blocks.
+        :param int max_hosts: (optional) Greatest number of hosts whose connections
+               are kept; those of the least recently used host are closed beyond it.
+        :param bool block: (optional) Whether requests wait for a connection to be
+               released when `maxsize` connections to their host are in use, rather
+               than open another one that is closed after the request.
+        :param float pool_timeout: (optional) Greatest number of seconds a request
+               waits for a connection when the pool blocks; by default it waits
+               until one is released.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        if max_hosts < 1:
+            raise ValueError('max_hosts must be at least 1')
+        self.maxsize = maxsize
+        self.max_hosts = max_hosts
+        self.block = block
+        self.pool_timeout = pool_timeout
+        self.hits = 0
+        self.new_connections = 0
+        self.waits = 0
+        self._lock = threading.Lock()
+        self._adapters = {}
+        # Each pool counts the connections it hands out in its own subclasses of
+        # the urllib3 pools.
+        self._pool_classes = {
+            'http': type('HTTPConnectionPool', (_CountingPool, HTTPConnectionPool), {'connection_pool': self}),
+            'https': type('HTTPSConnectionPool', (_CountingPool, HTTPSConnectionPool), {'connection_pool': self}),
+        }
+
+    def mount(self, session: Session, disable_ssl_verification: bool = False) -> None:
+        """
+        Send the requests of a session through the pool.
+
+        :param Session session: The session of a client.
+        :param bool disable_ssl_verification: (optional) Whether the client
+               disabled the verification of the server's certificate; such clients
+               only share connections among themselves.
+        """
+        adapter = self.adapter(disable_ssl_verification)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    def adapter(self, disable_ssl_verification: bool = False) -> HTTPAdapter:
+        """
+        Return the transport adapter sending requests through the pool.
+        """
+        with self._lock:
+            adapter = self._adapters.get(disable_ssl_verification)
+            if adapter is None:
+                adapter = self._adapters[disable_ssl_verification] = _PooledAdapter(self, disable_ssl_verification)
+            return adapter
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the number of connections kept per host. The idle connections of the
+        pool are closed, and the pool opens new ones when it is used again.
+
+        :param int maxsize: Greatest number of idle connections kept per host, and
+               of connections open to a host when the pool blocks.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        with self._lock:
+            self.maxsize = maxsize
+            adapters = list(self._adapters.values())
+        for adapter in adapters:
+            poolmanager = adapter.poolmanager
+            adapter.init_poolmanager(self.max_hosts, maxsize, block=self.block)
+            poolmanager.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the pool.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'new_connections': self.new_connections, 'waits': self.waits}
+
+    def close(self) -> None:
+        """
+        Close the idle connections of the pool. It opens new ones when it is used
+        again.
+        """
+        with self._lock:
+            adapters = list(self._adapters.values())
+        for adapter in adapters:
+            adapter.poolmanager.clear()
+
+    def _count(self, *, reused: bool, waited: bool) -> None:
+        with self._lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.new_connections += 1
+            if waited:
+                self.waits += 1
+
+
+class _PooledAdapter(SSLHTTPAdapter or HTTPAdapter):
+    """
+    The transport adapter of a connection pool, whose urllib3 pools count the
+    connections they hand out.
+    """
+
+    def __init__(self, connection_pool: ConnectionPool, disable_ssl_verification: bool) -> None:
+        # HTTPAdapter.__init__ creates the pool manager.
+        self.connection_pool = connection_pool
+        kwargs = {}
+        if SSLHTTPAdapter is not None:
+            kwargs['_disable_ssl_verification'] = disable_ssl_verification
+        super().__init__(pool_connections=connection_pool.max_hosts,
+                         pool_maxsize=connection_pool.maxsize,
+                         pool_block=connection_pool.block,
+                         **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self.connection_pool._pool_classes # pylint: disable=protected-access
+
+
+class _CountingPool():
+    """
+    Counts whether the connection handed out for each request was kept alive, or is
+    opened for it, and whether the request waited for it.
+    """
+
+    connection_pool = None
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        # urllib3 fills the queue with placeholders, so it is only empty when every
+        # connection allowed is in use.
+        waited = self.block and self.pool is not None and self.pool.empty()
+        if timeout is None:
+            timeout = self.connection_pool.pool_timeout
+        conn = super()._get_conn(timeout)
+        self.connection_pool._count(reused=getattr(conn, 'sock', None) is not None, # pylint: disable=protected-access
+                                    waited=waited)
+        return conn
+
+
+_shared_connection_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_connection_pool() -> ConnectionPool:
+    """
+    Return the connection pool shared by all the clients of the process, with the
+    default settings.
+    """
+    global _shared_connection_pool # pylint: disable=global-statement
+    with _shared_lock:
+        if _shared_connection_pool is None:
+            _shared_connection_pool = ConnectionPool()
+        return _shared_connection_pool
@@ -0,0 +1,246 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client side rate limiting of the requests sent to the Cloud Databases API.
+
+Requests are paced by token buckets, one per class of route: reads (GET), writes
+(POST, PATCH, PUT and DELETE) and the polling of tasks by `get_task`, so that a
+burst of task polls does not hold up other lookups and writes do not starve reads.
+When the service answers `429 Too Many Requests`, the bucket of the request sends
+nothing more until the time given by the `Retry-After` header, and then resumes at
+its steady rate.
+
+Example::
+
+    service.enable_rate_limiting()  # the limiter shared by the whole process
+    service.enable_rate_limiting(RateLimiter(reads=TokenBucket(rate=50, burst=100)))
+"""
+
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional
+import threading
+import time
+
+from .deadlines import Deadline
+
+READS = 'reads'
+WRITES = 'writes'
+TASK_POLLS = 'task_polls'
+
+# Pause after a 429 response without a usable Retry-After header.
+DEFAULT_RETRY_AFTER = 1.0
+MAX_RETRY_AFTER = 300.0
+
+
+class TokenBucket():
+    """
+    A thread-safe token bucket, implemented as a generic cell rate algorithm: a
+    request may be sent `1 / rate` seconds after the previous one, or earlier while
+    less than `burst` requests are ahead of that schedule.
+
+    Callers reserve a slot and then wait outside of the bucket, so a bucket can be
+    shared between threads and asyncio tasks.
+
+    :attr float rate: Number of requests per second.
+    :attr int burst: Number of requests that can be sent at once after a pause.
+    :attr int requests: Number of slots reserved.
+    :attr int throttled: Number of 429 responses reported.
+    :attr float waited: Total seconds that requests were delayed.
+    """
+
+    def __init__(self,
+                 rate: float,
+                 burst: int = 1,
+                 *,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param float rate: Number of requests per second.
+        :param int burst: (optional) Number of requests that can be sent at once.
+        :param callable clock: (optional) Returns the current time in seconds.
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+        self.rate = rate
+        self.burst = burst
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self._interval = 1.0 / rate
+        self._tolerance = (burst - 1) * self._interval
+        self._clock = clock
+        self._theoretical_arrival = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float = None) -> Optional[float]:
+        """
+        Reserve the next slot.
+
+        :param float max_wait: (optional) The longest wait accepted, in seconds. No
+               slot is reserved if the request would wait longer.
+        :return: The number of seconds to wait before sending the request, or None
+                 if that is longer than `max_wait`.
+        :rtype: float
+        """
+        with self._lock:
+            now = self._clock()
+            arrival = max(self._theoretical_arrival, now)
+            wait = max(arrival - self._tolerance - now, 0.0)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._theoretical_arrival = arrival + self._interval
+            self.requests += 1
+            self.waited += wait
+        return wait
+
+    def wait_time(self) -> float:
+        """
+        Return the number of seconds a request made now would wait.
+        """
+        with self._lock:
+            return max(self._theoretical_arrival - self._tolerance - self._clock(), 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Send nothing for a number of seconds, then resume at the steady rate.
+        """
+        with self._lock:
+            self.throttled += 1
+            resume = self._clock() + seconds
+            self._theoretical_arrival = max(self._theoretical_arrival, resume + self._tolerance)
+
+
+class RateLimiter():
+    """
+    Paces requests with a token bucket per class of route.
+
+    :attr Dict[str, TokenBucket] buckets: The buckets, by class: `reads`, `writes`
+          and `task_polls`.
+    """
+
+    def __init__(self,
+                 *,
+                 reads: TokenBucket = None,
+                 writes: TokenBucket = None,
+                 task_polls: TokenBucket = None,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        :param TokenBucket reads: (optional) Bucket of the GET requests; 20
+               requests per second by default.
+        :param TokenBucket writes: (optional) Bucket of the POST, PATCH, PUT and
+               DELETE requests; 5 requests per second by default.
+        :param TokenBucket task_polls: (optional) Bucket of the `get_task` requests;
+               10 requests per second by default.
+        :param callable sleep: (optional) Blocks the calling thread for a number of
+               seconds.
+        """
+        self.buckets = {
+            READS: reads if reads is not None else TokenBucket(20, 20),
+            WRITES: writes if writes is not None else TokenBucket(5, 5),
+            TASK_POLLS: task_polls if task_polls is not None else TokenBucket(10, 10),
+        }
+        self._sleep = sleep
+
+    def bucket(self, operation_id: Optional[str], method: str) -> TokenBucket:
+        """
+        Return the bucket of a request.
+        """
+        if operation_id == 'get_task':
+            return self.buckets[TASK_POLLS]
+        return self.buckets[READS if method in ('GET', 'HEAD') else WRITES]
+
+    def acquire(self, operation_id: Optional[str], method: str, deadline: Deadline = None) -> None:
+        """
+        Block until a request may be sent.
+
+        :param Deadline deadline: (optional) The deadline of the request.
+        :raises DeadlineExceededError: The request would wait past its deadline; it
+                then takes no slot of the bucket.
+        """
+        wait = self._reserve(operation_id, method, deadline)
+        if wait > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self, operation_id: Optional[str], method: str, deadline: Deadline = None) -> None:
+        """
+        Wait, without blocking the event loop, until a request may be sent.
+
+        :param Deadline deadline: (optional) The deadline of the request.
+        :raises DeadlineExceededError: The request would wait past its deadline; it
+                then takes no slot of the bucket.
+        """
+        import asyncio # pylint: disable=import-outside-toplevel
+        wait = self._reserve(operation_id, method, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve(self, operation_id: Optional[str], method: str, deadline: Optional[Deadline]) -> float:
+        bucket = self.bucket(operation_id, method)
+        if deadline is None:
+            return bucket.reserve()
+        wait = bucket.reserve(max_wait=deadline.check())
+        if wait is None:
+            raise deadline.exceeded()
+        return wait
+
+    def throttled(self, operation_id: Optional[str], method: str, headers: Mapping[str, str]) -> None:
+        """
+        Report a `429 Too Many Requests` response, pausing the bucket of the request
+        for the time given by its `Retry-After` header.
+        """
+        self.bucket(operation_id, method).pause(retry_after(headers.get('Retry-After')))
+
+    def wait_times(self) -> Dict[str, float]:
+        """
+        Return the number of seconds a request made now would wait, by bucket.
+        """
+        return {name: bucket.wait_time() for name, bucket in self.buckets.items()}
+
+
+_shared_rate_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """
+    Return the rate limiter shared by all the clients of the process, with the
+    default buckets.
+    """
+    global _shared_rate_limiter # pylint: disable=global-statement
+    with _shared_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter()
+        return _shared_rate_limiter
+
+
+def retry_after(value: Optional[str], *, now: Callable[[], float] = time.time) -> float:
+    """
+    Return the number of seconds to wait given by a `Retry-After` header, which is
+    either a number of seconds or an HTTP date, bounded to `MAX_RETRY_AFTER`.
+    """
+    if value is None:
+        return DEFAULT_RETRY_AFTER
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - now()
+        except (TypeError, ValueError, IndexError):
+            return DEFAULT_RETRY_AFTER
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
@@ -0,0 +1,320 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Retries that know which requests are safe to repeat, and circuit breakers that stop
+sending requests to a deployment that keeps failing.
+
+A `RetryPolicy` retries a request that failed with a `429` or `5xx` status, or that
+got no response, after a delay with decorrelated jitter, so that clients which
+failed together do not retry together. Only requests that can be repeated without
+changing their effect are retried on any of these failures: GET requests, requests
+made conditional by an `If-Match` header, such as `set_allowlist` with `if_match`,
+and the operations listed as idempotent, such as `complete_connection`. Other
+requests, like `start_ondemand_backup`, are only retried when they certainly were
+not processed: on a `429` response, or when the connection could not be opened.
+
+A `CircuitBreaker` counts the consecutive failures of the requests of each
+deployment. Once a deployment reaches the threshold, its requests fail immediately
+with `CircuitOpenError` until the recovery time has passed; one request is then let
+through, and closes the circuit if it succeeds.
+
+Example::
+
+    service.enable_retry_policy(RetryPolicy(max_attempts=5))
+    service.enable_circuit_breaker(CircuitBreaker(failure_threshold=10))
+
+Retries made by the HTTP adapter of `BaseService.enable_retries` happen below the
+policy and repeat POST requests too, so the two should not be combined.
+"""
+
+from typing import Callable, Dict, Iterable, Optional
+import random
+import sys
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+import requests
+
+from .ratelimit import retry_after
+
+# POST operations that only read.
+IDEMPOTENT_OPERATIONS = frozenset(['complete_connection'])
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request to a deployment whose circuit is open.
+
+    :attr str deployment_id: ID of the deployment.
+    :attr float retry_in: Number of seconds before a request is let through again.
+    """
+
+    def __init__(self, deployment_id: str, retry_in: float) -> None:
+        super().__init__('Circuit of deployment {0} is open, retry in {1:.1f} seconds'.format(
+            deployment_id, retry_in))
+        self.deployment_id = deployment_id
+        self.retry_in = retry_in
+
+
+class RetryPolicy():
+    """
+    Decides whether, and after how long, a failed request is sent again.
+
+    :attr int max_attempts: Number of times a request is sent at most.
+    :attr int retries: Number of retries made.
+    :attr int refused: Number of failed requests not retried because they are not
+          idempotent.
+    """
+
+    def __init__(self,
+                 *,
+                 max_attempts: int = 4,
+                 base_delay: float = 0.5,
+                 max_delay: float = 30.0,
+                 retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 idempotent_operations: Iterable[str] = IDEMPOTENT_OPERATIONS,
+                 uniform: Callable[[float, float], float] = random.uniform,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        :param int max_attempts: (optional) Number of times a request is sent at most.
+        :param float base_delay: (optional) Shortest delay before a retry, in seconds.
+        :param float max_delay: (optional) Longest delay before a retry, in seconds.
+               A request is not retried when the service asks, with `Retry-After`,
+               to wait longer than this.
+        :param Iterable[int] retry_statuses: (optional) HTTP statuses to retry.
+        :param Iterable[str] idempotent_operations: (optional) Operations retried
+               whatever their method.
+        :param callable uniform: (optional) Returns a random number between its
+               two arguments.
+        :param callable sleep: (optional) Blocks the calling thread for a number of
+               seconds.
+        """
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        if not 0 < base_delay <= max_delay:
+            raise ValueError('delays must satisfy 0 < base_delay <= max_delay')
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_operations = frozenset(idempotent_operations)
+        self.retries = 0
+        self.refused = 0
+        self.sleep = sleep
+        self._uniform = uniform
+        self._lock = threading.Lock()
+
+    def is_idempotent(self, operation_id: Optional[str], request: Dict) -> bool:
+        """
+        Return whether a request can be sent again without changing its effect.
+        """
+        if request['method'] in ('GET', 'HEAD') or operation_id in self.idempotent_operations:
+            return True
+        return any(name.lower() == 'if-match' and value for name, value in request['headers'].items())
+
+    def backoff(self, previous_delay: float) -> float:
+        """
+        Return the delay following another one, with decorrelated jitter: a random
+        delay between `base_delay` and three times the previous delay.
+        """
+        upper = max(previous_delay, self.base_delay) * 3
+        return min(self._uniform(self.base_delay, upper), self.max_delay)
+
+    def retry_delay(self,
+                    operation_id: Optional[str],
+                    request: Dict,
+                    error: Exception,
+                    attempt: int,
+                    previous_delay: float) -> Optional[float]:
+        """
+        Return the number of seconds to wait before sending a failed request again,
+        or None if it must not be retried.
+
+        :param str operation_id: Name of the operation sending the request.
+        :param dict request: The request built by `prepare_request`.
+        :param Exception error: The exception raised by the attempt.
+        :param int attempt: Number of the attempt that failed, starting at 1.
+        :param float previous_delay: The delay before the attempt, 0 for the first.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if isinstance(error, ApiException):
+            if error.status_code not in self.retry_statuses:
+                return None
+            # A throttled request was not processed.
+            processed = error.status_code != 429
+        elif isinstance(error, transport_errors()):
+            processed = not isinstance(error, _connect_errors())
+        else:
+            return None
+        if processed and not self.is_idempotent(operation_id, request):
+            with self._lock:
+                self.refused += 1
+            return None
+        delay = self.backoff(previous_delay)
+        http_response = getattr(error, 'http_response', None)
+        if http_response is not None and error.status_code in (429, 503):
+            header = http_response.headers.get('Retry-After')
+            if header is not None:
+                requested = retry_after(header)
+                if requested > self.max_delay:
+                    return None
+                delay = max(delay, requested)
+        with self._lock:
+            self.retries += 1
+        return delay
+
+
+class CircuitBreaker():
+    """
+    Fails the requests of a deployment fast after repeated failures.
+
+    A request fails when it gets a `5xx` status or no response; any other response
+    shows that the deployment is reachable, and resets its count of failures.
+
+    :attr int failure_threshold: Number of consecutive failures opening a circuit.
+    :attr float recovery_time: Number of seconds a circuit stays open.
+    :attr int opened: Number of times a circuit was opened.
+    :attr int rejected: Number of requests failed by an open circuit.
+    """
+
+    def __init__(self,
+                 *,
+                 failure_threshold: int = 5,
+                 recovery_time: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param int failure_threshold: (optional) Number of consecutive failures
+               opening the circuit of a deployment.
+        :param float recovery_time: (optional) Number of seconds before a request
+               is let through an open circuit.
+        :param callable clock: (optional) Returns the current time in seconds.
+        """
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1')
+        if recovery_time <= 0:
+            raise ValueError('recovery_time must be positive')
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.opened = 0
+        self.rejected = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def state(self, deployment_id: str) -> str:
+        """
+        Return the state of the circuit of a deployment: `closed`, `open`, or
+        `half_open` while a request tests whether the deployment recovered.
+        """
+        with self._lock:
+            circuit = self._circuits.get(deployment_id)
+            return circuit.state if circuit is not None else CLOSED
+
+    def before_request(self, deployment_id: str) -> None:
+        """
+        Check that a request to a deployment may be sent.
+
+        :raises CircuitOpenError: The circuit of the deployment is open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(deployment_id)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            retry_in = circuit.opened_at + self.recovery_time - self._clock()
+            if retry_in <= 0:
+                # Let one request through, and another one only after a further
+                # recovery time if it never reports back.
+                circuit.state = HALF_OPEN
+                circuit.opened_at = self._clock()
+                return
+            self.rejected += 1
+        raise CircuitOpenError(deployment_id, retry_in)
+
+    def record_success(self, deployment_id: str) -> None:
+        """
+        Report a request to a deployment that got a response other than `5xx`.
+        """
+        with self._lock:
+            self._circuits.pop(deployment_id, None)
+
+    def record_failure(self, deployment_id: str) -> None:
+        """
+        Report a request to a deployment that got a `5xx` status or no response.
+        """
+        with self._lock:
+            circuit = self._circuits.get(deployment_id)
+            if circuit is None:
+                circuit = self._circuits[deployment_id] = _Circuit()
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or (circuit.state == CLOSED
+                                              and circuit.failures >= self.failure_threshold):
+                circuit.state = OPEN
+                circuit.opened_at = self._clock()
+                self.opened += 1
+
+    def record_error(self, deployment_id: str, error: Exception) -> None:
+        """
+        Report the exception raised by a request to a deployment.
+        """
+        if isinstance(error, ApiException):
+            if error.status_code >= 500:
+                self.record_failure(deployment_id)
+            elif error.status_code != 429:
+                self.record_success(deployment_id)
+        elif isinstance(error, transport_errors()):
+            self.record_failure(deployment_id)
+
+
+class _Circuit():
+    """
+    The failures of a deployment.
+    """
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+def transport_errors() -> tuple:
+    """
+    Return the exceptions of the HTTP clients raised when a request got no response.
+    """
+    errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    httpx = sys.modules.get('httpx')
+    if httpx is not None:
+        errors += (httpx.TransportError,)
+    return errors
+
+
+def _connect_errors() -> tuple:
+    """
+    Return the exceptions of the HTTP clients raised when a connection could not be
+    opened, so that the request was not sent.
+    """
+    errors = (requests.exceptions.ConnectTimeout,)
+    httpx = sys.modules.get('httpx')
+    if httpx is not None:
+        errors += (httpx.ConnectError, httpx.ConnectTimeout)
+    return errors
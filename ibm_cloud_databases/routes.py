@@ -0,0 +1,153 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The route table of the Cloud Databases V5 API.
+
+Everything about an operation that does not depend on its arguments, i.e. its HTTP
+method, URL template and SDK headers, is computed once, so that building a request
+only has to encode the path parameters and merge the headers given by the caller.
+The SDK headers are computed by the first request of the operation rather than when
+the module is loaded, since the User-Agent inspects the platform.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+import re
+
+from requests.utils import quote
+
+from .common import get_sdk_headers
+
+SERVICE_NAME = 'cloud_databases'
+SERVICE_VERSION = 'V5'
+
+_PATH_PARAM = re.compile(r'{(\w+)}')
+
+
+class Route():
+    """
+    An operation of the API.
+
+    :attr str operation_id: Name of the operation, e.g. `get_task`.
+    :attr str method: HTTP method.
+    :attr str template: URL template relative to the service URL, e.g.
+          `/tasks/{id}`.
+    :attr List[str] path_param_keys: Names of the path parameters, in order.
+    """
+
+    __slots__ = ('operation_id', 'method', 'template', 'path_param_keys', '_json_body', '_url_format',
+                 '_sdk_headers', '_base_headers')
+
+    def __init__(self, operation_id: str, method: str, template: str, *, json_body: bool = False) -> None:
+        """
+        :param str operation_id: Name of the operation.
+        :param str method: HTTP method.
+        :param str template: URL template relative to the service URL.
+        :param bool json_body: (optional) Whether requests have a JSON body.
+        """
+        self.operation_id = operation_id
+        self.method = method
+        self.template = template
+        self.path_param_keys = _PATH_PARAM.findall(template)
+        positions = iter(range(len(self.path_param_keys)))
+        self._url_format = _PATH_PARAM.sub(lambda match: '{{{0}}}'.format(next(positions)), template)
+        self._json_body = json_body
+        self._sdk_headers = None
+        self._base_headers = None
+
+    @property
+    def base_headers(self) -> Mapping[str, str]:
+        """Read-only headers of a request without caller headers."""
+        if self._base_headers is None:
+            sdk_headers = dict(get_sdk_headers(service_name=SERVICE_NAME,
+                                               service_version=SERVICE_VERSION,
+                                               operation_id=self.operation_id))
+            if self._json_body:
+                sdk_headers['content-type'] = 'application/json'
+            self._sdk_headers = MappingProxyType(sdk_headers)
+            self._base_headers = MappingProxyType(dict(sdk_headers, Accept='application/json'))
+        return self._base_headers
+
+    def url(self, *path_values: str) -> str:
+        """
+        Return the URL of a request relative to the service URL, with the values of
+        the path parameters encoded in order.
+        """
+        if len(path_values) != len(self.path_param_keys):
+            raise ValueError('{0} takes {1} path parameters'.format(self.operation_id, len(self.path_param_keys)))
+        return self._url_format.format(*[quote(value, safe='') for value in path_values])
+
+    def headers(self,
+                headers: Optional[Dict[str, str]] = None,
+                header_params: Optional[Dict[str, Optional[str]]] = None) -> Mapping[str, str]:
+        """
+        Return the headers of a request.
+
+        Header parameters of the operation come first, the SDK headers and the
+        caller's headers override them, and `Accept` is always `application/json`.
+        The base headers are returned as is when there is nothing to merge.
+
+        :param dict headers: (optional) Headers given by the caller.
+        :param dict header_params: (optional) Header parameters of the operation;
+               those set to None are left out.
+        """
+        if header_params:
+            header_params = {key: value for key, value in header_params.items() if value is not None}
+        base_headers = self.base_headers
+        if not headers and not header_params:
+            return base_headers
+        merged = dict(header_params) if header_params else {}
+        merged.update(self._sdk_headers)
+        if headers:
+            merged.update(headers)
+        merged['Accept'] = 'application/json'
+        return merged
+
+
+ROUTES = {route.operation_id: route for route in [
+    Route('list_deployables', 'GET', '/deployables'),
+    Route('list_regions', 'GET', '/regions'),
+    Route('get_deployment_info', 'GET', '/deployments/{id}'),
+    Route('create_database_user', 'POST', '/deployments/{id}/users/{user_type}', json_body=True),
+    Route('change_user_password', 'PATCH', '/deployments/{id}/users/{user_type}/{username}', json_body=True),
+    Route('delete_database_user', 'DELETE', '/deployments/{id}/users/{user_type}/{username}'),
+    Route('update_database_configuration', 'PATCH', '/deployments/{id}/configuration', json_body=True),
+    Route('list_remotes', 'GET', '/deployments/{id}/remotes'),
+    Route('resync_replica', 'POST', '/deployments/{id}/remotes/resync'),
+    Route('set_promotion', 'POST', '/deployments/{id}/remotes/promotion', json_body=True),
+    Route('list_deployment_tasks', 'GET', '/deployments/{id}/tasks'),
+    Route('get_task', 'GET', '/tasks/{id}'),
+    Route('get_backup_info', 'GET', '/backups/{backup_id}'),
+    Route('list_deployment_backups', 'GET', '/deployments/{id}/backups'),
+    Route('start_ondemand_backup', 'POST', '/deployments/{id}/backups'),
+    Route('get_pit_rdata', 'GET', '/deployments/{id}/point_in_time_recovery_data'),
+    Route('get_connection', 'GET',
+          '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}'),
+    Route('complete_connection', 'POST',
+          '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}', json_body=True),
+    Route('list_deployment_scaling_groups', 'GET', '/deployments/{id}/groups'),
+    Route('get_default_scaling_groups', 'GET', '/deployables/{type}/groups'),
+    Route('set_deployment_scaling_group', 'PATCH', '/deployments/{id}/groups/{group_id}', json_body=True),
+    Route('get_autoscaling_conditions', 'GET', '/deployments/{id}/groups/{group_id}/autoscaling'),
+    Route('set_autoscaling_conditions', 'PATCH', '/deployments/{id}/groups/{group_id}/autoscaling',
+          json_body=True),
+    Route('kill_connections', 'DELETE', '/deployments/{id}/management/database_connections'),
+    Route('get_allowlist', 'GET', '/deployments/{id}/whitelists/ip_addresses'),
+    Route('set_allowlist', 'PUT', '/deployments/{id}/whitelists/ip_addresses', json_body=True),
+    Route('add_allowlist_entry', 'POST', '/deployments/{id}/whitelists/ip_addresses', json_body=True),
+    Route('delete_allowlist_entry', 'DELETE', '/deployments/{id}/whitelists/ip_addresses/{ipaddress}'),
+]}
@@ -0,0 +1,266 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Watch many Cloud Databases tasks at once from a single polling scheduler.
+"""
+
+from typing import Callable, Dict, Iterator, Optional, Union
+import collections
+import heapq
+import itertools
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+from .cloud_databases_v5 import CloudDatabasesV5
+from .cloud_databases_v5_models import Task
+from .deadlines import DeadlineExceededError
+from .retries import transport_errors
+from .tasks import TaskPollingPolicy, TaskTimeoutError, TaskWaiter
+
+
+class TaskEvent():
+    """
+    The outcome of one task followed by a TaskWatcher.
+
+    :attr str task_id: ID of the task.
+    :attr Task task: The final state of the task. None if the task record is no
+          longer available, or if it was never seen before timing out.
+    :attr bool timed_out: True when the task was still running at the timeout or
+          deadline, in which case `task` holds its last observed state.
+    """
+
+    def __init__(self, task_id: str, task: Optional[Task] = None, *, timed_out: bool = False) -> None:
+        self.task_id = task_id
+        self.task = task
+        self.timed_out = timed_out
+
+    @property
+    def succeeded(self) -> bool:
+        """True when the task finished with the `completed` status."""
+        return not self.timed_out and self.task is not None and self.task.status == 'completed'
+
+    def __repr__(self) -> str:
+        status = 'timed out' if self.timed_out else (self.task.status if self.task else 'gone')
+        return '<TaskEvent {0}: {1}>'.format(self.task_id, status)
+
+
+class TaskWatcher():
+    """
+    Follows many tasks at once and yields an event for each one as it finishes.
+
+    Polls are kept on a single heap ordered by their due time. Tasks that belong to
+    the same deployment share one `list_deployment_tasks` call per poll, so the
+    request rate grows with the number of deployments rather than the number of
+    tasks. Tasks with an unknown deployment, or missing from their deployment's
+    task list, are polled with `get_task`.
+
+    Each task is waited for as by `CloudDatabasesV5.wait_for_task`: the timeout
+    applies from the moment the task is watched, and a deployment is polled at the
+    shortest interval the polling policy picks for any of its running tasks.
+
+    Example::
+
+        watcher = TaskWatcher(service, timeout=3600)
+        for response in responses:
+            watcher.watch(response.get_result()['task'])
+        for event in watcher:
+            print(event.task_id, event.succeeded)
+    """
+
+    def __init__(self,
+                 service: CloudDatabasesV5,
+                 *,
+                 timeout: float = None,
+                 deadline: float = None,
+                 on_progress: Callable[[Task], None] = None,
+                 polling_policy: TaskPollingPolicy = None) -> None:
+        """
+        Construct a watcher.
+
+        :param CloudDatabasesV5 service: The client used to poll the tasks.
+        :param float timeout: (optional) Maximum number of seconds to wait for each
+               task.
+        :param float deadline: (optional) Time, in seconds since the epoch, after
+               which no task is waited for.
+        :param callable on_progress: (optional) Called with a `Task` whenever its
+               status or progress changes.
+        :param TaskPollingPolicy polling_policy: (optional) Chooses the intervals
+               between polls.
+        """
+        self.service = service
+        self._policy = polling_policy or TaskPollingPolicy()
+        self._waiter_args = {
+            'timeout': timeout,
+            'deadline': deadline,
+            'on_progress': on_progress,
+            'polling_policy': self._policy,
+        }
+        self._waiters = {}
+        self._groups = {}
+        self._group_of = {}
+        self._heap = []
+        self._scheduled = {}
+        self._backoff = {}
+        self._seq = itertools.count()
+        self._events = collections.deque()
+
+    def __len__(self) -> int:
+        """Return the number of tasks that have not finished yet."""
+        return len(self._waiters)
+
+    def __iter__(self) -> Iterator[TaskEvent]:
+        return self.events()
+
+    def watch(self,
+              task: Union[str, Dict, Task],
+              *,
+              deployment_id: str = None) -> str:
+        """
+        Start following a task.
+
+        :param task: The task to follow: its ID, the `task` dict returned by a write
+               operation, or a `Task`.
+        :param str deployment_id: (optional) ID of the deployment the task runs on.
+               Defaults to the `deployment_id` of the task, when given one.
+        :return: The ID of the task.
+        :rtype: str
+        """
+        observed = None
+        if isinstance(task, str):
+            task_id = task
+        else:
+            observed = Task.from_dict(task) if isinstance(task, dict) else task
+            task_id = observed.id
+            deployment_id = deployment_id or observed.deployment_id
+        if task_id is None:
+            raise ValueError('task must have an id')
+        if task_id in self._waiters:
+            return task_id
+
+        key = ('deployment', deployment_id) if deployment_id else ('task', task_id)
+        self._waiters[task_id] = TaskWaiter(task_id, **self._waiter_args)
+        self._group_of[task_id] = key
+        self._groups.setdefault(key, set()).add(task_id)
+        if observed is None:
+            delay = self._policy.initial_interval
+        else:
+            delay = self._observe(task_id, observed)
+        if delay is not None:
+            self._schedule(key, delay)
+        return task_id
+
+    def events(self) -> Iterator[TaskEvent]:
+        """
+        Yield a TaskEvent for each watched task, in the order the tasks finish.
+
+        Tasks may be added with `watch()` while iterating. Iteration ends once every
+        watched task has finished or timed out.
+        """
+        while self._events or self._heap:
+            if self._events:
+                yield self._events.popleft()
+                continue
+            due, seq, key = heapq.heappop(self._heap)
+            if self._scheduled.get(key, (None,))[0] != seq:
+                continue
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._poll(key)
+
+    def _schedule(self, key: tuple, delay: float) -> None:
+        due = time.monotonic() + delay
+        scheduled = self._scheduled.get(key)
+        if scheduled is not None and scheduled[1] <= due:
+            return
+        seq = next(self._seq)
+        self._scheduled[key] = (seq, due)
+        heapq.heappush(self._heap, (due, seq, key))
+
+    def _poll(self, key: tuple) -> None:
+        del self._scheduled[key]
+        task_ids = list(self._groups.get(key, ()))
+        try:
+            polled = {}
+            if key[0] == 'deployment':
+                # A poll that gets no answer fails when the first of its tasks times out.
+                deadlines = [self._waiters[task_id].deadline for task_id in task_ids
+                             if self._waiters[task_id].deadline is not None]
+                deadline = min(deadlines, key=lambda deadline: deadline.expires) if deadlines else None
+                result = self.service.list_deployment_tasks(key[1], deadline=deadline).get_result() or {}
+                for item in result.get('tasks') or []:
+                    if item.get('id') in self._waiters:
+                        polled[item['id']] = Task.from_dict(item)
+            for task_id in task_ids:
+                if task_id not in polled:
+                    polled[task_id] = self._get_task(task_id)
+        except (ApiException, DeadlineExceededError) + transport_errors():
+            delay = min(self._backoff.get(key, self._policy.initial_interval) * self._policy.multiplier,
+                        self._policy.max_interval)
+            self._backoff[key] = delay
+            # The tasks whose time is up finish without a poll, and the others are
+            # polled again by their deadline at the latest.
+            for task_id in task_ids:
+                deadline = self._waiters[task_id].deadline
+                if deadline is None:
+                    continue
+                remaining = deadline.remaining()
+                if remaining <= 0:
+                    err = self._waiters[task_id].timed_out()
+                    self._finish(task_id, TaskEvent(task_id, err.task, timed_out=True))
+                else:
+                    delay = min(delay, remaining)
+            if key in self._groups:
+                self._schedule(key, delay)
+            return
+
+        self._backoff.pop(key, None)
+        delays = [self._observe(task_id, polled[task_id]) for task_id in task_ids]
+        delays = [delay for delay in delays if delay is not None]
+        if delays:
+            self._schedule(key, min(delays))
+
+    def _get_task(self, task_id: str) -> Optional[Task]:
+        try:
+            result = self.service.get_task(task_id, deadline=self._waiters[task_id].deadline).get_result() or {}
+        except ApiException as err:
+            if err.status_code == 404:
+                return None
+            raise
+        return Task.from_dict(result['task']) if result.get('task') is not None else None
+
+    def _observe(self, task_id: str, task: Optional[Task]) -> Optional[float]:
+        try:
+            delay = self._waiters[task_id].next_delay(task)
+        except TaskTimeoutError as err:
+            self._finish(task_id, TaskEvent(task_id, err.task, timed_out=True))
+            return None
+        if delay is None:
+            key = self._group_of[task_id]
+            self.service._task_finished(task, key[1] if key[0] == 'deployment' else None) # pylint: disable=protected-access
+            self._finish(task_id, TaskEvent(task_id, task))
+        return delay
+
+    def _finish(self, task_id: str, event: TaskEvent) -> None:
+        del self._waiters[task_id]
+        key = self._group_of.pop(task_id)
+        self._groups[key].discard(task_id)
+        if not self._groups[key]:
+            del self._groups[key]
+            self._scheduled.pop(key, None)
+        self._events.append(event)
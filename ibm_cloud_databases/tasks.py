@@ -0,0 +1,206 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for waiting on the tasks started by Cloud Databases write operations.
+"""
+
+from datetime import datetime, timezone
+from typing import Callable, Optional
+import random
+import time
+
+from .deadlines import Deadline, DeadlineExceededError
+
+TERMINAL_TASK_STATUSES = ('completed', 'failed')
+
+
+class TaskTimeoutError(DeadlineExceededError):
+    """
+    Raised when a task is still running at the caller's timeout or deadline.
+
+    :attr str task_id: ID of the task that was being waited for.
+    :attr float elapsed: Number of seconds spent waiting.
+    :attr Task task: The last observed state of the task, if it was seen at all.
+    """
+
+    def __init__(self, task_id: str, elapsed: float, task: 'Task' = None) -> None:
+        super().__init__(elapsed, 'Task {0} did not finish within {1:.1f} seconds'.format(task_id, elapsed))
+        self.task_id = task_id
+        self.task = task
+
+
+class TaskPollingPolicy():
+    """
+    Decides how long to wait between two polls of a running task.
+
+    When a task reports a `progress_percent` and a `created_at` time, the remaining
+    duration is extrapolated from the progress made so far and the next poll is
+    scheduled `estimate_fraction` of the way into it. Without usable progress the
+    interval grows by `multiplier` on every poll. Each interval is randomly jittered
+    by up to `jitter` of its length and bounded by `min_interval` and `max_interval`.
+
+    :attr float initial_interval: Interval used before anything is known about a task.
+    :attr float min_interval: Shortest interval between two polls.
+    :attr float max_interval: Longest interval between two polls.
+    :attr float multiplier: Growth factor of the interval while no progress is known.
+    :attr float jitter: Fraction of the interval by which it is randomly varied.
+    :attr float estimate_fraction: Fraction of the estimated remaining time to wait.
+    """
+
+    def __init__(self,
+                 *,
+                 initial_interval: float = 1.0,
+                 min_interval: float = 0.5,
+                 max_interval: float = 60.0,
+                 multiplier: float = 2.0,
+                 jitter: float = 0.2,
+                 estimate_fraction: float = 0.5) -> None:
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError('min_interval must be positive and not greater than max_interval')
+        if not 0 <= jitter < 1:
+            raise ValueError('jitter must be at least 0 and less than 1')
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.estimate_fraction = estimate_fraction
+
+    @staticmethod
+    def estimate_remaining(task: 'Task', now: datetime = None) -> Optional[float]:
+        """
+        Estimate the number of seconds until a task finishes.
+
+        :param Task task: The task as last returned by the service.
+        :param datetime now: (optional) The current time, defaults to now.
+        :return: The estimate, or None when the task does not report enough progress.
+        :rtype: float
+        """
+        progress = task.progress_percent
+        created_at = task.created_at
+        if not progress or progress >= 100 or created_at is None:
+            return None
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        elapsed = ((now or datetime.now(timezone.utc)) - created_at).total_seconds()
+        if elapsed <= 0:
+            return None
+        return elapsed * (100 - progress) / progress
+
+    def next_interval(self,
+                      task: 'Task',
+                      previous_interval: float = None,
+                      now: datetime = None) -> float:
+        """
+        Compute the number of seconds to wait before polling a running task again.
+
+        :param Task task: The task as last returned by the service.
+        :param float previous_interval: (optional) The interval waited before the last
+               poll, None if this is the first one.
+        :param datetime now: (optional) The current time, defaults to now.
+        :rtype: float
+        """
+        remaining = self.estimate_remaining(task, now)
+        if remaining is not None:
+            interval = remaining * self.estimate_fraction
+        elif previous_interval is None:
+            interval = self.initial_interval
+        else:
+            interval = previous_interval * self.multiplier
+        interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(max(interval, self.min_interval), self.max_interval)
+
+
+class TaskWaiter():
+    """
+    Tracks one wait for a task: chooses the delay before each poll, reports progress
+    and enforces the timeout and deadline.
+
+    Clients feed every polled task into `next_delay()` and sleep for the returned
+    number of seconds, stopping when it returns None.
+
+    :attr str task_id: ID of the task being waited for.
+    :attr Deadline deadline: The deadline of the wait, if it has a timeout or
+          deadline; the polls of the task share it.
+    """
+
+    def __init__(self,
+                 task_id: str,
+                 *,
+                 timeout: float = None,
+                 deadline: float = None,
+                 on_progress: Callable[['Task'], None] = None,
+                 polling_policy: TaskPollingPolicy = None) -> None:
+        """
+        Start waiting for a task.
+
+        :param str task_id: ID of the task being waited for.
+        :param float timeout: (optional) Maximum number of seconds to wait.
+        :param float deadline: (optional) Time, in seconds since the epoch as returned
+               by `time.time()`, or a `Deadline`, after which waiting stops.
+        :param callable on_progress: (optional) Called with the polled Task whenever
+               its status or progress changes.
+        :param TaskPollingPolicy polling_policy: (optional) Chooses the intervals
+               between polls, defaults to `TaskPollingPolicy()`.
+        """
+        self.task_id = task_id
+        self._on_progress = on_progress
+        self._policy = polling_policy or TaskPollingPolicy()
+        self._started = time.monotonic()
+        self.deadline = Deadline.from_kwargs({'timeout': timeout, 'deadline': deadline})
+        self._interval = None
+        self._last_seen = None
+        self._task = None
+
+    @property
+    def elapsed(self) -> float:
+        """Number of seconds since waiting started."""
+        return time.monotonic() - self._started
+
+    def next_delay(self, task: Optional['Task']) -> Optional[float]:
+        """
+        Record a polled task and compute the delay before the next poll.
+
+        :param Task task: The task returned by the service, or None if its record is
+               no longer available.
+        :return: The number of seconds to sleep, or None when the wait is over.
+        :rtype: float
+        :raises TaskTimeoutError: when the task is still running past the timeout or
+                deadline.
+        """
+        if task is not None:
+            self._task = task
+            seen = (task.status, task.progress_percent)
+            if self._on_progress is not None and seen != self._last_seen:
+                self._on_progress(task)
+            self._last_seen = seen
+        if task is None or task.status in TERMINAL_TASK_STATUSES:
+            return None
+        self._interval = self._policy.next_interval(task, self._interval)
+        if self.deadline is None:
+            return self._interval
+        remaining = self.deadline.remaining()
+        if remaining <= 0:
+            raise self.timed_out()
+        return min(self._interval, remaining)
+
+    def timed_out(self) -> TaskTimeoutError:
+        """
+        Return the exception raised when the task is still running at the timeout or
+        deadline.
+        """
+        return TaskTimeoutError(self.task_id, self.elapsed, self._task)
@@ -0,0 +1,139 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tracing of the requests sent by the Cloud Databases clients.
+
+A client with tracing enabled opens a span for every request, named by the
+`operation_id` of the call, e.g. `get_deployment_info`, and adds the trace context
+of the span to the headers of the request so that the service can continue the
+trace. Spans carry the attributes below.
+
+Example::
+
+    service.enable_tracing()  # OpenTelemetry, with the globally configured provider
+    service.get_deployment_info(id)
+"""
+
+from typing import Dict, Optional
+
+ATTR_DEPLOYMENT_ID = 'cloud_databases.deployment_id'
+ATTR_HTTP_METHOD = 'http.method'
+ATTR_HTTP_URL = 'http.url'
+ATTR_HTTP_ROUTE = 'http.route'
+ATTR_HTTP_STATUS_CODE = 'http.status_code'
+ATTR_RETRY_COUNT = 'http.retry_count'
+
+
+class Span():
+    """
+    A span opened by a `Tracer` for one request.
+    """
+
+    def set_attribute(self, key: str, value) -> None:
+        """
+        Set an attribute of the span.
+        """
+        raise NotImplementedError
+
+    def set_error(self, error: Optional[Exception]) -> None:
+        """
+        Mark the span as failed, with the exception raised if any.
+        """
+        raise NotImplementedError
+
+    def end(self) -> None:
+        """
+        End the span.
+        """
+        raise NotImplementedError
+
+
+class Tracer():
+    """
+    Opens the spans of the requests sent by a client.
+
+    Subclasses forward the spans to a tracing system; `OpenTelemetryTracer` uses
+    OpenTelemetry.
+    """
+
+    def start_span(self, name: str, attributes: Dict[str, object]) -> Span:
+        """
+        Open the span of a request, as a child of the current span if any.
+
+        :param str name: Name of the operation, e.g. `get_task`.
+        :param dict attributes: Attributes known before the request is sent.
+        :rtype: Span
+        """
+        raise NotImplementedError
+
+    def inject(self, span: Span, headers: Dict[str, str]) -> None:
+        """
+        Add the trace context of a span to the headers of its request.
+        """
+        raise NotImplementedError
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Traces requests with OpenTelemetry, which is provided by the optional
+    `opentelemetry-api` package, and propagates the trace context with the globally
+    configured propagator (W3C `traceparent` by default).
+    """
+
+    def __init__(self, tracer: 'opentelemetry.trace.Tracer' = None) -> None:
+        """
+        :param opentelemetry.trace.Tracer tracer: (optional) The tracer opening the
+               spans; one of the global tracer provider by default.
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            from opentelemetry import propagate, trace
+        except ImportError as err:
+            raise ImportError('OpenTelemetryTracer requires the opentelemetry-api package; '
+                              'install it with: pip install "ibm-cloud-databases[opentelemetry]"') from err
+        from .version import __version__ # pylint: disable=import-outside-toplevel
+        self._trace = trace
+        self._propagate = propagate
+        self._tracer = tracer if tracer is not None else trace.get_tracer('ibm_cloud_databases', __version__)
+
+    def start_span(self, name: str, attributes: Dict[str, object]) -> Span:
+        span = self._tracer.start_span(name, kind=self._trace.SpanKind.CLIENT, attributes=attributes)
+        return _OpenTelemetrySpan(span, self._trace)
+
+    def inject(self, span: Span, headers: Dict[str, str]) -> None:
+        self._propagate.inject(headers, context=self._trace.set_span_in_context(span.span))
+
+
+class _OpenTelemetrySpan(Span):
+    """
+    A `Span` wrapping an OpenTelemetry span.
+    """
+
+    def __init__(self, span, trace) -> None:
+        self.span = span
+        self._trace = trace
+
+    def set_attribute(self, key: str, value) -> None:
+        self.span.set_attribute(key, value)
+
+    def set_error(self, error: Optional[Exception]) -> None:
+        if error is not None:
+            self.span.record_exception(error)
+        self.span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+    def end(self) -> None:
+        self.span.end()
@@ -49,13 +49,18 @@ setup(
     description=PACKAGE_DESC,
     license='Apache 2.0',
     install_requires=install_requires,
+    extras_require={
+        'async': ['httpx>=0.18.0,<1.0.0'],
+        'orjson': ['orjson>=3.0.0'],
+        'opentelemetry': ['opentelemetry-api>=1.0.0'],
+    },
     tests_require=tests_require,
     author='IBM',
     author_email='devexdev@us.ibm.com',
     long_description=readme,
     long_description_content_type='text/markdown',
     url='https://github.com/IBM/cloud-databases-python-sdk',
-    packages=[PACKAGE_NAME],
+    packages=[PACKAGE_NAME, PACKAGE_NAME + '.fakeserver'],
     include_package_data=True,
     keywords=PACKAGE_NAME,
     classifiers=[
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the allowlist helpers
+"""
+
+import ipaddress
+import json
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.allowlist import AllowlistIndex, AllowlistReconciler
+from ibm_cloud_databases.cloud_databases_v5 import AllowlistEntry, CloudDatabasesV5
+
+service = CloudDatabasesV5(
+    authenticator=NoAuthAuthenticator()
+    )
+
+base_url = 'https://fake'
+service.set_service_url(base_url)
+
+allowlist_url = base_url + '/deployments/testString/whitelists/ip_addresses'
+task_body = '{"task": {"id": "task1"}}'
+
+
+def add_allowlist(*entries, etag='"v1"'):
+    """
+    Mock a get_allowlist response holding (address, description) pairs.
+    """
+    body = json.dumps({'ip_addresses': [{'address': address, 'description': description}
+                                        for address, description in entries]})
+    responses.add(responses.GET, allowlist_url, body=body, content_type='application/json',
+                  status=200, headers={'ETag': etag})
+
+
+class TestAllowlistReconciler():
+    """
+    Test Class for AllowlistReconciler
+    """
+
+    @responses.activate
+    def test_unchanged(self):
+        """
+        Nothing is sent when the allowlist is already as desired.
+        """
+        add_allowlist(('10.0.0.1', 'one'), ('172.16.0.0/16', 'two'))
+        reconciler = AllowlistReconciler(service)
+
+        result = reconciler.reconcile('testString', [
+            AllowlistEntry(address='172.16.0.0/16'),
+            {'address': '10.0.0.1/32', 'description': 'one'},
+        ])
+
+        assert result == []
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_incremental(self):
+        """
+        A small change is applied with add and delete calls, additions first.
+        """
+        add_allowlist(('10.0.0.1', 'one'), ('10.0.0.2', 'two'))
+        responses.add(responses.POST, allowlist_url, body=task_body, content_type='application/json', status=202)
+        responses.add(responses.DELETE, allowlist_url + '/10.0.0.2', body=task_body,
+                      content_type='application/json', status=202)
+        reconciler = AllowlistReconciler(service, max_incremental_changes=2)
+
+        plan = reconciler.plan('testString', [AllowlistEntry(address='10.0.0.1'), AllowlistEntry(address='10.0.0.3')])
+        assert repr(plan) == '<AllowlistPlan +1 -1>'
+        result = reconciler.apply('testString', plan)
+
+        assert len(result) == 2
+        assert [call.request.method for call in responses.calls] == ['GET', 'POST', 'DELETE']
+        assert json.loads(responses.calls[1].request.body) == {'ip_address': {'address': '10.0.0.3'}}
+
+    @responses.activate
+    def test_replace(self):
+        """
+        Large changes and changed descriptions are applied with one guarded PUT.
+        """
+        add_allowlist(('10.0.0.1', 'one'))
+        responses.add(responses.PUT, allowlist_url, body=task_body, content_type='application/json', status=202)
+        reconciler = AllowlistReconciler(service, max_incremental_changes=5)
+
+        result = reconciler.reconcile('testString', [AllowlistEntry(address='10.0.0.1', description='renamed')])
+
+        assert len(result) == 1
+        put = responses.calls[1].request
+        assert put.headers['If-Match'] == '"v1"'
+        assert json.loads(put.body) == {'ip_addresses': [{'address': '10.0.0.1', 'description': 'renamed'}]}
+
+    @responses.activate
+    def test_replace_keeps_descriptions(self):
+        """
+        Entries without a desired description keep their current one when the
+        allowlist is replaced.
+        """
+        add_allowlist(('10.0.0.1', 'one'), ('10.0.0.2', 'two'))
+        responses.add(responses.PUT, allowlist_url, body=task_body, content_type='application/json', status=202)
+        reconciler = AllowlistReconciler(service)
+
+        reconciler.reconcile('testString', [AllowlistEntry(address='10.0.0.1'),
+                                            AllowlistEntry(address='10.0.0.2/32', description='renamed'),
+                                            AllowlistEntry(address='10.0.0.3')])
+
+        assert [call.request.method for call in responses.calls] == ['GET', 'PUT']
+        assert json.loads(responses.calls[1].request.body) == {'ip_addresses': [
+            {'address': '10.0.0.1', 'description': 'one'},
+            {'address': '10.0.0.2/32', 'description': 'renamed'},
+            {'address': '10.0.0.3'}]}
+
+    @responses.activate
+    def test_duplicate_of_a_desired_address(self):
+        """
+        A duplicate of a desired address is removed by replacing the allowlist,
+        rather than by deleting the address.
+        """
+        add_allowlist(('10.0.0.1', 'one'), ('10.0.0.1/32', 'copy'))
+        responses.add(responses.PUT, allowlist_url, body=task_body, content_type='application/json', status=202)
+        reconciler = AllowlistReconciler(service, max_incremental_changes=5)
+
+        plan = reconciler.plan('testString', [AllowlistEntry(address='10.0.0.1', description='one')])
+        assert plan.replace and plan.changed
+        reconciler.apply('testString', plan)
+
+        assert [call.request.method for call in responses.calls] == ['GET', 'PUT']
+        assert json.loads(responses.calls[1].request.body) == {
+            'ip_addresses': [{'address': '10.0.0.1', 'description': 'one'}]}
+
+    @responses.activate
+    def test_precondition_failed(self):
+        """
+        A 412 answer leads to a fresh diff against the new allowlist.
+        """
+        add_allowlist(('10.0.0.1', 'one'))
+        add_allowlist(('10.0.0.2', 'two'), etag='"v2"')
+        responses.add(responses.PUT, allowlist_url, body='{"errors": [{"message": "stale"}]}',
+                      content_type='application/json', status=412)
+        responses.add(responses.PUT, allowlist_url, body=task_body, content_type='application/json', status=202)
+        reconciler = AllowlistReconciler(service, max_incremental_changes=0)
+
+        reconciler.reconcile('testString', [AllowlistEntry(address='10.0.0.3')])
+
+        assert [call.request.method for call in responses.calls] == ['GET', 'PUT', 'GET', 'PUT']
+        assert responses.calls[3].request.headers['If-Match'] == '"v2"'
+
+    @responses.activate
+    def test_precondition_failed_too_often(self):
+        """
+        The 412 error is raised once max_attempts have been used up.
+        """
+        add_allowlist(('10.0.0.1', 'one'))
+        responses.add(responses.PUT, allowlist_url, body='{"errors": [{"message": "stale"}]}',
+                      content_type='application/json', status=412)
+        reconciler = AllowlistReconciler(service, max_incremental_changes=0, max_attempts=2)
+
+        with pytest.raises(ApiException) as err:
+            reconciler.reconcile('testString', [])
+        assert err.value.status_code == 412
+        assert len(responses.calls) == 4
+
+    def test_invalid_desired_entries(self):
+        """
+        Desired entries need distinct addresses.
+        """
+        reconciler = AllowlistReconciler(service)
+        with pytest.raises(ValueError):
+            reconciler.plan('testString', [AllowlistEntry(description='no address')])
+        with pytest.raises(ValueError):
+            reconciler.plan('testString', [AllowlistEntry(address='10.0.0.1'), AllowlistEntry(address='10.0.0.1/32')])
+
+
+class TestAllowlistIndex():
+    """
+    Test Class for AllowlistIndex
+    """
+
+    def test_merging(self):
+        """
+        Overlapping and adjacent ranges collapse into the fewest CIDR blocks.
+        """
+        index = AllowlistIndex(['10.0.0.0/25', '10.0.0.128/25', '10.0.0.7', '10.0.1.0/24',
+                                '10.0.3.0/24', '2001:db8::/33', '2001:db8:8000::/33'])
+        assert [str(network) for network in index.networks()] == \
+            ['10.0.0.0/23', '10.0.3.0/24', '2001:db8::/32']
+
+    def test_membership(self):
+        """
+        Addresses and ranges are allowed only when fully covered.
+        """
+        index = AllowlistIndex(['10.0.0.0/24', '10.0.1.0/24', '192.168.0.1', '2001:db8::/32'])
+        assert '10.0.1.255' in index
+        assert '10.0.0.0/23' in index
+        assert '10.0.0.0/22' not in index
+        assert '192.168.0.1/32' in index
+        assert '192.168.0.2' not in index
+        assert ipaddress.ip_network('2001:db8:1::/48') in index
+        assert '2001:db9::1' not in index
+        assert '9.255.255.255' not in index
+        with pytest.raises(ValueError):
+            'not an address' in index # pylint: disable=expression-not-assigned
+
+    def test_overlapping(self):
+        """
+        Range queries return the allowed blocks that intersect a range.
+        """
+        index = AllowlistIndex(['10.0.0.0/24', '10.0.5.0/24', '10.1.0.0/16', '172.16.0.0/12'])
+        assert [str(network) for network in index.overlapping('10.0.0.0/16')] == ['10.0.0.0/24', '10.0.5.0/24']
+        assert [str(network) for network in index.overlapping('10.1.2.3')] == ['10.1.0.0/16']
+        assert index.overlapping('192.168.0.0/16') == []
+
+    def test_to_entries(self):
+        """
+        Compacted entries keep or merge the original descriptions.
+        """
+        index = AllowlistIndex.from_allowlist({'ip_addresses': [
+            {'address': '10.0.0.0/25', 'description': 'east'},
+            {'address': '10.0.0.128/25', 'description': 'west'},
+            {'address': '10.0.0.5', 'description': 'east'},
+            {'address': '192.168.0.1', 'description': 'bastion'},
+        ]})
+        assert [entry.to_dict() for entry in index.to_entries()] == [
+            {'address': '10.0.0.0/24', 'description': 'east, west'},
+            {'address': '192.168.0.1', 'description': 'bastion'},
+        ]
+        assert index.to_entries(description='merged')[0].description == 'merged'
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the response caches
+"""
+
+import asyncio
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.caching import TTLCache
+from ibm_cloud_databases.cloud_databases_v5 import SetDeploymentScalingGroupRequestSetMemoryGroup, SetMemoryGroupMemory
+from ibm_cloud_databases.task_watcher import TaskWatcher
+from .helpers import FakeClock, base_url, new_service
+
+connection_url = base_url + '/deployments/testString/users/database/admin/connections/public'
+connection_body = '{"connection": {"postgres": {"type": "uri", "hosts": [{"hostname": "host", "port": 5432}]}}}'
+
+
+def new_cached_service():
+    """
+    Construct a service with the connection cache enabled.
+    """
+    service = new_service()
+    service.enable_connection_cache(ttl=60, max_size=8)
+    return service
+
+
+class TestTTLCache():
+    """
+    Test Class for TTLCache
+    """
+
+    def test_expiry(self):
+        """
+        Entries are dropped once their TTL has passed.
+        """
+        clock = FakeClock(0.0)
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.put('key', 'value')
+        clock.now = 9.9
+        assert cache.get('key') == 'value'
+        clock.now = 10
+        assert cache.get('key') is None
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction(self):
+        """
+        The least recently used entry is evicted when the cache is full.
+        """
+        cache = TTLCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_invalidate(self):
+        """
+        Entries can be removed by key or by predicate.
+        """
+        cache = TTLCache()
+        for key in [('x', 1), ('x', 2), ('y', 1)]:
+            cache.put(key, key)
+        assert cache.pop(('y', 1)) == ('y', 1)
+        assert cache.invalidate(lambda key: key[0] == 'x') == 2
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            TTLCache(max_size=0)
+
+
+class TestConnectionCache():
+    """
+    Test Class for the connection cache of CloudDatabasesV5
+    """
+
+    @responses.activate
+    def test_get_connection_is_cached(self):
+        """
+        Repeated lookups with the same arguments are answered locally.
+        """
+        responses.add(responses.GET, connection_url, body=connection_body,
+                      content_type='application/json', status=200)
+        service = new_cached_service()
+
+        first = service.get_connection('testString', 'database', 'admin', 'public')
+        first.get_result()['connection'] = 'modified'
+        second = service.get_connection('testString', 'database', 'admin', 'public')
+        service.get_connection('testString', 'database', 'admin', 'public', certificate_root='/certs')
+
+        assert len(responses.calls) == 2
+        assert second.get_status_code() == 200
+        assert second.get_result()['connection']['postgres']['type'] == 'uri'
+
+    @responses.activate
+    def test_complete_connection_is_keyed_on_password(self):
+        """
+        complete_connection results are cached separately for each password.
+        """
+        responses.add(responses.POST, connection_url, body=connection_body,
+                      content_type='application/json', status=200)
+        service = new_cached_service()
+
+        for password in ['hunter2', 'hunter3', 'hunter2', None, None]:
+            service.complete_connection('testString', 'database', 'admin', 'public', password=password)
+
+        assert len(responses.calls) == 3
+        assert all('hunter2' not in repr(key) for key in service.connection_cache._entries) # pylint: disable=protected-access
+
+    @responses.activate
+    def test_invalidation(self):
+        """
+        Changing a password or scaling a deployment drops its cached connections.
+        """
+        responses.add(responses.GET, connection_url, body=connection_body,
+                      content_type='application/json', status=200)
+        responses.add(responses.PATCH, base_url + '/deployments/testString/users/database/admin',
+                      body='{"task": {}}', content_type='application/json', status=200)
+        responses.add(responses.PATCH, base_url + '/deployments/testString/groups/member',
+                      body='{"task": {}}', content_type='application/json', status=200)
+        service = new_cached_service()
+
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.change_user_password('testString', 'database', 'admin', user={'password': 'secret'})
+        service.get_connection('testString', 'database', 'admin', 'public')
+        scaling_request = SetDeploymentScalingGroupRequestSetMemoryGroup(memory=SetMemoryGroupMemory(allocation_mb=4096))
+        service.set_deployment_scaling_group('testString', 'member', scaling_request)
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.invalidate_connection_cache()
+        service.get_connection('testString', 'database', 'admin', 'public')
+
+        assert [call.request.method for call in responses.calls] == \
+            ['GET', 'PATCH', 'GET', 'PATCH', 'GET', 'GET']
+
+    @responses.activate
+    def test_invalidation_when_the_task_finishes(self):
+        """
+        Connections cached while a password change runs are dropped once waiting for
+        its task sees it finish.
+        """
+        responses.add(responses.GET, connection_url, body=connection_body,
+                      content_type='application/json', status=200)
+        responses.add(responses.PATCH, base_url + '/deployments/testString/users/database/admin',
+                      body='{"task": {"id": "t1"}}', content_type='application/json', status=200)
+        responses.add(responses.GET, base_url + '/tasks/t1',
+                      body='{"task": {"id": "t1", "status": "completed", "deployment_id": "testString"}}',
+                      content_type='application/json', status=200)
+        service = new_cached_service()
+
+        service.change_user_password('testString', 'database', 'admin', user={'password': 'secret'})
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.wait_for_task('t1')
+        service.get_connection('testString', 'database', 'admin', 'public')
+
+        assert [call.request.url.rsplit('/', 1)[-1] for call in responses.calls] == \
+            ['admin', 'public', 't1', 'public']
+
+    @responses.activate
+    def test_invalidation_when_a_watched_task_finishes(self):
+        """
+        A TaskWatcher that sees a task of a deployment finish drops its cached
+        connections.
+        """
+        responses.add(responses.GET, connection_url, body=connection_body,
+                      content_type='application/json', status=200)
+        responses.add(responses.GET, base_url + '/deployments/testString/tasks',
+                      body='{"tasks": [{"id": "t1", "status": "completed"}]}',
+                      content_type='application/json', status=200)
+        service = new_cached_service()
+
+        service.get_connection('testString', 'database', 'admin', 'public')
+        watcher = TaskWatcher(service)
+        watcher.watch('t1', deployment_id='testString')
+        assert [event.succeeded for event in watcher] == [True]
+        service.get_connection('testString', 'database', 'admin', 'public')
+
+        assert [call.request.url.rsplit('/', 1)[-1] for call in responses.calls] == ['public', 'tasks', 'public']
+
+    def test_async_invalidation_when_the_task_finishes(self):
+        """
+        The asyncio client drops cached connections when waiting for a task sees it
+        finish too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        paths = []
+
+        async def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == '/tasks/t1':
+                return httpx.Response(200, json={'task': {'id': 't1', 'status': 'completed',
+                                                          'deployment_id': 'testString'}})
+            return httpx.Response(200, json={'connection': {}})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                service.enable_connection_cache()
+                await service.get_connection('testString', 'database', 'admin', 'public')
+                await service.get_connection('testString', 'database', 'admin', 'public')
+                await service.wait_for_task('t1')
+                await service.get_connection('testString', 'database', 'admin', 'public')
+
+        asyncio.run(run())
+        assert [path.rsplit('/', 1)[-1] for path in paths] == ['public', 't1', 'public']
+
+    @responses.activate
+    def test_disabled_by_default(self):
+        """
+        Without enable_connection_cache every lookup is sent.
+        """
+        responses.add(responses.GET, connection_url, body=connection_body,
+                      content_type='application/json', status=200)
+        service = new_service()
+
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.enable_connection_cache()
+        service.get_connection('testString', 'database', 'admin', 'public')
+        service.disable_connection_cache()
+        service.get_connection('testString', 'database', 'admin', 'public')
+
+        assert len(responses.calls) == 4
+
+
+class TestAllowlistCache():
+    """
+    Test Class for the allowlist cache of CloudDatabasesV5
+    """
+
+    allowlist_url = base_url + '/deployments/testString/whitelists/ip_addresses'
+    allowlist_body = '{"ip_addresses": [{"address": "195.212.0.0/16", "description": "Dev IP space 1"}]}'
+
+    @responses.activate
+    def test_not_modified(self):
+        """
+        get_allowlist revalidates the cached allowlist with its ETag.
+        """
+        responses.add(responses.GET, self.allowlist_url, body=self.allowlist_body,
+                      content_type='application/json', status=200, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, self.allowlist_url, status=304, headers={'ETag': '"v1"'})
+        service = new_cached_service()
+        service.enable_allowlist_cache()
+
+        first = service.get_allowlist('testString')
+        first.get_result()['ip_addresses'].clear()
+        second = service.get_allowlist('testString')
+
+        assert 'If-None-Match' not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        assert second.get_status_code() == 304
+        assert second.get_headers()['ETag'] == '"v1"'
+        assert second.get_result()['ip_addresses'][0]['address'] == '195.212.0.0/16'
+
+    @responses.activate
+    def test_modified(self):
+        """
+        A changed allowlist replaces the cached one.
+        """
+        responses.add(responses.GET, self.allowlist_url, body=self.allowlist_body,
+                      content_type='application/json', status=200, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, self.allowlist_url, body='{"ip_addresses": []}',
+                      content_type='application/json', status=200, headers={'ETag': '"v2"'})
+        responses.add(responses.GET, self.allowlist_url, status=304)
+        service = new_cached_service()
+        service.enable_allowlist_cache()
+
+        service.get_allowlist('testString')
+        assert service.get_allowlist('testString').get_result() == {'ip_addresses': []}
+        assert service.get_allowlist('testString').get_result() == {'ip_addresses': []}
+        assert responses.calls[2].request.headers['If-None-Match'] == '"v2"'
+
+    @responses.activate
+    def test_invalidation(self):
+        """
+        Changing the allowlist through the client drops the cached allowlist.
+        """
+        responses.add(responses.GET, self.allowlist_url, body=self.allowlist_body,
+                      content_type='application/json', status=200, headers={'ETag': '"v1"'})
+        responses.add(responses.POST, self.allowlist_url, body='{"task": {}}',
+                      content_type='application/json', status=202)
+        service = new_cached_service()
+        service.enable_allowlist_cache()
+
+        service.get_allowlist('testString')
+        service.add_allowlist_entry('testString', ip_address={'address': '172.16.0.0/16'})
+        service.get_allowlist('testString')
+
+        assert 'If-None-Match' not in responses.calls[2].request.headers
+
+    @responses.activate
+    def test_caller_etag_is_not_answered_from_cache(self):
+        """
+        A 304 answering an If-None-Match header set by the caller is raised as before.
+        """
+        responses.add(responses.GET, self.allowlist_url, body=self.allowlist_body,
+                      content_type='application/json', status=200, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, self.allowlist_url, status=304)
+        service = new_cached_service()
+        service.enable_allowlist_cache()
+
+        service.get_allowlist('testString')
+        with pytest.raises(ApiException) as err:
+            service.get_allowlist('testString', headers={'If-None-Match': '"v0"'})
+        assert err.value.status_code == 304
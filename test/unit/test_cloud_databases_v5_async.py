@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for AsyncCloudDatabasesV5
+"""
+
+import asyncio
+import http.server
+import inspect
+import json
+import ssl
+import threading
+import certifi
+import pytest
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5, Task
+from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5, _ssl_settings
+from ibm_cloud_databases.tasks import TaskPollingPolicy
+
+httpx = pytest.importorskip('httpx')
+
+base_url = 'https://fake'
+
+
+def new_service(handler):
+    """
+    Construct an async service whose requests are answered by `handler`.
+    """
+    service = AsyncCloudDatabasesV5(
+        authenticator=NoAuthAuthenticator(),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    service.set_service_url(base_url)
+    return service
+
+
+class TestAsyncCloudDatabasesV5():
+    """
+    Test Class for AsyncCloudDatabasesV5
+    """
+
+    def test_all_operations_are_coroutines(self):
+        """
+        Every operation of CloudDatabasesV5 has an awaitable counterpart.
+        """
+        operations = [name for name, member in vars(CloudDatabasesV5).items()
+                      if inspect.isfunction(member) and not name.startswith('_') and not hasattr(BaseService, name)
+                      and inspect.signature(member).return_annotation is DetailedResponse]
+        assert len(operations) == 28
+        for name in operations:
+            assert inspect.iscoroutinefunction(getattr(AsyncCloudDatabasesV5, name)), name
+
+    def test_get_task(self):
+        """
+        get_task()
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={'task': {'id': 'testString', 'status': 'running'}})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.get_task('testString', headers={'X-Test': 'value'})
+
+        response = asyncio.run(run())
+        assert response.get_status_code() == 200
+        assert response.get_result() == {'task': {'id': 'testString', 'status': 'running'}}
+        assert len(calls) == 1
+        assert calls[0].method == 'GET'
+        assert str(calls[0].url) == base_url + '/tasks/testString'
+        assert calls[0].headers['X-Test'] == 'value'
+        assert 'cloud-databases-python-sdk' in calls[0].headers['User-Agent']
+
+    def test_set_allowlist(self):
+        """
+        set_allowlist()
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={'task': {'id': 'testString'}})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.set_allowlist(
+                    'crn:v1/deployment',
+                    ip_addresses=[{'address': '195.212.0.0/16', 'description': 'Dev IP space 1'}],
+                    if_match='etag')
+
+        response = asyncio.run(run())
+        assert response.get_status_code() == 200
+        assert calls[0].method == 'PUT'
+        assert calls[0].url.raw_path == b'/deployments/crn%3Av1%2Fdeployment/whitelists/ip_addresses'
+        assert calls[0].headers['If-Match'] == 'etag'
+        assert json.loads(calls[0].content) == {
+            'ip_addresses': [{'address': '195.212.0.0/16', 'description': 'Dev IP space 1'}]}
+
+    def test_error_response(self):
+        """
+        Error responses raise an ApiException.
+        """
+        def handler(request):
+            return httpx.Response(404, json={'errors': [{'message': 'not found'}]})
+
+        async def run():
+            async with new_service(handler) as service:
+                await service.get_deployment_info('testString')
+
+        with pytest.raises(ApiException) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.message == 'not found'
+
+    def test_value_error(self):
+        """
+        Missing required parameters raise a ValueError when awaited.
+        """
+        def handler(request):
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with new_service(handler) as service:
+                await service.get_connection('testString', 'database', None, 'public')
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
+
+    def test_concurrent_requests(self):
+        """
+        Many operations can be awaited concurrently on one event loop.
+        """
+        def handler(request):
+            return httpx.Response(200, json={'deployment': {'id': request.url.path.split('/')[-1]}})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await asyncio.gather(
+                    *[service.get_deployment_info('deployment-{0}'.format(i)) for i in range(50)])
+
+        responses = asyncio.run(run())
+        assert [r.get_result()['deployment']['id'] for r in responses] == \
+            ['deployment-{0}'.format(i) for i in range(50)]
+
+    def test_wait_for_task(self):
+        """
+        wait_for_task() polls until the task finishes.
+        """
+        statuses = iter(['queued', 'running', 'completed'])
+
+        def handler(request):
+            return httpx.Response(200, json={'task': {'id': 'testString', 'status': next(statuses)}})
+
+        async def run():
+            async with new_service(handler) as service:
+                return await service.wait_for_task(
+                    'testString',
+                    polling_policy=TaskPollingPolicy(initial_interval=0.01, min_interval=0.01, max_interval=0.01))
+
+        task = asyncio.run(run())
+        assert isinstance(task, Task)
+        assert task.status == 'completed'
+
+    def test_connection_cache(self):
+        """
+        get_connection() answers repeated lookups from the connection cache.
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={'connection': {'postgres': {'type': 'uri'}}})
+
+        async def run():
+            async with new_service(handler) as service:
+                service.enable_connection_cache(ttl=60)
+                first = await service.get_connection('testString', 'database', 'admin', 'public')
+                second = await service.get_connection('testString', 'database', 'admin', 'public')
+                return first, second
+
+        first, second = asyncio.run(run())
+        assert len(calls) == 1
+        assert first.get_result() == second.get_result()
+
+    def test_allowlist_cache(self):
+        """
+        get_allowlist() answers 304 Not Modified from the allowlist cache.
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304, headers={'ETag': '"v1"'})
+            return httpx.Response(200, json={'ip_addresses': []}, headers={'ETag': '"v1"'})
+
+        async def run():
+            async with new_service(handler) as service:
+                service.enable_allowlist_cache()
+                await service.get_allowlist('testString')
+                return await service.get_allowlist('testString')
+
+        response = asyncio.run(run())
+        assert len(calls) == 2
+        assert response.get_status_code() == 304
+        assert response.get_result() == {'ip_addresses': []}
+
+    def test_proxies(self):
+        """
+        The proxies of the http config are used, whatever the version of httpx.
+        """
+        paths = []
+
+        class Proxy(http.server.BaseHTTPRequestHandler):
+            """Answers every request, recording its target."""
+
+            def do_GET(self): # pylint: disable=invalid-name
+                paths.append(self.path)
+                body = b'{"regions": []}'
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args): # pylint: disable=arguments-differ
+                pass
+
+        proxy = http.server.HTTPServer(('127.0.0.1', 0), Proxy)
+        threading.Thread(target=proxy.serve_forever, daemon=True).start()
+
+        async def run():
+            async with AsyncCloudDatabasesV5(authenticator=NoAuthAuthenticator()) as service:
+                service.set_service_url('http://cloud-databases.invalid')
+                service.set_http_config({'proxies': {'http': 'http://127.0.0.1:{0}'.format(proxy.server_port)}})
+                return await service.list_regions()
+
+        try:
+            response = asyncio.run(run())
+        finally:
+            proxy.shutdown()
+            proxy.server_close()
+        assert response.get_result() == {'regions': []}
+        assert paths == ['http://cloud-databases.invalid/regions']
+
+    def test_ssl_settings(self):
+        """
+        The verify and cert settings of the http config apply as in CloudDatabasesV5.
+        """
+        service = AsyncCloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        assert _ssl_settings(True, None) is True
+        assert _ssl_settings(False, None) is False
+        context = _ssl_settings(certifi.where(), None)
+        assert isinstance(context, ssl.SSLContext) and context.verify_mode == ssl.CERT_REQUIRED
+        with pytest.raises(OSError):
+            _ssl_settings(True, ('missing.pem', 'missing.key'))
+        service.set_http_config({'verify': False})
+        assert service.get_async_http_client() is not None
+        asyncio.run(service.close())
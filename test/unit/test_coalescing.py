@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request coalescing
+"""
+
+import asyncio
+import threading
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5
+from ibm_cloud_databases.coalescing import SingleFlight, request_key
+
+base_url = 'https://fake'
+
+
+def run_together(count, fn, single_flight, release):
+    """
+    Run a function in threads, set an event once they all called the single
+    flight, and return their results, or exceptions.
+    """
+    results = [None] * count
+
+    def target(index):
+        try:
+            results[index] = fn()
+        except Exception as err: # pylint: disable=broad-except
+            results[index] = err
+
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    while single_flight.calls + single_flight.coalesced < count:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+class TestSingleFlight():
+    """
+    Test Class for SingleFlight
+    """
+
+    def test_threads(self):
+        """
+        Concurrent calls with the same key share one call and copies of its result.
+        """
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {'deployment': {'id': 'abc'}}
+
+        leader = threading.Thread(target=lambda: single_flight.do('key', fn))
+        leader.start()
+        started.wait(5)
+        followers = []
+        threads = [threading.Thread(target=lambda: followers.append(single_flight.do('key', fn)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while single_flight.coalesced < 5:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads + [leader]:
+            thread.join(5)
+        assert len(calls) == 1
+        assert followers == [{'deployment': {'id': 'abc'}}] * 5
+        assert len({id(result) for result in followers}) == 5
+        assert (single_flight.calls, single_flight.coalesced) == (1, 5)
+        assert single_flight.do('key', lambda: 'again') == 'again'
+
+    def test_errors(self):
+        """
+        The exception of a call is raised in every caller that shared it.
+        """
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait(5)
+            raise ApiException(503)
+
+        results = run_together(3, lambda: single_flight.do('k', fn), single_flight, release)
+        assert all(isinstance(result, ApiException) for result in results)
+        assert single_flight.calls == 1
+
+    def test_async(self):
+        """
+        Concurrent tasks with the same key share one call.
+        """
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {'groups': []}
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ApiException(500)
+
+        async def run():
+            results = await asyncio.gather(*[single_flight.do_async('a', fn) for _ in range(4)])
+            errors = await asyncio.gather(*[single_flight.do_async('b', failing) for _ in range(2)],
+                                          return_exceptions=True)
+            return results, errors
+
+        results, errors = asyncio.run(run())
+        assert results == [{'groups': []}] * 4
+        assert len(calls) == 1
+        assert all(isinstance(error, ApiException) for error in errors)
+        assert (single_flight.calls, single_flight.coalesced) == (2, 4)
+
+    def test_async_cancelled_leader(self):
+        """
+        When the task making the call is cancelled, the tasks waiting for it are
+        not: one of them makes the call, and the others share its result.
+        """
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {'groups': len(calls)}
+
+        async def run():
+            leader = asyncio.ensure_future(single_flight.do_async('a', fn))
+            await asyncio.sleep(0.01)
+            followers = asyncio.gather(*[single_flight.do_async('a', fn) for _ in range(3)])
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await followers
+
+        assert asyncio.run(run()) == [{'groups': 2}] * 3
+        assert len(calls) == 2
+        assert single_flight.calls == 2
+
+    def test_request_key(self):
+        """
+        Requests differing in their URL, parameters or headers have different keys.
+        """
+        request = {'method': 'GET', 'url': base_url + '/a', 'params': {'x': '1'}, 'headers': {'Accept': 'json'}}
+        assert request_key(request) == request_key(dict(request, headers={'accept': 'json'}))
+        assert request_key(request) != request_key(dict(request, params={'x': '2'}))
+        assert request_key(request) != request_key(dict(request, headers={'Accept': 'json', 'X-Id': '1'}))
+        assert request_key(request) != request_key(dict(request, url=base_url + '/b'))
+
+
+class TestClientCoalescing():
+    """
+    Test Class for the request coalescing of CloudDatabasesV5
+    """
+
+    def test_get_requests(self):
+        """
+        Identical concurrent GET requests are sent once.
+        """
+        release = threading.Event()
+        sent = []
+
+        def callback(request):
+            sent.append(request.url)
+            release.wait(5)
+            return (200, {'Content-Type': 'application/json'}, '{"deployment": {"id": "abc"}}')
+
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url(base_url)
+        single_flight = service.enable_request_coalescing()
+        with responses.RequestsMock() as mock:
+            mock.add_callback(responses.GET, base_url + '/deployments/abc', callback=callback)
+            results = run_together(8, lambda: service.get_deployment_info('abc'), single_flight, release)
+        assert len(sent) == 1
+        assert single_flight.coalesced == 7
+        assert [result.get_result() for result in results] == [{'deployment': {'id': 'abc'}}] * 8
+
+    @responses.activate
+    def test_writes_are_sent(self):
+        """
+        Requests other than GET are never coalesced, nor are GET requests once
+        coalescing is disabled.
+        """
+        responses.add(responses.POST, base_url + '/deployments/abc/remotes/resync', json={'task': {}}, status=202)
+        responses.add(responses.GET, base_url + '/regions', json={'regions': []}, status=200)
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url(base_url)
+        single_flight = service.enable_request_coalescing()
+        service.resync_replica('abc')
+        assert single_flight.calls == 0
+        service.list_regions()
+        assert single_flight.calls == 1
+        service.disable_request_coalescing()
+        service.list_regions()
+        assert single_flight.calls == 1
+        assert len(responses.calls) == 3
+
+    def test_async(self):
+        """
+        The asyncio client coalesces identical requests of its tasks.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        sent = []
+
+        async def handler(request):
+            sent.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'groups': []})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                service.enable_request_coalescing()
+                return await asyncio.gather(*[service.list_deployment_scaling_groups('abc') for _ in range(10)])
+
+        results = asyncio.run(run())
+        assert len(sent) == 1
+        assert [result.get_result() for result in results] == [{'groups': []}] * 10
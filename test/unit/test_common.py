@@ -45,3 +45,12 @@ class TestCommon(unittest.TestCase):
         self.assertIn('arch=', system_info)
         self.assertIn('os=', system_info)
         self.assertIn('python.version=', system_info)
+
+    def test_get_user_agent(self):
+        """
+        Test that the User-Agent is computed once
+        """
+        user_agent = common.get_user_agent()
+        self.assertTrue(user_agent.startswith('cloud-databases-python-sdk/'))
+        self.assertIs(common.get_user_agent(), user_agent)
+        self.assertEqual(common.USER_AGENT, user_agent)
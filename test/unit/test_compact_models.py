@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the compact models
+"""
+
+import json
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases import cloud_databases_v5, cloud_databases_v5_models, compact_models
+
+groups_json = {
+    'groups': [{
+        'id': 'member',
+        'count': 2,
+        'members': {'units': 'count', 'allocation_count': 2, 'minimum_count': 2, 'maximum_count': 20,
+                    'step_size_count': 1, 'is_adjustable': True, 'is_optional': False, 'can_scale_down': False},
+        'memory': {'units': 'mb', 'allocation_mb': 12288, 'minimum_mb': 2048, 'maximum_mb': 114688,
+                   'step_size_mb': 256, 'is_adjustable': True, 'is_optional': False, 'can_scale_down': True},
+    }]
+}
+
+backups_json = {
+    'backups': [{'id': 'backup1', 'deployment_id': 'dep1', 'type': 'scheduled', 'status': 'completed',
+                 'is_downloadable': True, 'is_restorable': True, 'created_at': '2021-06-01T00:00:00Z'}]
+}
+
+
+class TestCompactModels():
+    """
+    Test Class for compact_models
+    """
+
+    def test_every_model_has_a_compact_twin(self):
+        """
+        Each model class has a slotted twin with the same name and interface.
+        """
+        models = [name for name, value in vars(cloud_databases_v5_models).items()
+                  if isinstance(value, type) and value.__module__ == cloud_databases_v5_models.__name__]
+        assert sorted(models) == sorted(compact_models.__all__)
+        for name in models:
+            compact = getattr(compact_models, name)
+            assert '__slots__' in vars(compact)
+            assert compact.__doc__ == getattr(cloud_databases_v5, name).__doc__
+
+    def test_round_trip(self):
+        """
+        from_dict and to_dict behave as for the regular models, with compact nested models.
+        """
+        for name, payload in [('Groups', groups_json), ('Backups', backups_json)]:
+            regular = getattr(cloud_databases_v5, name).from_dict(payload)
+            compact = getattr(compact_models, name).from_dict(payload)
+            assert compact.to_dict() == regular.to_dict()
+            assert str(compact) == str(regular)
+            assert compact == getattr(compact_models, name).from_dict(compact.to_dict())
+            assert compact != regular
+
+        backup = compact_models.Backups.from_dict(backups_json).backups[0]
+        assert isinstance(backup, compact_models.Backup)
+        assert not hasattr(backup, '__dict__')
+        assert backup.created_at.year == 2021
+        with pytest.raises(AttributeError):
+            backup.unknown = 1
+
+    def test_subclasses(self):
+        """
+        Polymorphic models keep their hierarchy, renamed keys and enums.
+        """
+        configuration = compact_models.SetConfigurationConfigurationRedisConfiguration(maxmemory_redis=100)
+        assert isinstance(configuration, compact_models.SetConfigurationConfiguration)
+        assert configuration.to_dict() == {'maxmemory-redis': 100}
+        assert compact_models.Task.StatusEnum is cloud_databases_v5.Task.StatusEnum
+        with pytest.raises(Exception):
+            compact_models.ConnectionConnection()
+
+    @responses.activate
+    def test_compact_models_as_parameters(self):
+        """
+        Compact models can be passed to the service operations.
+        """
+        responses.add(responses.PATCH, 'https://fake/deployments/dep1/groups/member',
+                      body='{"task": {}}', content_type='application/json', status=200)
+        service = cloud_databases_v5.CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url('https://fake')
+
+        request = compact_models.SetDeploymentScalingGroupRequestSetMemoryGroup(
+            memory=compact_models.SetMemoryGroupMemory(allocation_mb=4096))
+        service.set_deployment_scaling_group('dep1', 'member', request)
+
+        assert json.loads(responses.calls[0].request.body) == {'memory': {'allocation_mb': 4096}}
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for adaptive concurrency limiting
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.concurrency import AdaptiveConcurrencyLimiter
+from ibm_cloud_databases.metrics import Metrics, render_prometheus
+from .helpers import FakeClock, base_url, new_service
+
+
+def fill(limiter):
+    """
+    Take every free slot of a limiter.
+    """
+    taken = 0
+    while limiter.in_flight < int(limiter.limit):
+        limiter.acquire()
+        taken += 1
+    return taken
+
+
+class TestAdaptiveConcurrencyLimiter():
+    """
+    Test Class for AdaptiveConcurrencyLimiter
+    """
+
+    def test_additive_increase(self):
+        """
+        The limit grows by about one per round trip while the limit is used and
+        responses are fast.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=6)
+        fill(limiter)
+        releases = 0
+        while limiter.limit < 6:
+            limiter.release(0.05, 200)
+            fill(limiter)
+            releases += 1
+        assert 8 <= releases <= 11
+        assert limiter.limit == 6
+        assert limiter.in_flight == 6
+        limiter.release(0.05, 200)
+        assert limiter.limit == 6
+
+    def test_quiet_does_not_grow(self):
+        """
+        The limit does not grow while it is not used.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        for _ in range(100):
+            limiter.acquire()
+            limiter.release(0.05, 200)
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease(self):
+        """
+        Errors and slow responses cut the limit, once per round trip.
+        """
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=32, clock=clock)
+        fill(limiter)
+        limiter.release(0.1, 200)
+        limiter.release(0.1, 503)
+        assert int(limiter.limit) == 16
+        limiter.release(0.1, 429)
+        assert int(limiter.limit) == 16
+        clock.now += 1
+        limiter.release(0.1, 0)
+        assert int(limiter.limit) == 8
+        clock.now += 1
+        limiter.release(0.5, 200)
+        assert int(limiter.limit) == 4
+        clock.now += 1
+        limiter.release(0.1, 404)
+        assert int(limiter.limit) == 4
+        assert limiter.decreases == 3
+        for _ in range(10):
+            clock.now += 1
+            limiter.release(1, 500)
+        assert limiter.limit == 1
+
+    def test_latency_of_each_operation(self):
+        """
+        Slow operations are compared to their own baseline, so healthy traffic that
+        mixes fast and slow operations does not cut the limit.
+        """
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=32, clock=clock)
+        fill(limiter)
+        for i in range(1000):
+            clock.now += 0.01
+            if i % 2:
+                limiter.release(0.12, 200, 'list_deployment_tasks')
+            else:
+                limiter.release(0.02, 200, 'get_task')
+            fill(limiter)
+        assert limiter.decreases == 0
+        assert limiter.limit > 32
+        limiter.release(0.5, 200, 'get_task')
+        assert limiter.decreases == 1
+
+    def test_waiters(self):
+        """
+        Threads over the limit wait for a request to complete.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release(0.01, 200)
+        assert acquired.wait(5)
+        thread.join(5)
+        assert limiter.in_flight == 1
+
+    def test_async_waiters(self):
+        """
+        Tasks over the limit wait without blocking the loop, and a cancelled task
+        gives its slot back.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+
+        async def run():
+            await limiter.acquire_async()
+            waiting = asyncio.ensure_future(limiter.acquire_async())
+            cancelled = asyncio.ensure_future(limiter.acquire_async())
+            await asyncio.sleep(0.01)
+            assert not waiting.done()
+            cancelled.cancel()
+            limiter.release(0.01, 200)
+            await asyncio.wait_for(waiting, 5)
+            limiter.release(0.01, 200)
+
+        asyncio.run(run())
+        assert limiter.in_flight == 0
+
+    def test_invalid(self):
+        """
+        Limits and factors are validated.
+        """
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(backoff=1)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(latency_tolerance=1)
+
+
+class TestClientConcurrencyLimiting():
+    """
+    Test Class for the concurrency limiting of CloudDatabasesV5
+    """
+
+    def test_limit(self):
+        """
+        No more requests than the limit are in flight, and errors cut the limit.
+        """
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def callback(request):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return (503, {}, '')
+
+        service = new_service()
+        limiter = service.enable_concurrency_limiting(AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4))
+        with responses.RequestsMock() as mock:
+            mock.add_callback(responses.GET, base_url + '/regions', callback=callback)
+
+            def call():
+                with pytest.raises(ApiException):
+                    service.list_regions()
+
+            threads = [threading.Thread(target=call) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+        assert in_flight[1] <= 4
+        assert limiter.limit < 4
+        assert limiter.in_flight == 0
+        text = render_prometheus(Metrics(), concurrency_limiter=limiter)
+        assert 'cloud_databases_requests_in_flight 0' in text.splitlines()
+        service.disable_concurrency_limiting()
+        assert service.concurrency_limiter is None
+
+    def test_async(self):
+        """
+        The asyncio client limits its requests too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        in_flight = [0, 0]
+
+        async def handler(request):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                service.enable_concurrency_limiting(AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2))
+                await asyncio.gather(*[service.get_task('t') for _ in range(10)])
+
+        asyncio.run(run())
+        assert in_flight[1] == 2
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for deadlines
+"""
+
+from concurrent import futures
+import asyncio
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.concurrency import AdaptiveConcurrencyLimiter
+from ibm_cloud_databases.deadlines import Deadline, DeadlineExceededError
+from ibm_cloud_databases.fakeserver import FakeServer, Latency
+from ibm_cloud_databases.hedging import HedgingPolicy
+from ibm_cloud_databases.ratelimit import RateLimiter, TokenBucket
+from ibm_cloud_databases.retries import RetryPolicy
+from ibm_cloud_databases.tasks import TaskTimeoutError
+from .helpers import base_url, new_service
+
+
+class TestDeadline():
+    """
+    Test Class for Deadline
+    """
+
+    def test_earliest_applies(self):
+        """
+        A deadline set by both a timeout and a time expires at the earliest.
+        """
+        assert 9 < Deadline(10).remaining() <= 10
+        assert 4 < Deadline(10, deadline=time.time() + 5).remaining() <= 5
+        assert 4 < Deadline(10, deadline=Deadline(5)).remaining() <= 5
+        assert Deadline(deadline=time.time() - 1).expired()
+
+    def test_from_kwargs(self):
+        """
+        The timeout and deadline arguments of an operation make a deadline, which
+        is shared when it is a Deadline already.
+        """
+        deadline = Deadline(5)
+        assert Deadline.from_kwargs({'headers': {}}) is None
+        assert Deadline.from_kwargs({'deadline': deadline}) is deadline
+        assert Deadline.from_kwargs({'timeout': 1, 'deadline': deadline}).remaining() <= 1
+        assert 4 < Deadline.from_kwargs({'deadline': time.time() + 5}).remaining() <= 5
+
+    def test_timeout(self):
+        """
+        HTTP timeouts are cut to the time left, and fail once it is up.
+        """
+        deadline = Deadline(2)
+        assert deadline.timeout(1) == 1
+        assert 1.9 < deadline.timeout(60) <= 2
+        assert deadline.timeout(None) <= 2
+        connect, read = deadline.timeout((0.5, 60))
+        assert connect == 0.5 and read <= 2
+        with pytest.raises(DeadlineExceededError) as err:
+            Deadline(-1).timeout(60)
+        assert err.value.elapsed >= 0
+
+    def test_task_timeout_error(self):
+        """
+        TaskTimeoutError is a DeadlineExceededError.
+        """
+        err = TaskTimeoutError('t', 2.5)
+        assert isinstance(err, DeadlineExceededError)
+        assert err.elapsed == 2.5
+        assert str(err) == 'Task t did not finish within 2.5 seconds'
+
+
+class TestClientDeadlines():
+    """
+    Test Class for the deadlines of CloudDatabasesV5
+    """
+
+    @responses.activate
+    def test_timeouts_are_cut(self):
+        """
+        The connect and read timeouts of a request are cut to the time left, even
+        when the http config sets them.
+        """
+        responses.add(responses.GET, base_url + '/regions', json={'regions': []}, status=200)
+        service = new_service()
+        service.list_regions()
+        assert responses.calls[0].request.req_kwargs['timeout'] == 60
+        service.list_regions(timeout=5)
+        assert 4.9 < responses.calls[1].request.req_kwargs['timeout'] <= 5
+        service.set_http_config({'timeout': (3, 30)})
+        service.list_regions(deadline=time.time() + 10)
+        connect, read = responses.calls[2].request.req_kwargs['timeout']
+        assert connect == 3 and 9.9 < read <= 10
+        with pytest.raises(DeadlineExceededError):
+            service.list_regions(deadline=Deadline(0))
+        assert len(responses.calls) == 3
+
+    def test_hung_request(self):
+        """
+        A request that is not answered in time fails with DeadlineExceededError.
+        """
+        with FakeServer(latency=Latency('fixed', 0.5)) as server:
+            service = new_service(server.url)
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceededError) as err:
+                service.list_regions(timeout=0.1)
+            assert time.monotonic() - start < 0.4
+            assert 0.1 <= err.value.elapsed < 0.4
+
+    @responses.activate
+    def test_retries_share_the_deadline(self):
+        """
+        A retry that would start after the deadline is not made.
+        """
+        responses.add(responses.GET, base_url + '/regions', status=503)
+        service = new_service()
+        delays = []
+        service.enable_retry_policy(RetryPolicy(base_delay=1, sleep=delays.append))
+        with pytest.raises(DeadlineExceededError):
+            service.list_regions(timeout=0.5)
+        assert len(responses.calls) == 1
+        assert not delays
+
+    def test_hedges_share_the_deadline(self):
+        """
+        A hedged request is not waited for after the deadline.
+        """
+        policy = HedgingPolicy(min_samples=5, budget=0.5)
+        for _ in range(5):
+            policy.record('get_task', 0.01)
+        policy.call('get_task', lambda: None)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            policy.call('get_task', lambda: time.sleep(0.5), deadline=Deadline(0.1))
+        assert time.monotonic() - start < 0.4
+        assert policy.hedged == 1
+
+    @responses.activate
+    def test_rate_limiter(self):
+        """
+        A request that the rate limiter would hold past its deadline fails at once,
+        without taking a slot of the bucket.
+        """
+        responses.add(responses.GET, base_url + '/regions', json={'regions': []})
+        sleeps = []
+        limiter = RateLimiter(reads=TokenBucket(1, 1), sleep=sleeps.append)
+        service = new_service()
+        service.enable_rate_limiting(limiter)
+        service.list_regions(timeout=5)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            service.list_regions(timeout=0.5)
+        assert time.monotonic() - start < 0.1
+        assert not sleeps
+        assert limiter.buckets['reads'].requests == 1
+        service.list_regions(timeout=5)
+        assert len(sleeps) == 1 and 0 < sleeps[0] <= 1
+        assert len(responses.calls) == 2
+
+    def test_concurrency_limiter(self):
+        """
+        A request waiting for the concurrency limiter fails at its deadline.
+        """
+        with FakeServer(latency=Latency('fixed', 0.5)) as server:
+            service = new_service(server.url)
+            limiter = service.enable_concurrency_limiting(AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1))
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                other = executor.submit(service.list_regions)
+                time.sleep(0.1)
+                start = time.monotonic()
+                with pytest.raises(DeadlineExceededError):
+                    service.list_regions(timeout=0.1)
+                assert time.monotonic() - start < 0.3
+                assert other.result().get_status_code() == 200
+        assert limiter.in_flight == 0
+
+    def test_async_limiters(self):
+        """
+        The asyncio client waits for the limiters until the deadline only.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+
+        async def handler(request):
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, json={'regions': []})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                limiter = service.enable_concurrency_limiting(
+                    AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1))
+                other = asyncio.ensure_future(service.list_regions())
+                await asyncio.sleep(0.05)
+                start = time.monotonic()
+                with pytest.raises(DeadlineExceededError):
+                    await service.list_regions(timeout=0.05)
+                assert time.monotonic() - start < 0.2
+                assert (await other).get_status_code() == 200
+                assert limiter.in_flight == 0
+
+                service.enable_rate_limiting(RateLimiter(reads=TokenBucket(0.1, 1)))
+                await service.list_regions(timeout=5)
+                start = time.monotonic()
+                with pytest.raises(DeadlineExceededError):
+                    await service.list_regions(timeout=5)
+                assert time.monotonic() - start < 0.1
+
+        asyncio.run(run())
+
+    @responses.activate
+    def test_wait_for_task(self):
+        """
+        The polls of a task share the deadline of the wait, and a poll that is not
+        answered in time raises TaskTimeoutError.
+        """
+        responses.add(responses.GET, base_url + '/tasks/t', json={'task': {'id': 't', 'status': 'running'}})
+        service = new_service()
+        with pytest.raises(TaskTimeoutError) as err:
+            service.wait_for_task('t', timeout=0.2)
+        assert err.value.task.status == 'running'
+        assert all(call.request.req_kwargs['timeout'] <= 0.2 for call in responses.calls)
+
+    def test_coalesced_requests(self):
+        """
+        A request that waits for an identical one in flight keeps its own deadline,
+        and is sent again when the deadline of the other one passes first.
+        """
+        with FakeServer(latency=Latency('fixed', 0.5)) as server:
+            service = new_service(server.url)
+            single_flight = service.enable_request_coalescing()
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                leader = executor.submit(service.list_regions)
+                time.sleep(0.1)
+                start = time.monotonic()
+                with pytest.raises(DeadlineExceededError):
+                    service.list_regions(timeout=0.1)
+                assert time.monotonic() - start < 0.3
+                assert leader.result().get_status_code() == 200
+
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                leader = executor.submit(service.list_regions, timeout=0.2)
+                time.sleep(0.1)
+                assert service.list_regions(timeout=2).get_status_code() == 200
+                with pytest.raises(DeadlineExceededError):
+                    leader.result()
+        assert single_flight.calls == 3
+
+    def test_async_coalesced_requests(self):
+        """
+        In asyncio too, a request that waits for an identical one keeps its own
+        deadline.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+
+        async def handler(request):
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, json={'regions': []})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                service.enable_request_coalescing()
+                leader = asyncio.ensure_future(service.list_regions())
+                await asyncio.sleep(0.05)
+                start = time.monotonic()
+                with pytest.raises(DeadlineExceededError):
+                    await service.list_regions(timeout=0.05)
+                assert time.monotonic() - start < 0.2
+                assert (await leader).get_status_code() == 200
+
+                leader = asyncio.ensure_future(service.list_regions(timeout=0.1))
+                await asyncio.sleep(0.05)
+                assert (await service.list_regions(timeout=2)).get_status_code() == 200
+                with pytest.raises(DeadlineExceededError):
+                    await leader
+
+        asyncio.run(run())
+
+    def test_async(self):
+        """
+        The asyncio client cancels a request at its deadline.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+
+        async def handler(request):
+            await asyncio.sleep(0.5)
+            return httpx.Response(200, json={'task': {'id': 't', 'status': 'running'}})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                with pytest.raises(DeadlineExceededError):
+                    await service.get_task('t', timeout=0.1)
+                with pytest.raises(TaskTimeoutError):
+                    await service.wait_for_task('t', deadline=Deadline(0.1))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start < 0.6
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the generated deserializers
+"""
+
+import datetime
+import inspect
+import pytest
+from ibm_cloud_sdk_core.utils import string_to_datetime
+from ibm_cloud_databases import cloud_databases_v5, compact_models
+from ibm_cloud_databases.deserializers import from_dict, generate_source, get_deserializer, parse_datetime
+
+payloads = [
+    (cloud_databases_v5.Backups, {'backups': [
+        {'id': 'backup1', 'deployment_id': 'dep1', 'type': 'scheduled', 'status': 'completed',
+         'is_downloadable': True, 'is_restorable': True, 'created_at': '2021-06-01T00:00:00Z'},
+        {'id': 'backup2', 'status': 'running'},
+    ]}),
+    (cloud_databases_v5.Tasks, {'tasks': [
+        {'id': 'task1', 'description': 'Creating backup', 'status': 'running', 'deployment_id': 'dep1',
+         'progress_percent': 50, 'created_at': '2021-06-01T12:30:00.250Z'},
+    ]}),
+    (cloud_databases_v5.Groups, {'groups': [
+        {'id': 'member', 'count': 2,
+         'memory': {'units': 'mb', 'allocation_mb': 12288, 'is_adjustable': True},
+         'cpu': {'units': 'count', 'allocation_count': 2}},
+    ]}),
+    (cloud_databases_v5.Connection, {'connection': {'postgres': {'type': 'uri'}}}),
+    (cloud_databases_v5.SetConfigurationConfigurationRedisConfiguration,
+     {'maxmemory-redis': 100, 'appendonly': 'yes'}),
+    (cloud_databases_v5.Tasks, {}),
+]
+
+
+class TestDeserializers():
+    """
+    Test Class for the deserializers
+    """
+
+    def test_same_result_as_from_dict(self):
+        """
+        Generated deserializers build the same objects as from_dict.
+        """
+        for model, payload in payloads:
+            expected = model.from_dict(payload)
+            result = from_dict(model, payload)
+            assert type(result) is model
+            assert vars(result) == vars(expected)
+            assert result.to_dict() == expected.to_dict()
+
+        groups = from_dict(cloud_databases_v5.Groups, payloads[2][1])
+        assert type(groups.groups[0].memory) is cloud_databases_v5.GroupMemory
+        assert groups.groups[0].disk is None
+
+    def test_every_model_compiles(self):
+        """
+        A deserializer can be generated for every model, and is generated once.
+        """
+        for model in vars(cloud_databases_v5).values():
+            if isinstance(model, type) and hasattr(model, 'from_dict'):
+                assert get_deserializer(model) is get_deserializer(model)
+        assert 'raise ValueError' in generate_source(cloud_databases_v5.Connection)
+
+    def test_errors(self):
+        """
+        Missing required properties are reported as by from_dict; slotted models are rejected.
+        """
+        with pytest.raises(ValueError, match="Required property 'connection' not present in Connection JSON"):
+            from_dict(cloud_databases_v5.Connection, {})
+        with pytest.raises(ValueError):
+            get_deserializer(compact_models.Task)
+
+    def test_source_unavailable(self, monkeypatch):
+        """
+        Models whose source is not installed are deserialized by from_dict.
+        """
+        def getsource(obj):
+            raise OSError('could not get source code')
+
+        class Groups(cloud_databases_v5.Groups):
+            """A model not deserialized yet."""
+
+        monkeypatch.setattr(inspect, 'getsource', getsource)
+        assert get_deserializer(Groups) == Groups.from_dict
+        groups = from_dict(Groups, payloads[2][1])
+        assert type(groups) is Groups
+        assert groups.to_dict() == cloud_databases_v5.Groups.from_dict(payloads[2][1]).to_dict()
+
+    def test_parse_datetime(self):
+        """
+        parse_datetime agrees with string_to_datetime.
+        """
+        for value in ['2021-06-01T00:00:00Z', '2021-06-01T00:00:00.123Z', '2021-06-01T02:00:00+02:00',
+                      '2021-06-01 00:00:00', 'June 1 2021 10:00']:
+            assert parse_datetime(value) == string_to_datetime(value), value
+        assert parse_datetime('2021-06-01T00:00:00Z').tzinfo == datetime.timezone.utc
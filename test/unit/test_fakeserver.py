@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the fake Cloud Databases server
+"""
+
+import pytest
+import requests
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_databases.cloud_databases_v5 import (AllowlistEntry, CreateDatabaseUserRequestUser,
+                                                    SetDeploymentScalingGroupRequestSetMembersGroup,
+                                                    SetMembersGroupMembers)
+from ibm_cloud_databases.fakeserver import FakeError, FakeServer, FakeState, Faults, Latency
+from ibm_cloud_databases.fakeserver.__main__ import main
+from .helpers import FakeClock, new_service
+
+
+@pytest.fixture
+def server():
+    with FakeServer(FakeState(deployments=2, seed=1)) as fake:
+        yield fake
+
+
+@pytest.fixture
+def service(server):
+    return new_service(server.url)
+
+
+class TestFakeState():
+    """
+    Test Class for FakeState
+    """
+
+    def test_task_progress(self):
+        """
+        Tasks report their progress and complete after the task duration.
+        """
+        clock = FakeClock(1622505600.0)
+        state = FakeState(task_duration=10, clock=clock)
+        deployment_id = state.deployment_ids[0]
+        task_id = state.start_backup(deployment_id)['task']['id']
+        backups = state.list_backups(deployment_id)['backups']
+        assert backups[-1]['status'] == 'running'
+        assert backups[-1]['type'] == 'on_demand'
+
+        clock.now += 4
+        task = state.get_task(task_id)['task']
+        assert task['status'] == 'running'
+        assert task['progress_percent'] == 40
+
+        clock.now += 6
+        task = state.get_task(task_id)['task']
+        assert task['status'] == 'completed'
+        assert task['progress_percent'] == 100
+        assert state.list_backups(deployment_id)['backups'][-1]['status'] == 'completed'
+        assert [t['id'] for t in state.list_tasks(deployment_id)['tasks']] == [task_id]
+
+    def test_task_failures(self):
+        """
+        A task failure rate of 1 fails every task, and its backup.
+        """
+        state = FakeState(task_duration=0, task_failure_rate=1)
+        deployment_id = state.deployment_ids[0]
+        task = state.start_backup(deployment_id)['task']
+        assert task['status'] == 'failed'
+        backup = state.list_backups(deployment_id)['backups'][-1]
+        assert backup['status'] == 'failed'
+        assert not backup['is_restorable']
+
+    def test_users(self):
+        """
+        Users can be created, changed and deleted once.
+        """
+        state = FakeState()
+        deployment_id = state.deployment_ids[0]
+        state.create_user(deployment_id, 'database', {'username': 'app', 'password': 'secret-password'})
+        with pytest.raises(FakeError) as error:
+            state.create_user(deployment_id, 'database', {'username': 'app', 'password': 'secret-password'})
+        assert error.value.status == 422
+        state.change_user_password(deployment_id, 'database', 'app', {'password': 'other-password'})
+        state.delete_user(deployment_id, 'database', 'app')
+        with pytest.raises(FakeError) as error:
+            state.delete_user(deployment_id, 'database', 'app')
+        assert error.value.status == 404
+        with pytest.raises(FakeError) as error:
+            state.create_user(deployment_id, 'root', {'username': 'app', 'password': 'secret-password'})
+        assert error.value.status == 400
+
+    def test_scaling(self):
+        """
+        Scaling changes the allocation within the limits of the group.
+        """
+        state = FakeState()
+        deployment_id = state.deployment_ids[0]
+        state.set_group(deployment_id, 'member', {'memory': {'allocation_mb': 12288 + 384}})
+        group = state.list_groups(deployment_id)['groups'][0]
+        assert group['memory']['allocation_mb'] == 12672
+        for invalid in [{'memory': {'allocation_mb': 12289}}, {'memory': {'allocation_mb': 1}}]:
+            with pytest.raises(FakeError) as error:
+                state.set_group(deployment_id, 'member', invalid)
+            assert error.value.status == 422
+        with pytest.raises(FakeError) as error:
+            state.set_group(deployment_id, 'member', {'gpu': {'allocation_count': 1}})
+        assert error.value.status == 400
+        with pytest.raises(FakeError) as error:
+            state.set_group(deployment_id, 'nope', {'members': {'allocation_count': 4}})
+        assert error.value.status == 404
+
+    def test_allowlist(self):
+        """
+        Every allowlist change updates the ETag, which set_allowlist can require.
+        """
+        state = FakeState(allowlist_entries=1)
+        deployment_id = state.deployment_ids[0]
+        allowlist, etag = state.get_allowlist(deployment_id)
+        assert allowlist == {'ip_addresses': [{'address': '10.0.0.0/24', 'description': 'Application subnet 0'}]}
+        state.add_allowlist_entry(deployment_id, {'address': '192.0.2.1', 'description': 'Bastion'})
+        with pytest.raises(FakeError) as error:
+            state.add_allowlist_entry(deployment_id, {'address': '192.0.2.1'})
+        assert error.value.status == 422
+        with pytest.raises(FakeError) as error:
+            state.set_allowlist(deployment_id, [], if_match=etag)
+        assert error.value.status == 412
+        state.set_allowlist(deployment_id, [{'address': '198.51.100.0/24'}],
+                            if_match=state.allowlist_etag(deployment_id))
+        state.delete_allowlist_entry(deployment_id, '198.51.100.0/24')
+        assert state.get_allowlist(deployment_id)[0] == {'ip_addresses': []}
+        with pytest.raises(FakeError) as error:
+            state.add_allowlist_entry(deployment_id, {'address': 'not-an-address'})
+        assert error.value.status == 422
+
+    def test_unknown_deployments(self):
+        """
+        Unknown deployments are not found, unless they are created on first use.
+        """
+        with pytest.raises(FakeError) as error:
+            FakeState().get_deployment('missing')
+        assert error.value.status == 404
+        state = FakeState(deployments=0, auto_create=True)
+        assert state.get_deployment('created')['deployment']['id'] == 'created'
+        assert state.deployment_ids == ['created']
+
+    def test_seed(self):
+        """
+        The same seed generates the same deployment IDs.
+        """
+        assert FakeState(deployments=3, seed=7).deployment_ids == FakeState(deployments=3, seed=7).deployment_ids
+        with pytest.raises(ValueError):
+            FakeState(deployment_type='oracle')
+
+
+class TestFaults():
+    """
+    Test Class for Faults and Latency
+    """
+
+    def test_rates(self):
+        """
+        Faults answer the configured fractions of requests with errors.
+        """
+        faults = Faults(throttle_rate=0.2, error_rate=0.3, seed=3)
+        picks = [faults.pick() for _ in range(2000)]
+        throttled = [error for error in picks if error is not None and error.status == 429]
+        failed = [error for error in picks if error is not None and error.status >= 500]
+        assert 300 < len(throttled) < 500
+        assert 500 < len(failed) < 700
+        assert throttled[0].headers == {'Retry-After': '1'}
+        assert {error.status for error in failed} == {500, 502, 503}
+        assert Faults().pick() is None
+
+    def test_invalid(self):
+        """
+        Rates must be fractions and statuses server errors.
+        """
+        with pytest.raises(ValueError):
+            Faults(throttle_rate=0.7, error_rate=0.7)
+        with pytest.raises(ValueError):
+            Faults(error_statuses=[404])
+
+    def test_latency(self):
+        """
+        Latency samples follow their distribution.
+        """
+        assert Latency().sample() == 0
+        assert Latency('fixed', 0.05).sample() == 0.05
+        samples = [Latency('uniform', 0.05, 0.01, seed=1).sample() for _ in range(100)]
+        assert all(0.04 <= sample <= 0.06 for sample in samples)
+        exponential = Latency('exponential', 0.05, 0.01, seed=1)
+        assert all(exponential.sample() >= 0.01 for _ in range(100))
+        assert Latency('lognormal', 0.05, 0.5, seed=1).sample() > 0
+        with pytest.raises(ValueError):
+            Latency('pareto', 0.05)
+
+
+class TestFakeServer():
+    """
+    Test Class for FakeServer
+    """
+
+    def test_operations(self, server, service):
+        """
+        The client's operations are served from the state.
+        """
+        deployment_id = server.state.deployment_ids[1]
+        deployment = service.get_deployment_info(deployment_id).get_result()['deployment']
+        assert deployment['id'] == deployment_id
+
+        response = service.create_database_user(
+            deployment_id, 'database', user=CreateDatabaseUserRequestUser(username='app', password='secret-password'))
+        assert response.get_status_code() == 202
+        task = service.get_task(response.get_result()['task']['id']).get_result()['task']
+        assert task['deployment_id'] == deployment_id
+
+        connection = service.complete_connection(deployment_id, 'database', 'app', 'public',
+                                                 password='secret-password').get_result()
+        assert connection['connection']['postgres']['authentication'] == {
+            'method': 'direct', 'username': 'app', 'password': 'secret-password'}
+
+        service.set_deployment_scaling_group(deployment_id, 'member', SetDeploymentScalingGroupRequestSetMembersGroup(
+            members=SetMembersGroupMembers(allocation_count=5)))
+        groups = service.list_deployment_scaling_groups(deployment_id).get_result()['groups']
+        assert groups[0]['count'] == 5
+
+        service.add_allowlist_entry(deployment_id, ip_address=AllowlistEntry(address='192.0.2.0/24'))
+        service.delete_allowlist_entry(deployment_id, '192.0.2.0/24')
+        assert len(service.get_allowlist(deployment_id).get_result()['ip_addresses']) == 2
+
+    def test_errors(self, service):
+        """
+        Errors are reported as the API does.
+        """
+        with pytest.raises(ApiException) as error:
+            service.get_deployment_info('missing')
+        assert error.value.code == 404
+        assert error.value.message == 'Deployment missing not found'
+
+        with pytest.raises(ApiException) as error:
+            service.get_task('missing')
+        assert error.value.code == 404
+
+    def test_allowlist_etag(self, server, service):
+        """
+        The allowlist is served with an ETag, and not sent again while it matches.
+        """
+        deployment_id = server.state.deployment_ids[0]
+        response = service.get_allowlist(deployment_id)
+        etag = response.get_headers()['ETag']
+        url = '{0}/deployments/{1}/whitelists/ip_addresses'.format(server.url, requests.utils.quote(deployment_id,
+                                                                                                      safe=''))
+        assert requests.get(url, headers={'If-None-Match': etag}).status_code == 304
+        service.enable_allowlist_cache()
+        service.get_allowlist(deployment_id)
+        assert service.get_allowlist(deployment_id).get_status_code() == 304
+
+    def test_faults(self, server, service):
+        """
+        Injected faults reach the client as API errors.
+        """
+        server.faults = Faults(throttle_rate=1)
+        with pytest.raises(ApiException) as error:
+            service.list_regions()
+        assert error.value.code == 429
+        assert error.value.http_response.headers['Retry-After'] == '1'
+        server.faults = None
+        assert 'us-south' in service.list_regions().get_result()['regions']
+
+        stats = requests.get(server.url + '/_fakeserver/stats').json()['requests']
+        assert stats == {'GET /regions 429': 1, 'GET /regions 200': 1}
+
+    def test_unknown_routes(self, server):
+        """
+        Unknown routes and methods are rejected.
+        """
+        assert requests.get(server.url + '/nope').status_code == 404
+        assert requests.put(server.url + '/regions').status_code == 405
+        url = '{0}/deployments/{1}/users/database'.format(server.url,
+                                                          requests.utils.quote(server.state.deployment_ids[0], safe=''))
+        response = requests.post(url, data='{')
+        assert response.status_code == 400
+        assert response.json()['errors'][0]['code'] == 'bad_request'
+
+    def test_main_rejects_invalid_arguments(self, capsys):
+        """
+        The command line reports invalid settings.
+        """
+        with pytest.raises(SystemExit):
+            main(['--throttle-rate', '2'])
+        assert 'throttle_rate' in capsys.readouterr().err
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for FleetExecutor
+"""
+
+import re
+import threading
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5
+from ibm_cloud_databases.deadlines import Deadline, DeadlineExceededError
+from ibm_cloud_databases.fleet import FleetExecutor
+from ibm_cloud_databases.pooling import ConnectionPool
+from .helpers import base_url, new_service
+
+
+def deployment_callback(request):
+    """
+    Answer get_deployment_info, failing for deployments named 'missing'.
+    """
+    deployment_id = request.url.rsplit('/', 1)[-1]
+    if deployment_id == 'missing':
+        return (404, {}, '{"errors": [{"message": "not found"}]}')
+    return (200, {}, '{"deployment": {"id": "%s"}}' % deployment_id)
+
+
+class TestFleetExecutor():
+    """
+    Test Class for FleetExecutor
+    """
+
+    @responses.activate
+    def test_run_unordered(self):
+        """
+        Every deployment produces one result; failures are reported, not raised.
+        """
+        responses.add_callback(responses.GET, re.compile(base_url + '/deployments/.*'),
+                               callback=deployment_callback, content_type='application/json')
+        deployment_ids = ['dep{0}'.format(i) for i in range(20)] + ['missing']
+
+        with FleetExecutor(new_service(), max_workers=4) as fleet:
+            results = dict(fleet.run('get_deployment_info', deployment_ids))
+
+        assert sorted(results) == sorted(deployment_ids)
+        assert isinstance(results['missing'], ApiException)
+        assert results['missing'].status_code == 404
+        assert isinstance(results['dep3'], DetailedResponse)
+        assert results['dep3'].get_result() == {'deployment': {'id': 'dep3'}}
+
+    def test_run_ordered_and_bounded(self):
+        """
+        Ordered mode follows the input order; concurrency never exceeds max_workers.
+        """
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        class FakeService(CloudDatabasesV5):
+            """A service whose get_deployment_info sleeps a little."""
+            def get_deployment_info(self, id: str, **kwargs) -> DetailedResponse:
+                with lock:
+                    state['running'] += 1
+                    state['peak'] = max(state['peak'], state['running'])
+                time.sleep(0.02 if id.endswith('0') else 0.001)
+                with lock:
+                    state['running'] -= 1
+                return DetailedResponse(response={'id': id}, status_code=200)
+
+        service = FakeService(authenticator=NoAuthAuthenticator())
+        deployment_ids = ['dep{0}'.format(i) for i in range(30)]
+        with FleetExecutor(service, max_workers=3) as fleet:
+            results = list(fleet.run('get_deployment_info', deployment_ids, ordered=True))
+
+        assert [deployment_id for deployment_id, _ in results] == deployment_ids
+        assert [outcome.get_result()['id'] for _, outcome in results] == deployment_ids
+        assert state['peak'] <= 3
+
+    def test_timeout(self):
+        """
+        The timeout is passed to the calls, and those that exceed it are reported
+        with a DeadlineExceededError.
+        """
+        deadlines = []
+
+        class SlowService(CloudDatabasesV5):
+            """A service whose get_allowlist is slow for one deployment."""
+            def get_allowlist(self, id: str, **kwargs) -> DetailedResponse:
+                deadlines.append(kwargs['deadline'])
+                time.sleep(0.5 if id == 'slow' else 0)
+                return DetailedResponse(response={}, status_code=200)
+
+        service = SlowService(authenticator=NoAuthAuthenticator())
+        with FleetExecutor(service, max_workers=2, timeout=0.1) as fleet:
+            results = dict(fleet.run('get_allowlist', ['slow', 'fast']))
+
+        assert isinstance(results['slow'], DeadlineExceededError)
+        assert isinstance(results['fast'], DetailedResponse)
+        assert all(isinstance(deadline, Deadline) for deadline in deadlines)
+
+    def test_timeout_runs_from_the_start_of_each_call(self):
+        """
+        Calls waiting for a worker busy with a call that timed out have their full
+        timeout once they start.
+        """
+        class SlowService(CloudDatabasesV5):
+            """A service whose get_allowlist ignores its deadline for some deployments."""
+            def get_allowlist(self, id: str, **kwargs) -> DetailedResponse:
+                time.sleep(0.6 if id.startswith('slow') else 0.1)
+                return DetailedResponse(response={}, status_code=200)
+
+        service = SlowService(authenticator=NoAuthAuthenticator())
+        deployment_ids = ['slow1', 'slow2', 'fast1', 'fast2', 'fast3']
+        with FleetExecutor(service, max_workers=2, timeout=0.3) as fleet:
+            results = dict(fleet.run('get_allowlist', deployment_ids))
+
+        assert isinstance(results['slow1'], DeadlineExceededError)
+        assert isinstance(results['slow2'], DeadlineExceededError)
+        for deployment_id in ['fast1', 'fast2', 'fast3']:
+            assert isinstance(results[deployment_id], DetailedResponse), deployment_id
+
+    @responses.activate
+    def test_timeout_of_requests(self):
+        """
+        The HTTP requests of the calls are sent with the timeout.
+        """
+        responses.add_callback(responses.GET, re.compile(base_url + '/deployments/[^/]+$'),
+                               callback=deployment_callback)
+        service = new_service()
+        with FleetExecutor(service, max_workers=2, timeout=5) as fleet:
+            results = dict(fleet.run('get_deployment_info', ['dep1', 'dep2', 'dep3']))
+
+        assert all(isinstance(outcome, DetailedResponse) for outcome in results.values())
+        assert all(0 < call.request.req_kwargs['timeout'] <= 5 for call in responses.calls)
+
+    def test_invalid_operation(self):
+        """
+        Only service operations can be run.
+        """
+        with FleetExecutor(new_service()) as fleet:
+            for operation in ['set_service_url', 'send', 'not_an_operation', '_send']:
+                with pytest.raises(ValueError):
+                    list(fleet.run(operation, ['dep1']))
+        with pytest.raises(ValueError):
+            FleetExecutor(new_service(), max_workers=0)
+
+    def test_connection_pool_is_grown(self):
+        """
+        The session's connection pool holds a connection per worker.
+        """
+        service = new_service()
+        with FleetExecutor(service, max_workers=32) as fleet:
+            list(fleet.run('get_deployment_info', []))
+        adapter = service.get_http_client().get_adapter(base_url)
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+
+    def test_shared_connection_pool_is_grown(self):
+        """
+        A connection pool shared with other clients is grown through the pool,
+        whose previous connections are closed.
+        """
+        service = new_service()
+        pool = service.enable_connection_pooling(ConnectionPool(maxsize=4))
+        adapter = service.get_http_client().get_adapter(base_url)
+        poolmanager = adapter.poolmanager
+        poolmanager.connection_from_url(base_url)
+        with FleetExecutor(service, max_workers=32) as fleet:
+            list(fleet.run('get_deployment_info', []))
+        assert pool.maxsize == 32
+        assert service.get_http_client().get_adapter(base_url) is adapter
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+        assert adapter.poolmanager.pool_classes_by_scheme['https'].connection_pool is pool
+        assert len(poolmanager.pools) == 0
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request hedging
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5
+from ibm_cloud_databases.hedging import HedgingPolicy
+
+base_url = 'https://fake'
+
+
+def warmed_up(latency=0.01, **policy_args):
+    """
+    Return a policy that recorded enough latencies to hedge, with a hedge to spend.
+    """
+    policy = HedgingPolicy(min_samples=5, budget=0.5, **policy_args)
+    for _ in range(5):
+        policy.record('get_connection', latency)
+    policy._start('get_connection')
+    return policy
+
+
+def slow_then_fast(results):
+    """
+    Return an attempt that is slow the first time it is called, and appends the
+    number of each call to a list of results.
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def attempt():
+        with lock:
+            calls.append(1)
+            number = len(calls)
+        if number == 1:
+            time.sleep(0.5)
+        results.append(number)
+        return number
+
+    return attempt
+
+
+class TestHedgingPolicy():
+    """
+    Test Class for HedgingPolicy
+    """
+
+    def test_hedge_delay(self):
+        """
+        The delay is a quantile of the recent latencies, once there are enough.
+        """
+        policy = HedgingPolicy(quantile=0.9, min_samples=10, window=100)
+        for _ in range(9):
+            policy.record('get_task', 0.01)
+        assert policy.hedge_delay('get_task') is None
+        assert policy.hedge_delay('list_regions') is None
+        policy.record('get_task', 0.5)
+        assert policy.hedge_delay('get_task') == pytest.approx(0.01, rel=0.02)
+        for _ in range(95):
+            policy.record('get_task', 0.1)
+        assert policy.hedge_delay('get_task') == pytest.approx(0.1, rel=0.02)
+        # Older latencies are forgotten as new windows fill up.
+        for _ in range(200):
+            policy.record('get_task', 0.002)
+        assert policy.hedge_delay('get_task') == pytest.approx(0.002, rel=0.02)
+
+    def test_applies(self):
+        """
+        Only GET requests of the listed operations are hedged.
+        """
+        policy = HedgingPolicy(operations=['get_connection'])
+        assert policy.applies('get_connection', 'GET')
+        assert not policy.applies('get_task', 'GET')
+        assert HedgingPolicy().applies('get_task', 'GET')
+        assert not HedgingPolicy().applies('start_ondemand_backup', 'POST')
+
+    def test_hedge_wins(self):
+        """
+        A slow call is hedged, and the result of the hedge returned first.
+        """
+        results = []
+        policy = warmed_up()
+        start = time.perf_counter()
+        assert policy.call('get_connection', slow_then_fast(results)) == 2
+        assert time.perf_counter() - start < 0.4
+        assert (policy.hedged, policy.wins) == (1, 1)
+
+    def test_budget(self):
+        """
+        Hedges stop once the budget is spent.
+        """
+        results = []
+        policy = HedgingPolicy(min_samples=5, budget=0.25)
+        for _ in range(40):
+            policy.record('get_connection', 0.01)
+        assert policy.call('get_connection', slow_then_fast(results)) == 1
+        assert policy.hedged == 0
+        assert results == [1]
+        for _ in range(2):
+            policy.call('get_connection', lambda: None)
+        assert policy.call('get_connection', slow_then_fast(results)) == 2
+        assert policy.hedged == 1
+        assert policy.requests == 4
+
+    def test_threads_are_bounded(self):
+        """
+        Requests and hedges are sent from the threads of the policy, and from the
+        caller's thread without a hedge when they are all busy.
+        """
+        policy = warmed_up(max_workers=2)
+        for _ in range(100):
+            policy.record('get_connection', 0.01)
+        threads = []
+
+        def attempt():
+            threads.append(threading.current_thread().name)
+            time.sleep(0.05)
+            return len(threads)
+
+        def wait_for_idle_workers(count):
+            # The requests abandoned for their hedges return.
+            for _ in range(count):
+                assert policy._workers.acquire(timeout=1)
+            for _ in range(count):
+                policy._workers.release()
+
+        for _ in range(3):
+            policy._start('get_connection')
+            policy.call('get_connection', attempt)
+            wait_for_idle_workers(2)
+        assert policy.hedged == 3
+        assert len(set(threads)) == 2
+        assert all(name.startswith('HedgingPolicy') for name in threads)
+
+        release = threading.Event()
+        for _ in range(2):
+            assert policy._workers.acquire(blocking=False)
+        busy = policy._submit(release.wait)
+        del threads[:]
+        assert policy.call('get_connection', attempt) == 1
+        assert threads == [threading.current_thread().name]
+        release.set()
+        busy.result()
+        policy._workers.release()
+        policy.close()
+
+    def test_errors(self):
+        """
+        A failed call is not used while the other one may succeed, and the error of
+        the first call is raised when both fail.
+        """
+        def failing_first(statuses):
+            calls = []
+            lock = threading.Lock()
+
+            def attempt():
+                with lock:
+                    calls.append(1)
+                    number = len(calls)
+                time.sleep(0.05 if number == 1 else 0.2)
+                if statuses[number - 1]:
+                    raise ApiException(statuses[number - 1])
+                return 'ok'
+
+            return attempt
+
+        assert warmed_up().call('get_connection', failing_first([503, None])) == 'ok'
+        with pytest.raises(ApiException) as err:
+            warmed_up().call('get_connection', failing_first([503, 502]))
+        assert err.value.status_code == 503
+
+    def test_async(self):
+        """
+        The slower task is cancelled.
+        """
+        policy = warmed_up()
+        cancelled = []
+
+        async def attempt():
+            number = policy.hedged
+            try:
+                await asyncio.sleep(0.5 if number == 0 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(number)
+                raise
+            return number
+
+        assert asyncio.run(policy.call_async('get_connection', attempt)) == 1
+        assert cancelled == [0]
+        assert policy.wins == 1
+
+    def test_invalid(self):
+        """
+        Quantile and budget are validated.
+        """
+        with pytest.raises(ValueError):
+            HedgingPolicy(quantile=1)
+        with pytest.raises(ValueError):
+            HedgingPolicy(budget=0)
+        with pytest.raises(ValueError):
+            HedgingPolicy(min_samples=100, window=10)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_workers=1)
+
+
+class TestClientHedging():
+    """
+    Test Class for the request hedging of CloudDatabasesV5
+    """
+
+    def test_get_requests(self):
+        """
+        A slow GET request is sent again, and writes are never hedged.
+        """
+        lock = threading.Lock()
+        sent = []
+
+        def callback(request):
+            with lock:
+                sent.append(request.headers.get('Accept'))
+                number = len(sent)
+            if number == 6:
+                time.sleep(0.5)
+            return (200, {'Content-Type': 'application/json'}, '{"deployment": {"id": "abc"}}')
+
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url(base_url)
+        policy = service.enable_hedging(HedgingPolicy(min_samples=5, budget=0.5,
+                                                      operations=['get_deployment_info']))
+        with responses.RequestsMock() as mock:
+            mock.add_callback(responses.GET, base_url + '/deployments/abc', callback=callback)
+            mock.add(responses.POST, base_url + '/deployments/abc/backups', json={'task': {}}, status=202)
+            for _ in range(5):
+                service.get_deployment_info('abc')
+            start = time.perf_counter()
+            response = service.get_deployment_info('abc')
+            assert time.perf_counter() - start < 0.4
+            assert response.get_result() == {'deployment': {'id': 'abc'}}
+            assert (policy.hedged, policy.wins) == (1, 1)
+            service.start_ondemand_backup('abc')
+            assert policy.requests == 6
+            time.sleep(0.5)
+        assert len(sent) == 7
+        service.disable_hedging()
+        assert service.hedging_policy is None
+
+    def test_async(self):
+        """
+        The asyncio client hedges slow requests too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        sent = []
+
+        async def handler(request):
+            sent.append(request.url)
+            if len(sent) == 6:
+                await asyncio.sleep(0.5)
+            return httpx.Response(200, json={'groups': []})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                policy = service.enable_hedging(HedgingPolicy(min_samples=5, budget=0.5))
+                for _ in range(6):
+                    await service.list_deployment_scaling_groups('abc')
+                return policy
+
+        start = time.perf_counter()
+        policy = asyncio.run(run())
+        assert time.perf_counter() - start < 0.4
+        assert (policy.hedged, policy.wins) == (1, 1)
+        assert len(sent) == 7
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the JSON codecs
+"""
+
+import importlib
+import json
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5
+from ibm_cloud_databases.json_codec import StdlibJSONCodec, get_json_codec
+
+base_url = 'https://fake'
+allowlist_url = base_url + '/deployments/testString/whitelists/ip_addresses'
+
+
+def installed(name):
+    """
+    Whether a package can be imported.
+    """
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        return False
+    return True
+
+
+class RecordingCodec(StdlibJSONCodec):
+    """
+    A codec that records what it encodes and decodes.
+    """
+
+    name = 'recording'
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append(('dumps', obj))
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append(('loads', data))
+        return super().loads(data)
+
+
+class TestJSONCodec():
+    """
+    Test Class for the JSON codecs
+    """
+
+    @pytest.mark.parametrize('name', ['json', 'orjson', 'ujson'])
+    def test_round_trip(self, name):
+        """
+        Every codec encodes to and decodes from bytes.
+        """
+        if not installed(name):
+            with pytest.raises(ImportError):
+                get_json_codec(name)
+            return
+        codec = get_json_codec(name)
+        document = {'ip_addresses': [{'address': '10.0.0.0/8', 'description': 'café / über'}], 'n': 1.5}
+        encoded = codec.dumps(document)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded.decode('utf-8')) == document
+        assert codec.loads(encoded) == document
+        assert codec.loads(b'{"a": "line\nbreak"}') == {'a': 'line\nbreak'}
+        with pytest.raises(ValueError):
+            codec.loads(b'{not json')
+
+    def test_selection(self):
+        """
+        auto picks the fastest installed package; unknown names are rejected.
+        """
+        expected = 'orjson' if installed('orjson') else 'ujson' if installed('ujson') else 'json'
+        assert get_json_codec().name == expected
+        codec = StdlibJSONCodec()
+        assert get_json_codec(codec) is codec
+        with pytest.raises(ValueError):
+            get_json_codec('simplejson')
+
+    @responses.activate
+    def test_service_uses_codec(self):
+        """
+        Request bodies are encoded, and JSON responses decoded, by the service's codec.
+        """
+        responses.add(responses.PUT, allowlist_url, body='{"task": {"id": "task1"}}',
+                      content_type='application/json', status=202)
+        codec = RecordingCodec()
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator(), json_codec=codec)
+        service.set_service_url(base_url)
+
+        response = service.set_allowlist('testString', ip_addresses=[{'address': '10.0.0.0/8'}])
+
+        assert response.get_result() == {'task': {'id': 'task1'}}
+        assert response.get_status_code() == 202
+        assert codec.calls == [('dumps', {'ip_addresses': [{'address': '10.0.0.0/8'}]}),
+                               ('loads', b'{"task": {"id": "task1"}}')]
+        assert responses.calls[0].request.body == b'{"ip_addresses": [{"address": "10.0.0.0/8"}]}'
+
+    @responses.activate
+    def test_responses_without_json(self):
+        """
+        Empty and non-JSON bodies are handled as by the core; invalid JSON raises ApiException.
+        """
+        responses.add(responses.GET, allowlist_url, body='', status=200)
+        responses.add(responses.GET, allowlist_url, body='plain', content_type='text/plain', status=200)
+        responses.add(responses.GET, allowlist_url, body='{not json', content_type='application/json', status=200)
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator(), json_codec='auto')
+        service.set_service_url(base_url)
+
+        assert service.get_allowlist('testString').get_result() is None
+        assert service.get_allowlist('testString').get_result().text == 'plain'
+        with pytest.raises(ApiException) as err:
+            service.get_allowlist('testString')
+        assert err.value.message == 'Error processing the HTTP response'
+
+
+class TestSend():
+    """
+    Test Class for the send method of CloudDatabasesV5
+    """
+
+    @responses.activate
+    def test_bodies_are_read(self):
+        """
+        Response bodies are read, releasing their connection, unless the caller
+        asked for the streamed response.
+        """
+        responses.add(responses.GET, allowlist_url, json={'ip_addresses': []}, status=200)
+        responses.add(responses.HEAD, allowlist_url, status=200)
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url(base_url)
+
+        _, http_response = service._send(service.prepare_request('GET', '/deployments/testString/whitelists/ip_addresses'))
+        assert http_response._content_consumed
+        _, http_response = service._send(service.prepare_request('HEAD', '/deployments/testString/whitelists/ip_addresses'), stream=True)
+        assert http_response.raw.closed
+        response, http_response = service._send(service.prepare_request('GET', '/deployments/testString/whitelists/ip_addresses'), stream=True)
+        assert response.get_result() is http_response
+        assert not http_response._content_consumed
+        http_response.close()
+
+    @responses.activate
+    def test_logging(self, caplog):
+        """
+        Reserved arguments are dropped with a warning, and SSL errors are logged as
+        by the core.
+        """
+        responses.add(responses.GET, allowlist_url, json={'ip_addresses': []}, status=200)
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url(base_url)
+
+        service.send(service.prepare_request('GET', '/deployments/testString/whitelists/ip_addresses'), params={'a': 'b'}, headers={})
+        assert responses.calls[0].request.url == allowlist_url
+        assert [record.getMessage() for record in caplog.records] == ['"params" has been removed from the request']
+
+        responses.replace(responses.GET, allowlist_url, body=requests.exceptions.SSLError('bad certificate'))
+        with pytest.raises(requests.exceptions.SSLError):
+            service.get_allowlist('testString')
+        assert caplog.records[-1].getMessage() == service.ERROR_MSG_DISABLE_SSL
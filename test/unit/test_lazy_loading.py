@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lazy loading of the package and of the models
+"""
+
+import json
+import subprocess
+import sys
+import pytest
+import ibm_cloud_databases
+from ibm_cloud_databases import cloud_databases_v5, cloud_databases_v5_models
+
+
+def loaded_after(statement):
+    """
+    Return the modules of interest loaded by a fresh interpreter running a statement,
+    and whether it computed the User-Agent.
+    """
+    script = '\n'.join([
+        statement,
+        'import json, sys',
+        'common = sys.modules.get("ibm_cloud_databases.common")',
+        'print(json.dumps({"modules": sorted(name for name in sys.modules',
+        '                                     if name.startswith(("ibm_cloud", "asyncio"))),',
+        '                  "user_agent": common is not None and common._user_agent is not None}))',
+    ])
+    output = subprocess.run([sys.executable, '-c', script], check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output)
+
+
+class TestLazyLoading():
+    """
+    Test Class for the lazy loading of the package and of the models
+    """
+
+    def test_package_import(self):
+        """
+        Importing the package loads none of its modules.
+        """
+        loaded = loaded_after('import ibm_cloud_databases')
+        assert loaded['modules'] == ['ibm_cloud_databases', 'ibm_cloud_databases.version']
+
+    def test_client_import(self):
+        """
+        Importing the client loads neither the models nor asyncio, and does not
+        compute the User-Agent.
+        """
+        loaded = loaded_after('from ibm_cloud_databases import CloudDatabasesV5')
+        assert 'ibm_cloud_databases.cloud_databases_v5' in loaded['modules']
+        assert 'ibm_cloud_databases.cloud_databases_v5_models' not in loaded['modules']
+        assert 'asyncio' not in loaded['modules']
+        assert not loaded['user_agent']
+
+    def test_async_client_import(self):
+        """
+        Importing the asyncio client does not load the models either.
+        """
+        loaded = loaded_after('from ibm_cloud_databases import AsyncCloudDatabasesV5')
+        assert 'ibm_cloud_databases.cloud_databases_v5_async' in loaded['modules']
+        assert 'ibm_cloud_databases.cloud_databases_v5_models' not in loaded['modules']
+        assert not loaded['user_agent']
+
+    def test_models_on_first_use(self):
+        """
+        The models are loaded by their first use.
+        """
+        loaded = loaded_after('from ibm_cloud_databases.cloud_databases_v5 import Allowlist')
+        assert 'ibm_cloud_databases.cloud_databases_v5_models' in loaded['modules']
+        assert cloud_databases_v5.Allowlist is cloud_databases_v5_models.Allowlist
+        assert 'Allowlist' in dir(cloud_databases_v5)
+        with pytest.raises(AttributeError):
+            cloud_databases_v5.NoSuchModel # pylint: disable=pointless-statement
+
+    def test_star_import(self):
+        """
+        `from ibm_cloud_databases.cloud_databases_v5 import *` imports the client and
+        the models.
+        """
+        namespace = {}
+        exec('from ibm_cloud_databases.cloud_databases_v5 import *', namespace) # pylint: disable=exec-used
+        assert namespace['CloudDatabasesV5'] is cloud_databases_v5.CloudDatabasesV5
+        assert namespace['Task'] is cloud_databases_v5_models.Task
+        assert 'GetConnectionEnums' in namespace
+
+    def test_package_names(self):
+        """
+        Every name of the package can be imported from it.
+        """
+        for name in ibm_cloud_databases.__all__:
+            assert getattr(ibm_cloud_databases, name) is not None
+        assert set(ibm_cloud_databases.__all__) <= set(dir(ibm_cloud_databases))
+        with pytest.raises(AttributeError):
+            ibm_cloud_databases.NoSuchName # pylint: disable=pointless-statement
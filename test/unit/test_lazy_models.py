@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the lazy models
+"""
+
+import datetime
+import inspect
+import pytest
+from ibm_cloud_databases import cloud_databases_v5, lazy_models
+
+def protocol_json(scheme, port):
+    """
+    Build the connection information of one RabbitMQ protocol.
+    """
+    return {
+        'type': 'uri',
+        'composed': ['{0}://admin:$PASSWORD@host:{1}'.format(scheme, port)],
+        'scheme': scheme,
+        'hosts': [{'hostname': 'host', 'port': port}],
+        'path': '',
+        'query_options': {},
+        'authentication': {'method': 'direct', 'username': 'admin', 'password': None},
+        'certificate': {'name': 'cert', 'certificate_base64': 'Y2VydA=='},
+    }
+
+
+rabbitmq_json = {
+    'amqps': protocol_json('amqps', 31000),
+    'mqtts': protocol_json('mqtts', 31001),
+    'stomp_ssl': protocol_json('stomp', 31002),
+    'https': protocol_json('https', 31003),
+    'cli': {'type': 'cli', 'bin': 'rabbitmqadmin', 'arguments': [['--host=host', '--port=31003']]},
+}
+
+class TestLazyModels():
+    """
+    Test Class for lazy_models
+    """
+
+    def test_fields_are_converted_on_access(self):
+        """
+        Only the fields that are read are converted, once.
+        """
+        connection = lazy_models.ConnectionConnectionRabbitMQConnection.from_dict(rabbitmq_json)
+        assert list(vars(connection)) == ['_json']
+
+        amqps = connection.amqps
+        host = amqps.hosts[0]
+        assert (host.hostname, host.port) == ('host', 31000)
+        assert isinstance(amqps, lazy_models.RabbitMQConnectionAMQPS)
+        assert isinstance(amqps, cloud_databases_v5.RabbitMQConnectionAMQPS)
+        assert connection.amqps is amqps
+        assert 'mqtts' not in vars(connection)
+        assert 'certificate' not in vars(amqps)
+
+    def test_same_behavior_as_regular_models(self):
+        """
+        to_dict, __str__ and equality match the regular models.
+        """
+        regular = cloud_databases_v5.ConnectionConnectionRabbitMQConnection.from_dict(rabbitmq_json)
+        lazy = lazy_models.ConnectionConnectionRabbitMQConnection.from_dict(rabbitmq_json)
+        assert lazy.to_dict() == regular.to_dict()
+        assert str(lazy) == str(regular)
+        assert lazy == regular and regular == lazy
+        assert lazy != lazy_models.ConnectionConnectionRabbitMQConnection.from_dict(dict(rabbitmq_json, amqps=rabbitmq_json['mqtts']))
+
+    def test_datetimes(self):
+        """
+        Timestamps are parsed when read.
+        """
+        task = lazy_models.Task.from_dict({'id': 'task1', 'created_at': '2021-06-01T12:00:00Z'})
+        assert task.created_at == datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc)
+        assert task.status is None
+
+    def test_errors(self):
+        """
+        Required properties are checked up front; unknown attributes raise AttributeError.
+        """
+        with pytest.raises(ValueError, match='connection'):
+            lazy_models.Connection.from_dict({})
+        task = lazy_models.Task.from_dict({})
+        with pytest.raises(AttributeError):
+            task.unknown # pylint: disable=pointless-statement
+        task.status = 'running'
+        assert task.to_dict() == {'status': 'running'}
+
+    def test_source_unavailable(self, monkeypatch):
+        """
+        Without the source of the models, lazy models are converted in full.
+        """
+        def getsource(obj):
+            raise OSError('could not get source code')
+
+        monkeypatch.setattr(inspect, 'getsource', getsource)
+        model = type('Task', (lazy_models.LazyModel, cloud_databases_v5.Task), {})
+        task = model.from_dict({'id': 'task1', 'created_at': '2021-06-01T12:00:00Z'})
+        assert isinstance(task, model)
+        assert task.created_at == datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc)
+        assert task == cloud_databases_v5.Task.from_dict({'id': 'task1', 'created_at': '2021-06-01T12:00:00Z'})
+        with pytest.raises(AttributeError):
+            task.unknown # pylint: disable=pointless-statement
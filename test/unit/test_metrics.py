@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for per-operation metrics
+"""
+
+import asyncio
+import random
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import AllowlistEntry
+from ibm_cloud_databases.metrics import (NO_RESPONSE, LatencyHistogram, Metrics, MetricsRecorder,
+                                         render_prometheus)
+from .helpers import base_url, new_service
+
+
+class TestLatencyHistogram():
+    """
+    Test Class for LatencyHistogram
+    """
+
+    def test_quantiles(self):
+        """
+        Quantiles are within the precision of the buckets.
+        """
+        histogram = LatencyHistogram()
+        generator = random.Random(1)
+        values = sorted(generator.lognormvariate(-3, 1) for _ in range(10000))
+        for value in values:
+            histogram.record(value)
+        assert histogram.count == 10000
+        assert histogram.sum == pytest.approx(sum(values))
+        assert histogram.min == values[0]
+        assert histogram.max == values[-1]
+        for quantile in (0.5, 0.9, 0.99, 0.999):
+            exact = values[int(quantile * len(values)) - 1]
+            assert histogram.value_at_quantile(quantile) == pytest.approx(exact, rel=0.02)
+        assert histogram.value_at_quantile(1) == values[-1]
+        with pytest.raises(ValueError):
+            histogram.value_at_quantile(1.5)
+
+    def test_small_values_are_exact(self):
+        """
+        Values below 2 ** significant_bits microseconds are counted exactly.
+        """
+        histogram = LatencyHistogram(significant_bits=4)
+        for micros in range(1, 16):
+            histogram.record(micros / 1e6)
+        assert histogram.value_at_quantile(0.5) == pytest.approx(8e-6)
+        assert histogram.count_at_or_below(10e-6) == 10
+
+    def test_empty_and_clamped(self):
+        """
+        An empty histogram has no quantiles, and values past the range are clamped.
+        """
+        histogram = LatencyHistogram(max_seconds=1)
+        assert histogram.value_at_quantile(0.99) is None
+        histogram.record(10)
+        histogram.record(-1)
+        assert histogram.count == 2
+        assert histogram.count_at_or_below(1) == 1
+        assert histogram.value_at_quantile(1) == 10
+
+
+class TestMetrics():
+    """
+    Test Class for Metrics and render_prometheus
+    """
+
+    def test_record(self):
+        """
+        Requests are aggregated by operation.
+        """
+        metrics = Metrics()
+        metrics.record('get_task', 0.1, 200, response_bytes=100)
+        metrics.record('get_task', 0.3, 404, request_bytes=5, response_bytes=20, retries=2)
+        metrics.record('list_regions', 0.2, NO_RESPONSE)
+        assert [operation.operation_id for operation in metrics.operations()] == ['get_task', 'list_regions']
+        get_task = metrics.get('get_task')
+        assert dict(get_task.statuses) == {200: 1, 404: 1}
+        assert get_task.retries == 2
+        assert get_task.request_bytes == 5
+        assert get_task.response_bytes == 120
+        assert get_task.latency.count == 2
+        metrics.reset()
+        assert metrics.get('get_task') is None
+
+    def test_render_prometheus(self):
+        """
+        Metrics are rendered in the Prometheus text format.
+        """
+        metrics = Metrics()
+        metrics.record('get_task', 0.004, 200, response_bytes=100)
+        metrics.record('get_task', 0.2, 503, retries=1)
+        text = render_prometheus(metrics, buckets=[0.01, 1], quantiles=[0.5], labels={'region': 'us-south'})
+        lines = text.splitlines()
+        assert '# TYPE cloud_databases_requests_total counter' in lines
+        assert 'cloud_databases_requests_total{operation="get_task",code="200",region="us-south"} 1' in lines
+        assert 'cloud_databases_requests_total{operation="get_task",code="503",region="us-south"} 1' in lines
+        assert '# TYPE cloud_databases_request_duration_seconds histogram' in lines
+        assert 'cloud_databases_request_duration_seconds_bucket{operation="get_task",le="0.01",region="us-south"} 1' \
+            in lines
+        assert 'cloud_databases_request_duration_seconds_bucket{operation="get_task",le="1",region="us-south"} 2' \
+            in lines
+        assert 'cloud_databases_request_duration_seconds_bucket{operation="get_task",le="+Inf",region="us-south"} 2' \
+            in lines
+        assert 'cloud_databases_request_duration_seconds_count{operation="get_task",region="us-south"} 2' in lines
+        assert any(line.startswith('cloud_databases_request_duration_quantiles_seconds{operation="get_task",'
+                                   'quantile="0.5"') for line in lines)
+        assert 'cloud_databases_request_retries_total{operation="get_task",region="us-south"} 1' in lines
+        assert 'cloud_databases_response_bytes_total{operation="get_task",region="us-south"} 100' in lines
+        assert text.endswith('\n')
+
+    def test_render_escapes_labels(self):
+        """
+        Label values are escaped.
+        """
+        metrics = Metrics()
+        metrics.record('get_"task"', 0.1, 200)
+        assert 'operation="get_\\"task\\""' in render_prometheus(metrics)
+
+    def test_recorder_interface(self):
+        """
+        MetricsRecorder is an interface.
+        """
+        with pytest.raises(NotImplementedError):
+            MetricsRecorder().record('get_task', 0.1, 200)
+
+
+class TestClientMetrics():
+    """
+    Test Class for the metrics of CloudDatabasesV5
+    """
+
+    @responses.activate
+    def test_requests_are_recorded_by_operation(self):
+        """
+        Each operation is recorded under its operation_id, with its sizes and status.
+        """
+        body = '{"task": {"id": "5a9b1c2d"}}'
+        responses.add(responses.GET, base_url + '/tasks/5a9b1c2d', body=body, content_type='application/json',
+                      status=200)
+        responses.add(responses.POST, base_url + '/deployments/abc/whitelists/ip_addresses', body=body,
+                      content_type='application/json', status=202)
+        responses.add(responses.GET, base_url + '/deployments/missing', body='{"errors": [{"message": "no"}]}',
+                      content_type='application/json', status=404)
+        service = new_service()
+        metrics = service.enable_metrics()
+
+        service.get_task('5a9b1c2d')
+        service.get_task('5a9b1c2d')
+        service.add_allowlist_entry('abc', ip_address=AllowlistEntry(address='192.0.2.0/24'))
+        with pytest.raises(ApiException):
+            service.get_deployment_info('missing')
+
+        get_task = metrics.get('get_task')
+        assert dict(get_task.statuses) == {200: 2}
+        assert get_task.latency.count == 2
+        assert get_task.response_bytes == 2 * len(body)
+        add = metrics.get('add_allowlist_entry')
+        assert dict(add.statuses) == {202: 1}
+        assert add.request_bytes == len(responses.calls[2].request.body)
+        assert dict(metrics.get('get_deployment_info').statuses) == {404: 1}
+
+    @responses.activate
+    def test_connection_errors_and_cache_hits(self):
+        """
+        Requests without a response are recorded, and cache hits are not.
+        """
+        responses.add(responses.GET, base_url + '/regions', body=requests.ConnectionError('refused'))
+        responses.add(responses.GET, base_url + '/deployments/abc/users/database/admin/connections/public',
+                      json={'connection': {}}, status=200)
+        service = new_service()
+        metrics = Metrics()
+        assert service.enable_metrics(metrics) is metrics
+        service.enable_connection_cache()
+        with pytest.raises(requests.ConnectionError):
+            service.list_regions()
+        service.get_connection('abc', 'database', 'admin', 'public')
+        service.get_connection('abc', 'database', 'admin', 'public')
+        assert dict(metrics.get('list_regions').statuses) == {NO_RESPONSE: 1}
+        assert metrics.get('get_connection').latency.count == 1
+
+    @responses.activate
+    def test_disabled(self):
+        """
+        Nothing is recorded once metrics are disabled.
+        """
+        responses.add(responses.GET, base_url + '/regions', json={'regions': []}, status=200)
+        service = new_service()
+        metrics = service.enable_metrics()
+        service.disable_metrics()
+        service.list_regions()
+        assert metrics.operations() == []
+
+    def test_async(self):
+        """
+        The asyncio client records its requests too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+
+        def handler(request):
+            return httpx.Response(503 if request.url.path == '/regions' else 200, json={'task': {}})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                metrics = service.enable_metrics()
+                await service.get_task('5a9b1c2d')
+                with pytest.raises(ApiException):
+                    await service.list_regions()
+                return metrics
+
+        metrics = asyncio.run(run())
+        assert dict(metrics.get('get_task').statuses) == {200: 1}
+        assert metrics.get('get_task').response_bytes == len(b'{"task":{}}')
+        assert dict(metrics.get('list_regions').statuses) == {503: 1}
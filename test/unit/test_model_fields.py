@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for model_fields
+"""
+
+import inspect
+import pytest
+from ibm_cloud_databases import cloud_databases_v5
+from ibm_cloud_databases.model_fields import DATETIME, MODEL, MODEL_LIST, VALUE, SourceUnavailableError, get_model_fields
+
+
+class TestModelFields():
+    """
+    Test Class for get_model_fields
+    """
+
+    def test_every_model_is_described(self):
+        """
+        The fields of every model match the arguments of its constructor.
+        """
+        for model in vars(cloud_databases_v5).values():
+            if isinstance(model, type) and hasattr(model, 'from_dict'):
+                names = [field.name for field in get_model_fields(model)]
+                assert sorted(names) == sorted(list(inspect.signature(model.__init__).parameters)[1:]), model
+
+    def test_kinds(self):
+        """
+        Nested models, lists, datetimes, renamed keys and required properties are recognized.
+        """
+        fields = {field.name: field for field in get_model_fields(cloud_databases_v5.Backup)}
+        assert fields['id'].kind == VALUE
+        assert fields['created_at'].kind == DATETIME
+
+        field = get_model_fields(cloud_databases_v5.Groups)[0]
+        assert (field.kind, field.model) == (MODEL_LIST, cloud_databases_v5.Group)
+
+        fields = {field.name: field for field in get_model_fields(cloud_databases_v5.Group)}
+        assert (fields['memory'].kind, fields['memory'].model) == (MODEL, cloud_databases_v5.GroupMemory)
+
+        field = get_model_fields(cloud_databases_v5.SetConfigurationConfigurationRedisConfiguration)[0]
+        assert (field.name, field.key) == ('maxmemory_redis', 'maxmemory-redis')
+
+        field = get_model_fields(cloud_databases_v5.Connection)[0]
+        assert field.required and not get_model_fields(cloud_databases_v5.Task)[0].required
+
+    def test_unexpected_pattern(self):
+        """
+        Hand written from_dict methods are rejected.
+        """
+        class Custom():
+            """A model with a custom from_dict."""
+            @classmethod
+            def from_dict(cls, _dict):
+                """Initialize from a json dictionary."""
+                args = {}
+                if 'name' in _dict:
+                    args['name'] = str(_dict['name']).upper()
+                return cls(**args)
+
+        with pytest.raises(ValueError):
+            get_model_fields(Custom)
+
+    def test_source_unavailable(self, monkeypatch):
+        """
+        Models whose source is not installed are reported as such.
+        """
+        def getsource(obj):
+            raise OSError('could not get source code')
+
+        monkeypatch.setattr(inspect, 'getsource', getsource)
+        with pytest.raises(SourceUnavailableError):
+            get_model_fields(cloud_databases_v5.Task)
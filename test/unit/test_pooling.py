@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the shared connection pool
+"""
+
+from concurrent import futures
+import pytest
+import requests
+from ibm_cloud_databases.fakeserver import FakeServer, Latency
+from ibm_cloud_databases.pooling import ConnectionPool, get_shared_connection_pool
+from .helpers import new_service
+
+
+class TestConnectionPool():
+    """
+    Test Class for ConnectionPool
+    """
+
+    def test_clients_share_connections(self):
+        """
+        Clients of the same pool reuse each other's connections.
+        """
+        pool = ConnectionPool()
+        with FakeServer() as server:
+            services = [new_service(server.url) for _ in range(3)]
+            for service in services:
+                assert service.enable_connection_pooling(pool) is pool
+            for _ in range(2):
+                for service in services:
+                    service.list_regions()
+        assert pool.stats() == {'hits': 5, 'new_connections': 1, 'waits': 0}
+        pool.close()
+
+    def test_own_connections(self):
+        """
+        Without the pool, each client opens its own connection.
+        """
+        pool = ConnectionPool()
+        with FakeServer() as server:
+            service, other = new_service(server.url), new_service(server.url)
+            service.enable_connection_pooling(pool)
+            service.list_regions()
+            other.list_regions()
+            service.disable_connection_pooling()
+            assert service.connection_pool is None
+            service.list_regions()
+        assert (pool.hits, pool.new_connections) == (0, 1)
+
+    def test_block(self):
+        """
+        A blocking pool opens at most maxsize connections to a host, and counts the
+        requests that waited for one.
+        """
+        pool = ConnectionPool(maxsize=2, block=True)
+        with FakeServer(latency=Latency('fixed', 0.05)) as server:
+            service = new_service(server.url)
+            service.enable_connection_pooling(pool)
+            with futures.ThreadPoolExecutor(max_workers=6) as executor:
+                list(executor.map(lambda _: service.list_regions(), range(6)))
+        assert pool.new_connections == 2
+        assert pool.hits == 4
+        assert pool.waits >= 1
+
+    def test_ssl_verification(self):
+        """
+        Clients that disabled SSL verification get an adapter of their own, also
+        when they change the setting or their http client afterwards.
+        """
+        pool = ConnectionPool()
+        service = new_service('https://fake')
+        service.enable_connection_pooling(pool)
+        assert service.http_client.get_adapter('https://fake') is pool.adapter()
+        service.set_disable_ssl_verification(True)
+        assert service.http_client.get_adapter('https://fake') is pool.adapter(True)
+        assert pool.adapter(True) is not pool.adapter()
+        service.set_http_client(requests.Session())
+        assert service.http_client.get_adapter('https://fake') is pool.adapter(True)
+
+    def test_disable_keeps_ssl_verification(self):
+        """
+        Disabling the pool mounts an adapter of the client's own, which keeps its
+        SSL verification setting.
+        """
+        pool = ConnectionPool()
+        service = new_service('https://fake')
+        service.set_disable_ssl_verification(True)
+        service.enable_connection_pooling(pool)
+        service.disable_connection_pooling()
+        adapter = service.http_client.get_adapter('https://fake')
+        assert adapter is service.http_adapter
+        assert adapter is not pool.adapter(True)
+        assert adapter._disable_ssl_verification # pylint: disable=protected-access
+
+    def test_resize(self):
+        """
+        Resizing the pool closes its idle connections and keeps counting them.
+        """
+        pool = ConnectionPool(maxsize=2)
+        with FakeServer() as server:
+            service = new_service(server.url)
+            service.enable_connection_pooling(pool)
+            service.list_regions()
+            pool.resize(5)
+            service.list_regions()
+        assert pool.maxsize == 5
+        assert pool.adapter().poolmanager.connection_pool_kw['maxsize'] == 5
+        assert (pool.hits, pool.new_connections) == (0, 2)
+        with pytest.raises(ValueError):
+            pool.resize(0)
+
+    def test_shared(self):
+        """
+        Clients use the pool of the process by default.
+        """
+        service = new_service('https://fake')
+        assert service.enable_connection_pooling() is get_shared_connection_pool()
+
+    def test_invalid(self):
+        """
+        Sizes are validated.
+        """
+        with pytest.raises(ValueError):
+            ConnectionPool(maxsize=0)
+        with pytest.raises(ValueError):
+            ConnectionPool(max_hosts=0)
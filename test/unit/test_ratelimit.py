@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for client side rate limiting
+"""
+
+import asyncio
+import pytest
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.metrics import Metrics, render_prometheus
+from ibm_cloud_databases.ratelimit import (DEFAULT_RETRY_AFTER, MAX_RETRY_AFTER, RateLimiter, TokenBucket,
+                                           get_shared_rate_limiter, retry_after)
+from .helpers import FakeClock, base_url, new_service
+
+
+class TestTokenBucket():
+    """
+    Test Class for TokenBucket
+    """
+
+    def test_burst_then_rate(self):
+        """
+        A burst is sent at once, then requests are spaced by the rate.
+        """
+        clock = FakeClock()
+        bucket = TokenBucket(10, 3, clock=clock)
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+        assert bucket.wait_time() == pytest.approx(0.3)
+        clock.now += 10
+        assert bucket.wait_time() == 0
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.requests == 8
+        assert bucket.waited == pytest.approx(0.3)
+
+    def test_pause(self):
+        """
+        A paused bucket resumes at its steady rate.
+        """
+        clock = FakeClock()
+        bucket = TokenBucket(10, 5, clock=clock)
+        bucket.pause(2)
+        assert bucket.throttled == 1
+        assert bucket.wait_time() == pytest.approx(2)
+        assert bucket.reserve() == pytest.approx(2)
+        assert bucket.reserve() == pytest.approx(2.1)
+
+    def test_invalid(self):
+        """
+        Rates and bursts must be positive.
+        """
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, 0)
+
+
+class TestRateLimiter():
+    """
+    Test Class for RateLimiter
+    """
+
+    def test_buckets(self):
+        """
+        Task polls, reads and writes have separate buckets.
+        """
+        limiter = RateLimiter()
+        assert limiter.bucket('get_task', 'GET') is limiter.buckets['task_polls']
+        assert limiter.bucket('get_deployment_info', 'GET') is limiter.buckets['reads']
+        assert limiter.bucket('set_allowlist', 'PUT') is limiter.buckets['writes']
+        assert limiter.bucket(None, 'DELETE') is limiter.buckets['writes']
+        assert get_shared_rate_limiter() is get_shared_rate_limiter()
+
+    def test_retry_after(self):
+        """
+        Retry-After is either seconds or an HTTP date.
+        """
+        assert retry_after('3') == 3
+        assert retry_after(None) == DEFAULT_RETRY_AFTER
+        assert retry_after('soon') == DEFAULT_RETRY_AFTER
+        assert retry_after('86400') == MAX_RETRY_AFTER
+        assert retry_after('Wed, 21 Oct 2015 07:28:05 GMT', now=lambda: 1445412480.0) == 5
+
+    @responses.activate
+    def test_client(self):
+        """
+        Requests wait for their bucket, and a 429 pauses the bucket.
+        """
+        clock = FakeClock()
+        limiter = RateLimiter(writes=TokenBucket(2, 1, clock=clock), sleep=clock.sleep)
+        responses.add(responses.POST, base_url + '/deployments/abc/remotes/resync', json={}, status=202)
+        responses.add(responses.POST, base_url + '/deployments/abc/remotes/resync', json={}, status=429,
+                      headers={'Retry-After': '7'})
+        responses.add(responses.GET, base_url + '/regions', json={'regions': []}, status=200)
+        service = new_service()
+        assert service.enable_rate_limiting(limiter) is limiter
+
+        service.resync_replica('abc')
+        with pytest.raises(ApiException):
+            service.resync_replica('abc')
+        assert clock.sleeps == [pytest.approx(0.5)]
+        assert limiter.buckets['writes'].wait_time() == pytest.approx(7)
+        service.list_regions()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+        text = render_prometheus(Metrics(), rate_limiter=limiter)
+        assert 'cloud_databases_rate_limit_wait_seconds{bucket="writes"} 7.0' in text.splitlines()
+        assert 'cloud_databases_rate_limit_throttled_total{bucket="writes"} 1' in text.splitlines()
+
+        service.disable_rate_limiting()
+        service.list_regions()
+        assert limiter.buckets['reads'].requests == 1
+
+    def test_async(self):
+        """
+        The asyncio client waits for its buckets without blocking the loop.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        limiter = RateLimiter(task_polls=TokenBucket(50, 1))
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(
+                        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))),
+            ) as service:
+                service.set_service_url(base_url)
+                service.enable_rate_limiting(limiter)
+                start = asyncio.get_event_loop().time()
+                await asyncio.gather(*[service.get_task('t') for _ in range(3)])
+                return asyncio.get_event_loop().time() - start
+
+        assert asyncio.run(run()) >= 0.035
+        assert limiter.buckets['task_polls'].requests == 3
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for retry policies and circuit breakers
+"""
+
+import asyncio
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import AllowlistEntry
+from ibm_cloud_databases.retries import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .helpers import FakeClock, base_url, new_service
+
+crn = 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/1:abc::'
+
+
+def new_retrying_service(**policy_args):
+    """
+    Return a client retrying without sleeping, and the delays it slept.
+    """
+    service = new_service()
+    delays = []
+    service.enable_retry_policy(RetryPolicy(sleep=delays.append, **policy_args))
+    return service, delays
+
+
+def api_error(status, headers=None):
+    """
+    Return the ApiException of a response with a status.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return ApiException(status, http_response=response)
+
+
+class TestRetryPolicy():
+    """
+    Test Class for RetryPolicy
+    """
+
+    def test_idempotency(self):
+        """
+        GET requests, conditional requests and listed operations are idempotent.
+        """
+        policy = RetryPolicy()
+        assert policy.is_idempotent('get_task', {'method': 'GET', 'headers': {}})
+        assert policy.is_idempotent('set_allowlist', {'method': 'PUT', 'headers': {'If-Match': '"e1"'}})
+        assert not policy.is_idempotent('set_allowlist', {'method': 'PUT', 'headers': {}})
+        assert policy.is_idempotent('complete_connection', {'method': 'POST', 'headers': {}})
+        assert not policy.is_idempotent('start_ondemand_backup', {'method': 'POST', 'headers': {}})
+
+    def test_decorrelated_jitter(self):
+        """
+        Delays are drawn between the base delay and three times the previous one,
+        up to the maximum.
+        """
+        policy = RetryPolicy(base_delay=1, max_delay=10, uniform=lambda low, high: high)
+        assert policy.backoff(0) == 3
+        assert policy.backoff(3) == 9
+        assert policy.backoff(9) == 10
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        delays = [policy.backoff(2) for _ in range(100)]
+        assert all(1 <= delay <= 6 for delay in delays)
+        assert len(set(delays)) > 90
+
+    def test_retry_delay(self):
+        """
+        Retryable errors get a delay until the last attempt, non-idempotent requests
+        only when they were not processed, and Retry-After is honored.
+        """
+        policy = RetryPolicy(max_attempts=3, base_delay=1, max_delay=30, uniform=lambda low, high: low)
+        get = {'method': 'GET', 'headers': {}}
+        post = {'method': 'POST', 'headers': {}}
+        assert policy.retry_delay('get_task', get, api_error(503), 1, 0) == 1
+        assert policy.retry_delay('get_task', get, api_error(503), 3, 1) is None
+        assert policy.retry_delay('get_task', get, api_error(404), 1, 0) is None
+        assert policy.retry_delay('get_task', get, ValueError(), 1, 0) is None
+        assert policy.retry_delay('get_task', get, requests.exceptions.ReadTimeout(), 1, 0) == 1
+        assert policy.retry_delay('get_task', get, api_error(429, {'Retry-After': '7'}), 1, 0) == 7
+        assert policy.retry_delay('get_task', get, api_error(429, {'Retry-After': '60'}), 1, 0) is None
+        assert policy.retry_delay('start_ondemand_backup', post, api_error(500), 1, 0) is None
+        assert policy.retry_delay('start_ondemand_backup', post, requests.exceptions.ReadTimeout(), 1, 0) is None
+        assert policy.retry_delay('start_ondemand_backup', post, api_error(429), 1, 0) == 1
+        assert policy.retry_delay('start_ondemand_backup', post, requests.exceptions.ConnectTimeout(), 1, 0) == 1
+        assert (policy.retries, policy.refused) == (5, 2)
+
+    def test_invalid(self):
+        """
+        Attempts and delays are validated.
+        """
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=2, max_delay=1)
+
+
+class TestCircuitBreaker():
+    """
+    Test Class for CircuitBreaker
+    """
+
+    def test_open_and_recover(self):
+        """
+        A circuit opens after consecutive failures, lets one request through after
+        the recovery time, and closes when it succeeds.
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, recovery_time=10, clock=clock)
+        for _ in range(2):
+            breaker.before_request('a')
+            breaker.record_failure('a')
+        breaker.record_success('a')
+        for _ in range(3):
+            breaker.before_request('a')
+            breaker.record_failure('a')
+        assert breaker.state('a') == 'open'
+        assert breaker.state('b') == 'closed'
+        breaker.before_request('b')
+        with pytest.raises(CircuitOpenError) as err:
+            breaker.before_request('a')
+        assert err.value.deployment_id == 'a'
+        assert err.value.retry_in == 10
+        clock.now += 10
+        breaker.before_request('a')
+        assert breaker.state('a') == 'half_open'
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request('a')
+        breaker.record_failure('a')
+        assert breaker.state('a') == 'open'
+        clock.now += 10
+        breaker.before_request('a')
+        breaker.record_success('a')
+        assert breaker.state('a') == 'closed'
+        assert (breaker.opened, breaker.rejected) == (2, 2)
+
+    def test_record_error(self):
+        """
+        Only 5xx statuses and requests without response count as failures, and
+        throttling does not reset the count.
+        """
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_error('a', api_error(502))
+        breaker.record_error('a', api_error(429))
+        breaker.record_error('a', ValueError())
+        breaker.record_error('a', requests.exceptions.ConnectionError())
+        assert breaker.state('a') == 'open'
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_error('a', api_error(502))
+        breaker.record_error('a', api_error(404))
+        breaker.record_error('a', api_error(502))
+        assert breaker.state('a') == 'closed'
+
+
+class TestClientRetries():
+    """
+    Test Class for the retries and circuit breakers of CloudDatabasesV5
+    """
+
+    @responses.activate
+    def test_get_is_retried(self):
+        """
+        A GET request is retried until it succeeds.
+        """
+        url = base_url + '/deployments/abc/groups'
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, status=429, headers={'Retry-After': '2'})
+        responses.add(responses.GET, url, json={'groups': []}, status=200)
+        service, delays = new_retrying_service(base_delay=0.1, max_delay=5)
+        response = service.list_deployment_scaling_groups('abc')
+        assert response.get_result() == {'groups': []}
+        assert len(responses.calls) == 3
+        assert len(delays) == 2
+        assert 0.1 <= delays[0] <= 0.3
+        assert delays[1] >= 2
+
+    @responses.activate
+    def test_attempts_are_limited(self):
+        """
+        A request failing every time is sent max_attempts times.
+        """
+        responses.add(responses.GET, base_url + '/regions', status=500)
+        service, delays = new_retrying_service(max_attempts=3)
+        with pytest.raises(ApiException) as err:
+            service.list_regions()
+        assert err.value.status_code == 500
+        assert len(responses.calls) == 3
+        assert len(delays) == 2
+
+    @responses.activate
+    def test_conditional_put_is_retried(self):
+        """
+        set_allowlist is retried when it carries If-Match, and not otherwise.
+        """
+        url = base_url + '/deployments/abc/whitelists/ip_addresses'
+        responses.add(responses.PUT, url, status=502)
+        responses.add(responses.PUT, url, json={'task_id': 't'}, status=200)
+        service, _ = new_retrying_service()
+        entries = [AllowlistEntry(address='10.0.0.1/32')]
+        service.set_allowlist('abc', ip_addresses=entries, if_match='"e1"')
+        assert len(responses.calls) == 2
+        responses.replace(responses.PUT, url, status=502)
+        with pytest.raises(ApiException):
+            service.set_allowlist('abc', ip_addresses=entries)
+        assert len(responses.calls) == 3
+        assert service.retry_policy.refused == 1
+
+    @responses.activate
+    def test_post_is_not_retried(self):
+        """
+        start_ondemand_backup is not sent again after a 5xx status, but is after a
+        429 status.
+        """
+        url = base_url + '/deployments/abc/backups'
+        responses.add(responses.POST, url, status=500)
+        service, delays = new_retrying_service()
+        with pytest.raises(ApiException):
+            service.start_ondemand_backup('abc')
+        assert len(responses.calls) == 1
+        assert not delays
+        responses.replace(responses.POST, url, status=429)
+        responses.add(responses.POST, url, json={'task': {}}, status=202)
+        service.start_ondemand_backup('abc')
+        assert len(responses.calls) == 3
+        service.disable_retry_policy()
+        assert service.retry_policy is None
+
+    @responses.activate
+    def test_circuit_breaker(self):
+        """
+        The requests of a failing deployment fail fast, without stopping those of
+        other deployments.
+        """
+        failing = base_url + '/deployments/' + requests.utils.quote(crn, safe='')
+        responses.add(responses.GET, failing, status=503)
+        responses.add(responses.GET, base_url + '/deployments/other', json={'deployment': {}}, status=200)
+        service, delays = new_retrying_service(max_attempts=10)
+        breaker = service.enable_circuit_breaker(CircuitBreaker(failure_threshold=3))
+        with pytest.raises(CircuitOpenError) as err:
+            service.get_deployment_info(crn)
+        assert err.value.deployment_id == crn
+        assert len(responses.calls) == 3
+        assert len(delays) == 3
+        with pytest.raises(CircuitOpenError):
+            service.get_deployment_info(crn)
+        assert len(responses.calls) == 3
+        service.get_deployment_info('other')
+        assert breaker.rejected == 2
+        service.disable_circuit_breaker()
+        service.disable_retry_policy()
+        with pytest.raises(ApiException):
+            service.get_deployment_info(crn)
+
+    def test_async(self):
+        """
+        The asyncio client retries requests too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        statuses = [503, 502, 200]
+
+        async def handler(request):
+            return httpx.Response(statuses.pop(0), json={'task': {'id': 't'}})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                service.enable_retry_policy(RetryPolicy(base_delay=0.001, max_delay=0.01))
+                return await service.get_task('t')
+
+        response = asyncio.run(run())
+        assert response.get_result() == {'task': {'id': 't'}}
+        assert not statuses
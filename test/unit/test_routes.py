@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the route table
+"""
+
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5
+from ibm_cloud_databases.common import get_user_agent
+from ibm_cloud_databases.routes import ROUTES, Route
+
+
+class TestRoute():
+    """
+    Test Class for Route
+    """
+
+    def test_url(self):
+        """
+        Path parameters are encoded into the template in order.
+        """
+        route = ROUTES['get_connection']
+        assert route.method == 'GET'
+        assert route.path_param_keys == ['id', 'user_type', 'user_id', 'endpoint_type']
+        assert route.url('crn:v1:a/b::', 'database', 'admin', 'public') == \
+            '/deployments/crn%3Av1%3Aa%2Fb%3A%3A/users/database/admin/connections/public'
+        assert ROUTES['list_regions'].url() == '/regions'
+        with pytest.raises(ValueError):
+            route.url('crn:v1:a/b::')
+
+    def test_headers(self):
+        """
+        Caller headers override the SDK headers but not Accept, and header
+        parameters set to None are left out.
+        """
+        route = ROUTES['set_allowlist']
+        base = route.headers()
+        assert dict(base) == {'User-Agent': get_user_agent(), 'content-type': 'application/json',
+                              'Accept': 'application/json'}
+        with pytest.raises(TypeError):
+            base['Accept'] = 'text/plain'
+        assert route.headers(None, {'If-Match': None}) is base
+        headers = route.headers({'User-Agent': 'fleet/1.0', 'Accept': 'text/plain'}, {'If-Match': '"abc"'})
+        assert headers == {'If-Match': '"abc"', 'User-Agent': 'fleet/1.0', 'content-type': 'application/json',
+                           'Accept': 'application/json'}
+        assert 'content-type' not in ROUTES['get_task'].headers()
+
+    def test_table(self):
+        """
+        Every operation of the client has a route.
+        """
+        assert len(ROUTES) == 28
+        for operation_id, route in ROUTES.items():
+            assert route.operation_id == operation_id
+            assert callable(getattr(CloudDatabasesV5, operation_id))
+            assert route.url(*['x'] * len(route.path_param_keys)).count('/x') == len(route.path_param_keys)
+        assert Route('get', 'GET', '/a/{b}/c/{d}').url('1', '2') == '/a/1/c/2'
+
+    @responses.activate
+    def test_requests(self):
+        """
+        Requests are built from the route of their operation.
+        """
+        responses.add(responses.PUT, 'https://fake/deployments/abc/whitelists/ip_addresses', json={}, status=200)
+        service = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+        service.set_service_url('https://fake')
+        service.set_allowlist('abc', ip_addresses=[], if_match='"v1"', headers={'X-Request-Id': 'r1'})
+        request = responses.calls[0].request
+        assert request.headers['If-Match'] == '"v1"'
+        assert request.headers['X-Request-Id'] == 'r1'
+        assert request.headers['Content-Type'] == 'application/json'
+        assert request.headers['Accept'] == 'application/json'
+        assert request.headers['User-Agent'] == get_user_agent()
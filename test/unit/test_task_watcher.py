@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for TaskWatcher
+"""
+
+import json
+import time
+import requests
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5
+from ibm_cloud_databases.fakeserver import FakeServer, Latency
+from ibm_cloud_databases.task_watcher import TaskWatcher
+from ibm_cloud_databases.tasks import TaskPollingPolicy
+
+service = CloudDatabasesV5(
+    authenticator=NoAuthAuthenticator()
+    )
+
+base_url = 'https://fake'
+service.set_service_url(base_url)
+
+fast_policy = TaskPollingPolicy(initial_interval=0.01, min_interval=0.01, max_interval=0.01)
+
+
+def tasks_body(*tasks):
+    """
+    Build a list_deployment_tasks response body from (id, status) pairs.
+    """
+    return json.dumps({'tasks': [{'id': task_id, 'status': status} for task_id, status in tasks]})
+
+
+class TestTaskWatcher():
+    """
+    Test Class for TaskWatcher
+    """
+
+    @responses.activate
+    def test_tasks_on_one_deployment_share_polls(self):
+        """
+        Tasks of the same deployment are polled with one list_deployment_tasks call.
+        """
+        url = base_url + '/deployments/dep1/tasks'
+        responses.add(responses.GET, url, body=tasks_body(('t1', 'running'), ('t2', 'running')),
+                      content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=tasks_body(('t1', 'completed'), ('t2', 'running')),
+                      content_type='application/json', status=200)
+        responses.add(responses.GET, url, body=tasks_body(('t1', 'completed'), ('t2', 'failed')),
+                      content_type='application/json', status=200)
+
+        watcher = TaskWatcher(service, polling_policy=fast_policy)
+        watcher.watch({'id': 't1', 'status': 'running', 'deployment_id': 'dep1'})
+        watcher.watch('t2', deployment_id='dep1')
+        assert len(watcher) == 2
+
+        events = list(watcher)
+
+        assert [(event.task_id, event.task.status) for event in events] == [('t1', 'completed'), ('t2', 'failed')]
+        assert events[0].succeeded and not events[1].succeeded
+        assert len(responses.calls) == 3
+        assert all(call.request.url == url for call in responses.calls)
+        assert len(watcher) == 0
+
+    @responses.activate
+    def test_fallback_to_get_task(self):
+        """
+        Tasks without a deployment, or missing from its task list, are polled with get_task.
+        """
+        responses.add(responses.GET, base_url + '/deployments/dep1/tasks', body=tasks_body(),
+                      content_type='application/json', status=200)
+        responses.add(responses.GET, base_url + '/tasks/t1',
+                      body='{"task": {"id": "t1", "status": "completed"}}',
+                      content_type='application/json', status=200)
+        responses.add(responses.GET, base_url + '/tasks/t2', body='{"errors": [{"message": "not found"}]}',
+                      content_type='application/json', status=404)
+
+        watcher = TaskWatcher(service, polling_policy=fast_policy)
+        watcher.watch('t1', deployment_id='dep1')
+        watcher.watch('t2')
+        events = {event.task_id: event for event in watcher}
+
+        assert events['t1'].succeeded
+        assert events['t2'].task is None and not events['t2'].timed_out
+
+    @responses.activate
+    def test_errors_are_retried(self):
+        """
+        A failed poll is retried later instead of ending the watch.
+        """
+        url = base_url + '/tasks/t1'
+        responses.add(responses.GET, url, body='{"errors": [{"message": "unavailable"}]}',
+                      content_type='application/json', status=503)
+        responses.add(responses.GET, url, body='{"task": {"id": "t1", "status": "completed"}}',
+                      content_type='application/json', status=200)
+
+        watcher = TaskWatcher(service, polling_policy=fast_policy)
+        watcher.watch('t1')
+        events = list(watcher)
+
+        assert len(responses.calls) == 2
+        assert events[0].succeeded
+
+    @responses.activate
+    def test_timeout_while_the_api_fails(self):
+        """
+        Tasks time out when every poll fails, with an error status or without a
+        response.
+        """
+        responses.add(responses.GET, base_url + '/deployments/dep1/tasks', status=503)
+        responses.add(responses.GET, base_url + '/tasks/t2',
+                      body=requests.exceptions.ConnectionError('connection refused'))
+
+        watcher = TaskWatcher(service, timeout=0.3, polling_policy=fast_policy)
+        watcher.watch('t1', deployment_id='dep1')
+        watcher.watch('t2')
+        start = time.monotonic()
+        events = list(watcher)
+
+        assert time.monotonic() - start < 1
+        assert sorted(event.task_id for event in events) == ['t1', 't2']
+        assert all(event.timed_out for event in events)
+        assert len(watcher) == 0
+
+    def test_hung_poll(self):
+        """
+        A poll that is not answered fails when the first of its tasks times out.
+        """
+        with FakeServer(latency=Latency('fixed', 0.5)) as server:
+            client = CloudDatabasesV5(authenticator=NoAuthAuthenticator())
+            client.set_service_url(server.url)
+            watcher = TaskWatcher(client, timeout=0.2, polling_policy=fast_policy)
+            watcher.watch('t1', deployment_id='dep1')
+            watcher.watch('t2')
+            start = time.monotonic()
+            events = list(watcher)
+
+            assert time.monotonic() - start < 0.4
+            assert sorted(event.task_id for event in events) == ['t1', 't2']
+            assert all(event.timed_out for event in events)
+
+    @responses.activate
+    def test_timeout(self):
+        """
+        Tasks still running at the timeout produce a timed out event.
+        """
+        responses.add(responses.GET, base_url + '/tasks/t1',
+                      body='{"task": {"id": "t1", "status": "running", "progress_percent": 10}}',
+                      content_type='application/json', status=200)
+
+        watcher = TaskWatcher(service, timeout=0.05, polling_policy=fast_policy)
+        watcher.watch('t1')
+        events = list(watcher)
+
+        assert len(events) == 1
+        assert events[0].timed_out
+        assert events[0].task.progress_percent == 10
+        assert repr(events[0]) == '<TaskEvent t1: timed out>'
+
+    def test_finished_task_is_reported_without_polling(self):
+        """
+        Watching a task that already finished yields its event immediately.
+        """
+        watcher = TaskWatcher(service, polling_policy=fast_policy)
+        watcher.watch({'id': 't1', 'status': 'completed'})
+        assert [event.task_id for event in watcher] == ['t1']
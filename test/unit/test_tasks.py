@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the task helpers
+"""
+
+from datetime import datetime, timedelta, timezone
+import json
+import time
+import pytest
+import responses
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.cloud_databases_v5 import CloudDatabasesV5, Task
+from ibm_cloud_databases.tasks import TaskPollingPolicy, TaskTimeoutError, TaskWaiter
+
+service = CloudDatabasesV5(
+    authenticator=NoAuthAuthenticator()
+    )
+
+base_url = 'https://fake'
+service.set_service_url(base_url)
+
+fast_policy = TaskPollingPolicy(initial_interval=0.01, min_interval=0.01, max_interval=0.01)
+
+
+class TestTaskPollingPolicy():
+    """
+    Test Class for TaskPollingPolicy
+    """
+
+    def test_backoff_without_progress(self):
+        """
+        The interval grows exponentially while a task reports no progress.
+        """
+        policy = TaskPollingPolicy(initial_interval=1, min_interval=0.5, max_interval=10, jitter=0)
+        task = Task(status='running')
+        intervals = [policy.next_interval(task)]
+        for _ in range(5):
+            intervals.append(policy.next_interval(task, intervals[-1]))
+        assert intervals == [1, 2, 4, 8, 10, 10]
+
+    def test_interval_from_progress(self):
+        """
+        The interval follows the remaining time extrapolated from the progress.
+        """
+        policy = TaskPollingPolicy(min_interval=0.5, max_interval=600, jitter=0, estimate_fraction=0.5)
+        now = datetime(2021, 4, 1, 12, 0, 0, tzinfo=timezone.utc)
+        task = Task(status='running', progress_percent=25, created_at=now - timedelta(seconds=100))
+        assert policy.estimate_remaining(task, now) == 300
+        assert policy.next_interval(task, 1, now) == 150
+
+        nearly_done = Task(status='running', progress_percent=99, created_at=now - timedelta(seconds=10))
+        assert policy.next_interval(nearly_done, 30, now) == 0.5
+
+    def test_jitter_bounds(self):
+        """
+        Jitter varies the interval within the configured fraction.
+        """
+        policy = TaskPollingPolicy(initial_interval=10, min_interval=0.5, max_interval=60, jitter=0.2)
+        task = Task(status='running')
+        for _ in range(100):
+            assert 8 <= policy.next_interval(task) <= 12
+
+    def test_invalid_settings(self):
+        """
+        Inconsistent settings are rejected.
+        """
+        with pytest.raises(ValueError):
+            TaskPollingPolicy(min_interval=10, max_interval=1)
+        with pytest.raises(ValueError):
+            TaskPollingPolicy(jitter=1)
+
+
+class TestTaskWaiter():
+    """
+    Test Class for TaskWaiter
+    """
+
+    def test_finished_tasks(self):
+        """
+        Waiting ends on a terminal status or a missing task.
+        """
+        assert TaskWaiter('id').next_delay(Task(status='completed')) is None
+        assert TaskWaiter('id').next_delay(Task(status='failed')) is None
+        assert TaskWaiter('id').next_delay(None) is None
+        assert TaskWaiter('id').next_delay(Task(status='running')) > 0
+
+    def test_progress_callback(self):
+        """
+        The callback is invoked when the status or progress changes.
+        """
+        seen = []
+        waiter = TaskWaiter('id', on_progress=seen.append, polling_policy=fast_policy)
+        updates = [Task(status='queued'), Task(status='running', progress_percent=10),
+                   Task(status='running', progress_percent=10), Task(status='completed', progress_percent=100)]
+        for task in updates:
+            waiter.next_delay(task)
+        assert seen == [updates[0], updates[1], updates[3]]
+
+    def test_timeout(self):
+        """
+        The delay never passes the timeout, after which TaskTimeoutError is raised.
+        """
+        waiter = TaskWaiter('id', timeout=0.05, polling_policy=TaskPollingPolicy(initial_interval=10))
+        task = Task(status='running')
+        assert waiter.next_delay(task) <= 0.05
+        time.sleep(0.06)
+        with pytest.raises(TaskTimeoutError) as exc_info:
+            waiter.next_delay(task)
+        assert exc_info.value.task_id == 'id'
+        assert exc_info.value.task is task
+        assert exc_info.value.elapsed >= 0.05
+
+    def test_deadline(self):
+        """
+        A deadline in the past stops the wait at the first running poll.
+        """
+        waiter = TaskWaiter('id', deadline=time.time() - 1)
+        with pytest.raises(TaskTimeoutError):
+            waiter.next_delay(Task(status='running'))
+
+
+class TestWaitForTask():
+    """
+    Test Class for wait_for_task
+    """
+
+    @responses.activate
+    def test_wait_for_task(self):
+        """
+        wait_for_task() polls get_task until the task completes.
+        """
+        url = base_url + '/tasks/testString'
+        for status in ['queued', 'running', 'completed']:
+            responses.add(responses.GET,
+                          url,
+                          body=json.dumps({'task': {'id': 'testString', 'status': status,
+                                                    'created_at': '2019-01-01T12:00:00.000Z'}}),
+                          content_type='application/json',
+                          status=200)
+
+        task = service.wait_for_task('testString', polling_policy=fast_policy)
+
+        assert len(responses.calls) == 3
+        assert isinstance(task, Task)
+        assert task.status == 'completed'
+
+    @responses.activate
+    def test_wait_for_task_timeout(self):
+        """
+        wait_for_task() raises TaskTimeoutError for tasks that keep running.
+        """
+        responses.add(responses.GET,
+                      base_url + '/tasks/testString',
+                      body='{"task": {"id": "testString", "status": "running"}}',
+                      content_type='application/json',
+                      status=200)
+
+        with pytest.raises(TaskTimeoutError):
+            service.wait_for_task('testString', timeout=0.05, polling_policy=fast_policy)
+        assert len(responses.calls) >= 2
+
+    def test_wait_for_task_value_error(self):
+        """
+        test_wait_for_task_value_error()
+        """
+        with pytest.raises(ValueError):
+            service.wait_for_task(None)
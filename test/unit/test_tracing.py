@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2021.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request tracing
+"""
+
+import asyncio
+import pytest
+import requests
+import responses
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_databases.retries import RetryPolicy
+from ibm_cloud_databases.tracing import OpenTelemetryTracer, Span, Tracer
+from .helpers import new_service
+
+base_url = 'https://fake/v5/ibm'
+deployment_id = 'crn:v1:bluemix:public:databases-for-postgresql:us-south:a/274074dce64e9c423ffc238516c755e1:' \
+                '29caf0e7-120f-4da8-9551-3abf57ebcfc7::'
+
+
+class RecordedSpan(Span):
+    """
+    A span kept in memory.
+    """
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.failed = False
+        self.error = None
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_error(self, error):
+        self.failed = True
+        self.error = error
+
+    def end(self):
+        self.ended = True
+
+
+class RecordingTracer(Tracer):
+    """
+    A tracer keeping its spans in memory.
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes):
+        span = RecordedSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+    def inject(self, span, headers):
+        headers['traceparent'] = 'span-{0}'.format(len(self.spans))
+
+
+class TestClientTracing():
+    """
+    Test Class for the tracing of CloudDatabasesV5
+    """
+
+    @responses.activate
+    def test_spans(self):
+        """
+        Each request is traced in a span named by its operation, which carries its
+        attributes and whose context is sent in the request headers.
+        """
+        url = '{0}/deployments/{1}/users/database/admin/connections/public'.format(
+            base_url, requests.utils.quote(deployment_id, safe=''))
+        responses.add(responses.GET, url, json={'connection': {}}, status=200)
+        responses.add(responses.GET, base_url + '/tasks/5a9b1c2d', json={'task': {}}, status=200)
+        service = new_service(base_url)
+        tracer = RecordingTracer()
+        assert service.enable_tracing(tracer) is tracer
+
+        service.get_connection(deployment_id, 'database', 'admin', 'public')
+        service.get_task('5a9b1c2d')
+
+        connection, task = tracer.spans
+        assert connection.name == 'get_connection'
+        assert connection.attributes == {
+            'http.method': 'GET',
+            'http.url': url,
+            'http.route': '/deployments/{id}/users/{user_type}/{user_id}/connections/{endpoint_type}',
+            'cloud_databases.deployment_id': deployment_id,
+            'http.status_code': 200,
+            'http.retry_count': 0,
+        }
+        assert connection.ended and not connection.failed
+        assert 'cloud_databases.deployment_id' not in task.attributes
+        assert task.attributes['http.route'] == '/tasks/{id}'
+        assert responses.calls[0].request.headers['traceparent'] == 'span-1'
+        assert responses.calls[1].request.headers['traceparent'] == 'span-2'
+        assert responses.calls[1].request.headers['User-Agent'].startswith('cloud-databases-python-sdk/')
+
+    @responses.activate
+    def test_failures(self):
+        """
+        Error responses and requests without a response fail their span.
+        """
+        responses.add(responses.GET, base_url + '/regions', json={'errors': []}, status=503)
+        responses.add(responses.GET, base_url + '/deployables', body=requests.ConnectionError('refused'))
+        service = new_service(base_url)
+        tracer = service.enable_tracing(RecordingTracer())
+        with pytest.raises(ApiException):
+            service.list_regions()
+        with pytest.raises(requests.ConnectionError):
+            service.list_deployables()
+        regions, deployables = tracer.spans
+        assert regions.failed and regions.ended
+        assert regions.attributes['http.status_code'] == 503
+        assert isinstance(regions.error, ApiException)
+        assert deployables.failed and deployables.ended
+        assert 'http.status_code' not in deployables.attributes
+        assert isinstance(deployables.error, requests.ConnectionError)
+
+    @responses.activate
+    def test_retries(self):
+        """
+        The requests sent again by the retry policy carry their retry count, and
+        are counted as retries in the metrics.
+        """
+        url = base_url + '/regions'
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, json={'regions': []}, status=200)
+        service = new_service(base_url)
+        service.enable_retry_policy(RetryPolicy(sleep=lambda delay: None))
+        metrics = service.enable_metrics()
+        tracer = service.enable_tracing(RecordingTracer())
+        service.list_regions()
+        assert [span.attributes['http.retry_count'] for span in tracer.spans] == [0, 1, 2]
+        assert metrics.get('list_regions').retries == 2
+
+    @responses.activate
+    def test_disabled(self):
+        """
+        Nothing is traced once tracing is disabled.
+        """
+        responses.add(responses.GET, base_url + '/regions', json={'regions': []}, status=200)
+        service = new_service(base_url)
+        tracer = service.enable_tracing(RecordingTracer())
+        service.disable_tracing()
+        service.list_regions()
+        assert tracer.spans == []
+        assert 'traceparent' not in responses.calls[0].request.headers
+
+    def test_async(self):
+        """
+        The asyncio client traces its requests too.
+        """
+        httpx = pytest.importorskip('httpx')
+        from ibm_cloud_databases.cloud_databases_v5_async import AsyncCloudDatabasesV5
+        headers = []
+
+        def handler(request):
+            headers.append(request.headers.get('traceparent'))
+            return httpx.Response(200, json={'task': {}})
+
+        async def run():
+            async with AsyncCloudDatabasesV5(
+                    authenticator=NoAuthAuthenticator(),
+                    async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))) as service:
+                service.set_service_url(base_url)
+                tracer = service.enable_tracing(RecordingTracer())
+                await service.get_task('5a9b1c2d')
+                return tracer
+
+        tracer = asyncio.run(run())
+        assert tracer.spans[0].name == 'get_task'
+        assert tracer.spans[0].attributes['http.status_code'] == 200
+        assert headers == ['span-1']
+
+
+class TestOpenTelemetryTracer():
+    """
+    Test Class for OpenTelemetryTracer
+    """
+
+    @responses.activate
+    def test_spans(self):
+        """
+        Spans are children of the current span and propagated with traceparent.
+        """
+        pytest.importorskip('opentelemetry.sdk')
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from opentelemetry.trace import SpanKind, StatusCode
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        otel_tracer = provider.get_tracer('test')
+        responses.add(responses.GET, base_url + '/tasks/5a9b1c2d', json={'task': {}}, status=200)
+        responses.add(responses.GET, base_url + '/regions', status=500)
+        service = new_service(base_url)
+        service.enable_tracing(OpenTelemetryTracer(otel_tracer))
+
+        with otel_tracer.start_as_current_span('workflow') as parent:
+            service.get_task('5a9b1c2d')
+            with pytest.raises(ApiException):
+                service.list_regions()
+
+        task, regions, workflow = exporter.get_finished_spans()
+        assert task.name == 'get_task'
+        assert task.kind == SpanKind.CLIENT
+        assert task.parent.span_id == parent.get_span_context().span_id
+        assert task.attributes['http.route'] == '/tasks/{id}'
+        assert task.attributes['http.status_code'] == 200
+        assert task.status.status_code != StatusCode.ERROR
+        assert regions.status.status_code == StatusCode.ERROR
+        assert workflow.name == 'workflow'
+        traceparent = responses.calls[0].request.headers['traceparent']
+        assert traceparent.split('-')[1] == '{0:032x}'.format(task.context.trace_id)
+        assert traceparent.split('-')[2] == '{0:016x}'.format(task.context.span_id)